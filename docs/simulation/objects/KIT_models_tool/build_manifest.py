@@ -0,0 +1,105 @@
+import os
+import json
+import hashlib
+
+
+"""
+Build manifest of the asset pipeline.
+create_stl.py and the create_ycb_xml.py scripts record, for each object they
+generate, the hashes of its input files (meshes, textures, templates, the
+script itself and the code it runs, see code_files), the parameters used
+(resolution, ...) and the output files.
+On the next run, an object whose inputs, parameters and outputs did not change
+is skipped, so only new or stale objects are reprocessed.
+"""
+
+# Define folders & paths
+default_manifest_path = "build_manifest.json"
+
+def file_hash(path, chunk_size=1 << 20):
+    """Returns the sha256 hex digest of the content of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def code_files(*modules):
+    """Returns the source files of modules, every .py file of the packages,
+    to add them to the inputs of the steps that run them."""
+    paths = []
+    for module in modules:
+        if hasattr(module, "__path__"):
+            for folder in module.__path__:
+                for (root, _, names) in os.walk(folder):
+                    paths += [os.path.join(root, name) for name in names if name.endswith(".py")]
+        else:
+            paths.append(module.__file__)
+    return sorted(set(os.path.abspath(path) for path in paths))
+
+class BuildManifest:
+    """JSON file recording how each output object was built.
+
+    Entries are grouped by step (e.g. "stl", "xml") and keyed by object
+    (e.g. "191_OrangeMarmelade" or "o0191"). Hashes of input files are cached
+    by path, size and mtime, so unchanged files are not hashed again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=default_manifest_path):
+        self.path = path
+        self.data = {"version": self.VERSION, "files": {}, "steps": {}}
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.data = data
+
+    def hash(self, path):
+        """Returns the hash of an input file, from the cache if its size and mtime did not change."""
+        stat = os.stat(path)
+        cached = self.data["files"].get(path)
+        if cached is not None and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached["sha256"]
+
+        digest = file_hash(path)
+        self.data["files"][path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        return digest
+
+    def fingerprint(self, inputs, params):
+        """Returns what identifies a build: the hash of each input and the parameters."""
+        return {
+            "inputs": {path: self.hash(path) for path in sorted(inputs)},
+            "params": json.loads(json.dumps(params, sort_keys=True)),
+        }
+
+    def is_fresh(self, step, key, inputs, outputs, params=None):
+        """Checks that an object was already built from the same inputs and
+        parameters, and that its outputs still exist.
+
+        A missing input makes the object stale, so that the build reports the error.
+        """
+        entry = self.data["steps"].get(step, {}).get(key)
+        if entry is None or not all(os.path.exists(path) for path in outputs):
+            return False
+        if sorted(entry["outputs"]) != sorted(outputs):
+            return False
+        try:
+            return entry["fingerprint"] == self.fingerprint(inputs, params or {})
+        except OSError:
+            return False
+
+    def record(self, step, key, inputs, outputs, params=None):
+        """Records that an object was successfully built."""
+        self.data["steps"].setdefault(step, {})[key] = {
+            "fingerprint": self.fingerprint(inputs, params or {}),
+            "outputs": sorted(outputs),
+        }
+
+    def save(self):
+        """Writes the manifest atomically (temporary file then rename)."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
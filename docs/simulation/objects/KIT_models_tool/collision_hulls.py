@@ -0,0 +1,88 @@
+import os
+import sys
+
+# obj2stl and the msh writer are imported from their folders next to this script
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "obj2stl"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "init_tools_from_ycb"))
+import obj2stl.model.tools as mt
+from obj2stl.model.decompose import decompose
+from obj2stl.model.simplify import decimate
+from convert_obj_to_mujoco_msh import write_msh
+
+
+"""
+Collision hulls of the objects.
+Mujoco uses the convex hull of a mesh geom for contacts, so a concave object
+(bowl, cup, ...) collides like a closed box. Each mesh is decomposed offline
+into convex hulls, written as hull<i>.msh (used by the XML files) and
+hull<i>.stl, and the XML generators add one collision geom per hull next to
+the textured visual geom.
+The collision geometry is built from the mesh simplified to a face budget,
+the visual geom keeps the full mesh. Without decomposition, the simplified
+mesh itself is the collision geom.
+"""
+
+# Default decomposition parameters
+default_max_hulls = 16
+default_hull_resolution = 32
+default_collision_faces = 2000
+
+# geoms of the hulls, in the templates slots $COLLISION_MESHES and $COLLISION_GEOMS
+collision_mesh_text = '    <mesh name="{model_short}_{name}{index}" file="./{file}" scale="{ratio} {ratio} {ratio}"/>'
+collision_geom_text = ('        <geom name="{model_short}_{name}" pos="0 0 0" mesh="{mesh}" type="mesh"'
+                       ' solimp="0.998 0.998 0.001" solref="0.001 1" friction="0.95 0.3 0.1" group="0" condim="4"/>')
+
+def collision_model(model, max_faces=default_collision_faces):
+    """Returns the mesh (an obj2stl model) simplified to at most max_faces
+    triangles, or the mesh itself if it has no more faces or max_faces is 0.
+    """
+    if max_faces and model.face_count > max_faces:
+        return decimate(model, max_faces)
+    return model
+
+def create_collision_mesh(model, path):
+    """Writes the mesh (an obj2stl model) used as a single collision geom to
+    path, in the Mujoco msh format.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_msh(path, model.vertex_array, model.face_array)
+
+def create_collision_hulls(model, hull_folder, max_hulls=default_max_hulls, resolution=default_hull_resolution):
+    """Decomposes a mesh (an obj2stl model) into convex hulls written as
+    hull_folder/hull<i>.msh and hull_folder/hull<i>.stl, replacing the hulls
+    of a previous run.
+
+    Returns the names of the .msh files, in hull_folder.
+    """
+    hulls = decompose(model, resolution=resolution, max_hulls=max_hulls)
+
+    os.makedirs(hull_folder, exist_ok=True)
+    for name in os.listdir(hull_folder):
+        if name.startswith("hull") and name.endswith((".msh", ".stl")):
+            os.remove(os.path.join(hull_folder, name))
+
+    names = []
+    for (index, hull) in enumerate(hulls):
+        name = "hull{}".format(index)
+        write_msh(os.path.join(hull_folder, name + ".msh"), hull.vertex_array, hull.face_array)
+        stl_path = os.path.join(hull_folder, name + ".stl")
+        mt.export_model(hull, stl_path, binary=True).export_to_path(stl_path)
+        names.append(name + ".msh")
+    return names
+
+def collision_xml(hull_files, model_short, ratio_text, name="hull"):
+    """Returns the texts of the $COLLISION_MESHES and $COLLISION_GEOMS slots
+    of a template, for hull files (or a single collision mesh file, with
+    name="collision") given relatively to the XML file.
+
+    Without files, the visual mesh <model_short>_mesh is used for collisions.
+    """
+    if len(hull_files) == 0:
+        return "", collision_geom_text.format(model_short=model_short, name="collision", mesh=model_short + "_mesh")
+
+    meshes = [collision_mesh_text.format(model_short=model_short, name=name, index=index, file=file, ratio=ratio_text)
+              for (index, file) in enumerate(hull_files)]
+    geoms = [collision_geom_text.format(model_short=model_short, name="{}{}".format(name, index),
+                                        mesh="{}_{}{}".format(model_short, name, index))
+             for index in range(len(hull_files))]
+    return "\n".join(meshes), "\n".join(geoms)
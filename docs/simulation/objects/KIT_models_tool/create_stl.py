@@ -1,13 +1,24 @@
 import os
+import sys
+import time
+import shutil
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
+# obj2stl is not installed, it is imported from its folder next to this script
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "obj2stl"))
+import obj2stl.model
+import obj2stl.model.tools as mt
+from build_manifest import BuildManifest, default_manifest_path, code_files
 
-#The script is written by Python3. Ruby are needed to execute part of script.
+
+#The script is written by Python3.
 # Define folders & paths
 mesh_folder = "KIT_mesh"
 default_template_folder = os.path.join("templates", "ycb")
 default_resolution="Orig"
 default_target_folder="objects"
-resolution=default_resolution 
+resolution=default_resolution
 #you can change resolution here from[800,5k,25k,Orig]
 #   Notice that not all Orig resolution have _tex_.obj
 #    XXX_Orig.(obj|wrl|mdl) - this is the original resolution, usually between 200,000 and 400,000 faces
@@ -15,53 +26,101 @@ resolution=default_resolution
 #    XXX_5k.(obj|wrl) - this is a reduced version to approximately 5,000 faces
 #    XXX_800.(obj|wrl) - this is the lowest resolution at approximately 800 faces
 
+def object_paths(folder, resolution=default_resolution, mesh_folder=mesh_folder, target_folder=default_target_folder):
+    """Returns the paths of the OBJ, STL and PNG files of a KIT object, in
+    its meshes folder and in the target folder.
+    """
+    model_long = folder
+    model_short = folder[4:]
+    name = model_short + "_" + resolution + "_tex"
+
+    meshes_folder = os.path.join(mesh_folder, model_long, "meshes")
+    final_folder = os.path.join(target_folder, model_long)
+    return {
+        "obj": os.path.join(meshes_folder, name + ".obj"),
+        "stl": os.path.join(meshes_folder, name + ".stl"),
+        "png": os.path.join(meshes_folder, name + ".png"),
+        "final_stl": os.path.join(final_folder, name + ".stl"),
+        "final_png": os.path.join(final_folder, name + ".png"),
+    }
+
+def create_stl(folder, resolution=default_resolution, mesh_folder=mesh_folder, target_folder=default_target_folder):
+    """Converts the textured OBJ of a KIT object to a binary STL, and copies
+    the STL and its texture to the target folder.
+
+    Returns the time spent on the object, in seconds.
+    """
+    start = time.perf_counter()
+    paths = object_paths(folder, resolution, mesh_folder, target_folder)
+
+    # binary stl (only binary meshes can be used in Mujoco)
+    mt.convert(paths["obj"], paths["stl"], binary=True)
+
+    #copy stl and png file to the ./objects
+    os.makedirs(os.path.dirname(paths["final_stl"]), exist_ok=True)
+    shutil.copyfile(paths["stl"], paths["final_stl"])
+    shutil.copyfile(paths["png"], paths["final_png"])
+
+    return time.perf_counter() - start
+
 if __name__=="__main__":
+    parser = argparse.ArgumentParser(description="Creates binary STL files from KIT database's OBJ")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of objects converted in parallel (defaults to the number of CPUs)")
+    parser.add_argument("--resolution", type=str, default=resolution,
+                        help="Resolution of the meshes, from [800,5k,25k,Orig]")
+    parser.add_argument("--mesh-folder", type=str, default=mesh_folder,
+                        help="Location of KIT meshes (defaults to ./KIT_mesh)")
+    parser.add_argument("--target-folder", type=str, default=default_target_folder,
+                        help="Location of the created objects (defaults to ./objects)")
+    parser.add_argument("--manifest", type=str, default=default_manifest_path,
+                        help="Build manifest used to skip up to date objects (defaults to ./build_manifest.json)")
+    parser.add_argument("--force", action="store_true",
+                        help="Convert every object, even the up to date ones")
+    args = parser.parse_args()
+
     print("Creating STL files from KIT database's OBJ...")
-    folder_names = os.listdir(mesh_folder)
+    folder_names = sorted(folder for folder in os.listdir(args.mesh_folder)
+                          if os.path.isdir(os.path.join(args.mesh_folder, folder)))
+
+    start = time.perf_counter()
+    failures = {}
+    manifest = BuildManifest(args.manifest)
+    params = {"resolution": args.resolution, "binary": True}
+
+    # the conversion is rebuilt when its code changes
+    code_inputs = [os.path.abspath(__file__)] + code_files(obj2stl.model)
+
+    def build_files(folder):
+        paths = object_paths(folder, args.resolution, args.mesh_folder, args.target_folder)
+        outputs = [paths["stl"], paths["final_stl"], paths["final_png"]]
+        return [paths["obj"], paths["png"]] + code_inputs, outputs
 
+    stale_folders = []
     for folder in folder_names:
-        try:
-            print("Creating STL files for {} ...".format(folder))
-
-            model_long = folder            
-            model_short = folder[4:]            
-            
-            stl_text = "KIT_mesh/"+model_long + "/" + "meshes" + "/"+model_short+"_"+resolution+"_tex.stl"
-            png_text = "KIT_mesh/"+model_long + "/" + "meshes" + "/"+model_short+"_"+resolution+"_tex.png"
-            mesh_text = "KIT_mesh/"+model_long + "/" + "meshes" + "/mesh.obj"
-            ruby_text = "convertSTL.rb"
-            stl_final_location=default_target_folder+"/"+model_long + "/"+model_short+"_"+resolution+"_tex.stl"
-            png_final_location=default_target_folder+"/"+model_long + "/"+model_short+"_"+resolution+"_tex.png"
-            ruby_final_location=default_target_folder+"/"+model_long + "/"+"convertSTL.rb"
-            mujoco_mesh_text = "./"+mesh_folder+"/"+model_long + "/" + "meshes" + "/"+model_short+"_"+resolution+"_tex.obj"
-            
-            print("obj mesh location:"+mujoco_mesh_text)
-            commandMv1="mv ./"+mujoco_mesh_text+" "+mesh_text
-            os.system(commandMv1)
-            
-            #use external python3 script to create ASCII stl
-            command = 'python3 ./obj2stl/convert.py -i ./' + mesh_text+' -o ./'+stl_text+" -t obj"
-            #use ruby script to convert ASCII stl to Binary.
-            commandBinary ='cd '+ 'ruby ./convertSTL.rb ./'+stl_text
-            commandMv2="mv ./"+mesh_text+" "+mujoco_mesh_text
-            commandCp1 = 'cp ./'+stl_text+' ./'+stl_final_location
-            commandCp2 = 'cp ./'+png_text+' ./'+png_final_location
-            commandCp3 = 'cp ./'+ruby_text+" ./"+ruby_final_location
-            commandBinary = 'cd ./objects/'+model_long+'\n ruby ./convertSTL.rb '+model_short+"_"+resolution+"_tex.stl"
-            commandRM = 'cd ./objects/'+model_long+'\n rm -f convertSTL.rb'
-            os.system(command)
-                        
-            #os.system(commandBinary)
-            os.system(commandMv2)
-            
-            #move stl and png file to the ./objects
-            os.system(commandCp1)
-            os.system(commandCp2)
-
-            #convert ASCII stl files to BINARY (only binary meshes can be used in Mujoco) 
-            os.system(commandCp3)
-            os.system(commandBinary)
-            os.system(commandRM)
-        except:
-            print("Creating Failed for {}.",format(folder))
-    print ("Finished creating .STL")
\ No newline at end of file
+        if not args.force and manifest.is_fresh("stl", folder, *build_files(folder), params):
+            print("Skipping {}, STL files are up to date".format(folder))
+        else:
+            stale_folders.append(folder)
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {executor.submit(create_stl, folder, args.resolution, args.mesh_folder, args.target_folder): folder
+                       for folder in stale_folders}
+
+            for future in as_completed(futures):
+                folder = futures[future]
+                try:
+                    print("Created STL files for {} in {:.2f}s".format(folder, future.result()))
+                    manifest.record("stl", folder, *build_files(folder), params)
+                except Exception as e:
+                    failures[folder] = e
+                    print("Creating Failed for {}: {}: {}".format(folder, type(e).__name__, e))
+    finally:
+        manifest.save()
+
+    print("Finished creating .STL: {} converted, {} up to date, {} failed in {:.2f}s".format(
+        len(stale_folders) - len(failures), len(folder_names) - len(stale_folders), len(failures),
+        time.perf_counter() - start))
+    for folder in sorted(failures):
+        print("    {}: {}".format(folder, failures[folder]))
@@ -27,3 +27,13 @@ from .xml_objects import (
 from .primitive import *
 from .composite import *
 from .composite_body import *
+from .object_registry import ObjectRegistry, registry
+
+
+def __getattr__(name):
+    # the oXXXX and oXXXXv classes of the catalog are created on demand by the registry
+    cls = registry.class_by_name(name)
+    if cls is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return cls
+
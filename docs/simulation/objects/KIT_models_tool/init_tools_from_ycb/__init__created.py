@@ -1,163 +0,0 @@
-from .objects import MujocoObject, MujocoXMLObject, MujocoGeneratedObject
-from .generated_objects import CompositeBodyObject, CompositeObject, PrimitiveObject
-
-from .xml_objects import(
-    BottleObject,
-    CanObject,
-    MasterChefCanObject,
-    LemonObject,
-    MilkObject,
-    BreadObject,
-    CerealObject,
-    SquareNutObject,
-    RoundNutObject,
-    MilkVisualObject,
-    BreadVisualObject,
-    CerealVisualObject,
-    CanVisualObject,
-    MasterChefCanVisualObject,
-    PlateWithHoleObject,
-    DoorObject,
-#--------------------------------
-    o0001,
-    o0001v,
-    o0002,
-    o0002v,
-    o0003,
-    o0003v,
-    o0004,
-    o0004v,
-    o0005,
-    o0005v,
-    o0006,
-    o0006v,
-    o0007,
-    o0007v,
-    o0008,
-    o0008v,
-    o0009,
-    o0009v,
-    o0010,
-    o0010v,
-    o0011,
-    o0011v,
-    o0012,
-    o0012v,
-    o0013,
-    o0013v,
-    o0014,
-    o0014v,
-    o0015,
-    o0015v,
-    o0016,
-    o0016v,
-    o0017,
-    o0017v,
-    o0018,
-    o0018v,
-    o0019,
-    o0019v,
-    o0020,
-    o0020v,
-    o0021,
-    o0021v,
-    o0022,
-    o0022v,
-    o0023,
-    o0023v,
-    o0024,
-    o0024v,
-    o0025,
-    o0025v,
-    o0026,
-    o0026v,
-    o0027,
-    o0027v,
-    o0028,
-    o0028v,
-    o0029,
-    o0029v,
-    o0030,
-    o0030v,
-    o0031,
-    o0031v,
-    o0032,
-    o0032v,
-    o0033,
-    o0033v,
-    o0034,
-    o0034v,
-    o0035,
-    o0035v,
-    o0036,
-    o0036v,
-    o0037,
-    o0037v,
-    o0038,
-    o0038v,
-    o0039,
-    o0039v,
-    o0040,
-    o0040v,
-    o0041,
-    o0041v,
-    o0042,
-    o0042v,
-    o0043,
-    o0043v,
-    o0044,
-    o0044v,
-    o0045,
-    o0045v,
-    o0046,
-    o0046v,
-    o0047,
-    o0047v,
-    o0048,
-    o0048v,
-    o0049,
-    o0049v,
-    o0050,
-    o0050v,
-    o0051,
-    o0051v,
-    o0052,
-    o0052v,
-    o0053,
-    o0053v,
-    o0054,
-    o0054v,
-    o0055,
-    o0055v,
-    o0056,
-    o0056v,
-    o0057,
-    o0057v,
-    o0058,
-    o0058v,
-    o0059,
-    o0059v,
-    o0060,
-    o0060v,
-    o0061,
-    o0061v,
-    o0062,
-    o0062v,
-    o0063,
-    o0063v,
-    o0064,
-    o0064v,
-    o0065,
-    o0065v,
-    o0066,
-    o0066v,
-    o0067,
-    o0067v,
-    o0068,
-    o0068v,
-    o0069,
-    o0069v,
-)
-from .primitive import *
-from .composite import *
-from .composite_body import *
@@ -0,0 +1,203 @@
+import copy
+import numpy as np
+
+from robosuite.utils.errors import RandomizationError
+from robosuite.utils.placement_samplers import ObjectPositionSampler
+
+"""
+Placement sampler for bins with many objects (installed in robosuite/utils).
+UniformRandomSampler places the objects one at a time, rejecting the positions
+that collide with the objects already placed, which gets quadratic and fails
+as the bin fills. GridPlacementSampler places the objects layer by layer,
+from the largest to the smallest (radius of the horizontal_radius_site of
+their XML): the range is divided into cells as wide as the largest object of
+the layer, each object of the layer gets its own random cell and is jittered
+inside it without leaving it, so objects can never overlap and nothing is
+rejected. The objects that do not fit in the first layer are stacked in
+layers above it, to be dropped and settled by the physics.
+"""
+
+
+class GridPlacementSampler(ObjectPositionSampler):
+    """
+    Places all the objects at once in distinct cells of grids covering the x and y ranges, one per layer.
+
+    Args:
+        name (str): Name of this sampler.
+
+        mujoco_objects (None or MujocoObject or list of MujocoObject): single model or list of MJCF object models
+
+        x_range (2-array of float): Specify the (min, max) relative x_range used to place objects
+
+        y_range (2-array of float): Specify the (min, max) relative y_range used to place objects
+
+        rotation (None or float or Iterable):
+            :`None`: Add uniform random random rotation
+            :`Iterable (a,b)`: Uniformly randomize rotation angle between a and b (in radians)
+            :`value`: Add fixed angle rotation
+
+        rotation_axis (str): Can be 'x', 'y', or 'z'. Axis about which to apply the requested rotation
+
+        reference_pos (3-array): global (x,y,z) position relative to which sampling will occur
+
+        z_offset (float): Add a small z-offset to placements. This is useful for fixed objects
+            that do not move (i.e. no free joint) to place them above the table.
+
+        layer_height (None or float): height between two layers of stacked objects. Defaults to the
+            height of the tallest object of the layer below.
+
+        margin (float): free space kept around each object
+    """
+
+    def __init__(
+        self,
+        name,
+        mujoco_objects=None,
+        x_range=(0, 0),
+        y_range=(0, 0),
+        rotation=None,
+        rotation_axis="z",
+        reference_pos=(0, 0, 0),
+        z_offset=0.0,
+        layer_height=None,
+        margin=0.005,
+    ):
+        self.x_range = x_range
+        self.y_range = y_range
+        self.rotation = rotation
+        self.rotation_axis = rotation_axis
+        self.layer_height = layer_height
+        self.margin = margin
+        self.num_layers = 0
+
+        super().__init__(
+            name=name,
+            mujoco_objects=mujoco_objects,
+            ensure_object_boundary_in_range=True,
+            ensure_valid_placement=True,
+            reference_pos=reference_pos,
+            z_offset=z_offset,
+        )
+
+    def _sample_angles(self, n):
+        """
+        Returns n rotation angles, following @self.rotation.
+        """
+        if self.rotation is None:
+            return np.random.uniform(high=2 * np.pi, size=n)
+        elif isinstance(self.rotation, (list, tuple, np.ndarray)):
+            return np.random.uniform(high=max(self.rotation), low=min(self.rotation), size=n)
+        return np.full(n, self.rotation, dtype=float)
+
+    def _angles_to_quats(self, angles):
+        """
+        Returns the (n, 4) quaternions (w, x, y, z) of rotations about @self.rotation_axis.
+        """
+        quats = np.zeros((len(angles), 4))
+        quats[:, 0] = np.cos(angles / 2)
+        if self.rotation_axis == "x":
+            quats[:, 1] = np.sin(angles / 2)
+        elif self.rotation_axis == "y":
+            quats[:, 2] = np.sin(angles / 2)
+        elif self.rotation_axis == "z":
+            quats[:, 3] = np.sin(angles / 2)
+        else:
+            # Invalid axis specified, raise error
+            raise ValueError(
+                "Invalid rotation axis specified. Must be 'x', 'y', or 'z'. Got: {}".format(self.rotation_axis)
+            )
+        return quats
+
+    def sample(self, fixtures=None, reference=None, on_top=True):
+        """
+        Places all the objects in one pass.
+
+        Args:
+            fixtures (dict): dictionary of current object placements in the scene as well as any other relevant
+                obstacles that should not be in contact with newly sampled objects. Used to make sure newly
+                generated placements are valid. Should be object names mapped to (pos, quat, MujocoObject)
+
+            reference (str or 3-tuple or None): if provided, sample relative placement. Can either be a string, which
+                corresponds to an existing object found in @fixtures, or a direct (x,y,z) value. If None, will sample
+                relative to this sampler's `'reference_pos'` value.
+
+            on_top (bool): if True, sample placement on top of the reference object. This corresponds to a sampled
+                z-offset of the current sampled object's bottom_offset + the reference object's top_offset
+                (if specified)
+
+        Return:
+            dict: dictionary of all object placements, mapping object_names to (pos, quat, obj), including the
+                placements specified in @fixtures. Note quat is in (w,x,y,z) form
+
+        Raises:
+            RandomizationError: [An object is wider than the sampling range]
+        """
+        # Standardize inputs
+        placed_objects = {} if fixtures is None else copy.copy(fixtures)
+        if reference is None:
+            base_offset = self.reference_pos
+        elif type(reference) is str:
+            assert (
+                reference in placed_objects
+            ), "Invalid reference received. Current options are: {}, requested: {}".format(
+                placed_objects.keys(), reference
+            )
+            ref_pos, _, ref_obj = placed_objects[reference]
+            base_offset = np.array(ref_pos)
+            if on_top:
+                base_offset += np.array((0, 0, ref_obj.top_offset[-1]))
+        else:
+            base_offset = np.array(reference)
+            assert (
+                base_offset.shape[0] == 3
+            ), "Invalid reference received. Should be (x,y,z) 3-tuple, but got: {}".format(base_offset)
+
+        n = len(self.mujoco_objects)
+        if n == 0:
+            return placed_objects
+
+        radii = np.array([obj.horizontal_radius for obj in self.mujoco_objects]) + self.margin
+        bottoms = np.array([obj.bottom_offset[-1] for obj in self.mujoco_objects])
+        heights = np.array([obj.top_offset[-1] - obj.bottom_offset[-1] for obj in self.mujoco_objects])
+
+        width = self.x_range[1] - self.x_range[0]
+        depth = self.y_range[1] - self.y_range[0]
+        xy = np.zeros((n, 2))
+        z = np.zeros(n)
+        layer_z = self.z_offset
+        self.num_layers = 0
+
+        # fill the layers from the largest object to the smallest
+        order = np.argsort(-radii, kind="stable")
+        start = 0
+        while start < n:
+            # cells as wide as the largest object of the layer, stretched to cover the range
+            cols = int(width // (2 * radii[order[start]]))
+            rows = int(depth // (2 * radii[order[start]]))
+            if cols == 0 or rows == 0:
+                raise RandomizationError("Cannot place {} in the sampling range ({})".format(
+                    self.mujoco_objects[order[start]].name, self.name))
+            cell_size = np.array([width / cols, depth / rows])
+            members = order[start:start + cols * rows]
+
+            # every object of the layer gets a distinct random cell, and is jittered inside it
+            cells = np.random.permutation(cols * rows)[:len(members)]
+            cell_centers = np.stack([self.x_range[0] + (cells % cols + 0.5) * cell_size[0],
+                                     self.y_range[0] + (cells // cols + 0.5) * cell_size[1]], axis=1)
+            slack = np.maximum(cell_size[None, :] / 2 - radii[members, None], 0)
+            xy[members] = cell_centers + np.random.uniform(-1, 1, size=(len(members), 2)) * slack
+            z[members] = layer_z
+
+            layer_z += self.layer_height if self.layer_height is not None else heights[members].max()
+            self.num_layers += 1
+            start += len(members)
+
+        if on_top:
+            z = z - bottoms
+
+        positions = np.asarray(base_offset) + np.column_stack([xy, z])
+        quats = self._angles_to_quats(self._sample_angles(n))
+        for obj, pos, quat in zip(self.mujoco_objects, positions, quats):
+            placed_objects[obj.name] = (tuple(pos), quat, obj)
+
+        return placed_objects
@@ -1,36 +1,88 @@
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+import copy
 import random
 import numpy as np
+from mujoco_py import MjSim, load_model_from_mjb
 
 import robosuite.utils.transform_utils as T
 from robosuite.environments.manipulation.single_arm_env import SingleArmEnv
 
 from robosuite.models.arenas import BinsArena
 
-# Import all objects and visual object directly and place in objs and visualObjs
-from robosuite.models.objects import * 
-mods = dir()
-visualObjs  = [ item for item in mods if 'VisualObject' in item ]
-objs        = [ item.replace('Visual','') for item in visualObjs ]
-# (
-#     MilkObject,
-#     BreadObject,
-#     CerealObject,
-#     CanObject,
-#     MasterChefCanObject,
-# )
-# from robosuite.models.objects import (
-#     MilkVisualObject,
-#     BreadVisualObject,
-#     CerealVisualObject,
-#     CanVisualObject,
-#     MasterChefCanVisualObject,
-# )
+from robosuite.models.objects import (
+    MilkObject,
+    BreadObject,
+    CerealObject,
+    CanObject,
+    MilkVisualObject,
+    BreadVisualObject,
+    CerealVisualObject,
+    CanVisualObject,
+)
+# oXXXX objects are created by id from the registry, see object_registry.py
+from robosuite.models.objects import registry as object_registry
 from robosuite.models.tasks import ManipulationTask
 from robosuite.utils.placement_samplers import SequentialCompositeSampler, UniformRandomSampler
+from robosuite.utils.batch_placement_sampler import GridPlacementSampler
 from robosuite.utils.observables import Observable, sensor
 
 
+CompiledModel = namedtuple("CompiledModel", ["model", "objects", "visual_objects", "robot_parts", "bin_size", "mjb"])
+"""Task model, objects and robot models of an environment, with the binary Mujoco model compiled from them"""
+
+
+class ModelCache:
+    """
+    Least recently used cache of compiled models, shared by the BinPicking environments of a process.
+
+    A hard reset of an environment whose composition (objects, arena parameters and robots) is in the
+    cache reuses its compiled model instead of rebuilding the XML of every object and recompiling it.
+    Nothing is shared between the environments using an entry: each hit loads its own Mujoco model
+    from the binary model of the entry and gets its own copy of the task, object and robot models,
+    so visualization and domain randomization only change the environment doing them.
+
+    Args:
+        max_size (int): maximum number of compiled models kept
+    """
+
+    def __init__(self, max_size=8):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Returns the CompiledModel of a composition, or None if it is not cached.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """
+        Adds the CompiledModel of a composition, evicting the least recently used ones above max_size.
+        """
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# cache used by default by the environments
+model_cache = ModelCache()
+
+
 class BinPicking(SingleArmEnv):
     """
     This class corresponds to the pick place task for a single robot arm.
@@ -102,7 +154,33 @@ class BinPicking(SingleArmEnv):
 
         object_type (string): if provided, should be one of "milk", "bread", "cereal",
             or "can". Determines which type of object will be spawned on every
-            environment reset. Only used if @single_object_mode is 2.
+            environment reset. Only used if @single_object_mode is 2. With @object_ids,
+            should be one of the ids.
+
+        object_ids (None or list of str): ids of the objects of the catalog to use (e.g. ["o0013", "o0042"]).
+            Their classes are created by the object registry from objects/objects_manifest.json. If None and
+            @num_objects is None, the milk, bread, cereal and can objects are used.
+
+        num_objects (None or int): if provided instead of @object_ids, number of objects sampled from the
+            catalog with @object_sampler when the environment is created.
+
+        object_sampler (None or function): called as object_sampler(catalog_ids, num_objects) to choose
+            the ids of the objects among the ones of the catalog. Defaults to random.sample.
+
+        object_placement (str): how the objects are placed in the start bin on reset:
+
+            :`'uniform'`: one at a time, with rejection of overlapping positions (UniformRandomSampler)
+
+            :`'grid'`: all at once, in distinct cells of a grid sized after the largest object
+               (GridPlacementSampler), the objects that do not fit being stacked in layers above. Suited
+               to bins with many objects.
+
+        settle_steps (int): maximum number of physics steps run after placing the objects so that they
+            drop and settle, stopping as soon as they stop moving (after at least 0.1 s of simulated time).
+            The robot is held still meanwhile. Useful with stacked 'grid' placements.
+
+        The goal bin is divided into a grid of ceil(sqrt(n)) columns with one cell per object, each object
+        having to be placed in its own cell (the four quadrants of the bin for four objects).
 
         has_renderer (bool): If true, render the simulation state in
             a viewer instead of headless mode.
@@ -131,6 +209,9 @@ class BinPicking(SingleArmEnv):
         hard_reset (bool): If True, re-loads model, sim, and render object upon a reset call, else,
             only calls sim.reset and resets all robosuite-internal variables
 
+        use_model_cache (bool): If True, hard resets reuse the compiled model of the same composition
+            from the model cache (see ModelCache) instead of rebuilding and recompiling it
+
         camera_names (str or list of str): name of camera to be rendered. Should either be single str if
             same name is to be used for all cameras' rendering or else it should be a list of cameras to render.
 
@@ -174,6 +255,11 @@ class BinPicking(SingleArmEnv):
         reward_shaping=False,
         single_object_mode=0,
         object_type=None,
+        object_ids=None,
+        num_objects=None,
+        object_sampler=None,
+        object_placement="uniform",
+        settle_steps=0,
         has_renderer=False,
         has_offscreen_renderer=True,
         render_camera="frontview",
@@ -184,6 +270,7 @@ class BinPicking(SingleArmEnv):
         horizon=1000,
         ignore_done=False,
         hard_reset=True,
+        use_model_cache=True,
         camera_names="agentview",
         camera_heights=256,
         camera_widths=256,
@@ -191,9 +278,22 @@ class BinPicking(SingleArmEnv):
     ):
         # task settings
         self.single_object_mode = single_object_mode
-        self.object_to_id = {"milk": 0, "bread": 1, "cereal": 2, "can": 3}
+        if object_ids is None and num_objects is not None:
+            object_sampler = object_sampler or random.sample
+            assert 0 < num_objects <= len(object_registry), "invalid @num_objects argument - choose at most {}".format(
+                len(object_registry))
+            object_ids = object_sampler(object_registry.ids(), num_objects)
+        self.object_ids = None if object_ids is None else list(object_ids)
+        if self.object_ids is None:
+            self.obj_names = ["Milk", "Bread", "Cereal", "Can"]
+        else:
+            assert len(self.object_ids) > 0, "@object_ids should not be empty"
+            assert len(set(self.object_ids)) == len(self.object_ids), "duplicate object in @object_ids"
+            for id in self.object_ids:
+                assert id in object_registry, "unknown object {} in @object_ids".format(id)
+            self.obj_names = list(self.object_ids)
+        self.object_to_id = {name.lower(): i for (i, name) in enumerate(self.obj_names)}
         self.object_id_to_sensors = {}                    # Maps object id to sensor names for that object
-        self.obj_names = ["Milk", "Bread", "Cereal", "Can"] #[item.upper() for item in self.object_to_id.keys()]
         if object_type is not None:
             assert (
                     object_type in self.object_to_id.keys()
@@ -220,6 +320,16 @@ class BinPicking(SingleArmEnv):
         # whether to use ground-truth object states
         self.use_object_obs = use_object_obs
 
+        # placement of the objects on reset
+        assert object_placement in {"uniform", "grid"}, "invalid @object_placement argument - choose uniform or grid"
+        self.object_placement = object_placement
+        self.settle_steps = settle_steps
+
+        # compiled models reused by hard resets, and the key of the model being built if it is not cached
+        self.model_cache = model_cache if use_model_cache else None
+        self._cached_model = None
+        self._model_cache_key = None
+
         super().__init__(
             robots=robots,
             env_configuration=env_configuration,
@@ -262,8 +372,8 @@ class BinPicking(SingleArmEnv):
         Note that a successfully completed task (object in bin) will return 1.0 per object irregardless of whether the
         environment is using sparse or shaped rewards
 
-        Note that the final reward is normalized and scaled by reward_scale / 4.0 (or 1.0 if only a single object is
-        being used) as well so that the max score is equal to reward_scale
+        Note that the final reward is normalized and scaled by reward_scale / number of objects (or 1.0 if only a
+        single object is being used) as well so that the max score is equal to reward_scale
 
         Args:
             action (np.array): [NOT USED]
@@ -282,7 +392,7 @@ class BinPicking(SingleArmEnv):
         if self.reward_scale is not None:
             reward *= self.reward_scale
             if self.single_object_mode == 0:
-                reward /= 4.0
+                reward /= len(self.objects)
         return reward
 
     def staged_rewards(self):
@@ -305,96 +415,76 @@ class BinPicking(SingleArmEnv):
         hover_mult = 0.7
 
         # filter out objects that are already in the correct bins
-        active_objs = []
-        for i, obj in enumerate(self.objects):
-            if self.objects_in_bins[i]:
-                continue
-            active_objs.append(obj)
+        active_ids = np.flatnonzero(self.objects_in_bins == 0)
+        object_locs = self.sim.data.body_xpos[self.obj_body_ids[active_ids]]
 
         # reaching reward governed by distance to closest object
         r_reach = 0.
-        if active_objs:
+        if len(active_ids):
             # get reaching reward via minimum distance to a target object
-            dists = [
-                self._gripper_to_target(
-                    gripper=self.robots[0].gripper,
-                    target=active_obj.root_body,
-                    target_type="body",
-                    return_distance=True,
-                ) for active_obj in active_objs
-            ]
-            r_reach = (1 - np.tanh(10.0 * min(dists))) * reach_mult
+            gripper_site_pos = self.sim.data.site_xpos[self.robots[0].eef_site_id]
+            dists = np.linalg.norm(object_locs - gripper_site_pos, axis=1)
+            r_reach = (1 - np.tanh(10.0 * dists.min())) * reach_mult
 
         # grasping reward for touching any objects of interest
         r_grasp = int(self._check_grasp(
             gripper=self.robots[0].gripper,
-            object_geoms=[g for active_obj in active_objs for g in active_obj.contact_geoms])
+            object_geoms=[g for i in active_ids for g in self.objects[i].contact_geoms])
         ) * grasp_mult
 
         # lifting reward for picking up an object
         r_lift = 0.
-        if active_objs and r_grasp > 0.:
+        if len(active_ids) and r_grasp > 0.:
             z_target = self.bin2_pos[2] + 0.25
-            object_z_locs = self.sim.data.body_xpos[[self.obj_body_id[active_obj.name]
-                                                     for active_obj in active_objs]][:, 2]
-            z_dists = np.maximum(z_target - object_z_locs, 0.)
-            r_lift = grasp_mult + (1 - np.tanh(15.0 * min(z_dists))) * (
+            z_dists = np.maximum(z_target - object_locs[:, 2], 0.)
+            r_lift = grasp_mult + (1 - np.tanh(15.0 * z_dists.min())) * (
                     lift_mult - grasp_mult
             )
 
         # hover reward for getting object above bin
         r_hover = 0.
-        if active_objs:
-            target_bin_ids = [self.object_to_id[active_obj.name.lower()] for active_obj in active_objs]
+        if len(active_ids):
             # segment objects into left of the bins and above the bins
-            object_xy_locs = self.sim.data.body_xpos[[self.obj_body_id[active_obj.name]
-                                                     for active_obj in active_objs]][:, :2]
-            y_check = (
-                    np.abs(object_xy_locs[:, 1] - self.target_bin_placements[target_bin_ids, 1])
-                    < self.bin_size[1] / 4.
-            )
-            x_check = (
-                    np.abs(object_xy_locs[:, 0] - self.target_bin_placements[target_bin_ids, 0])
-                    < self.bin_size[0] / 4.
-            )
-            objects_above_bins = np.logical_and(x_check, y_check)
-            objects_not_above_bins = np.logical_not(objects_above_bins)
-            dists = np.linalg.norm(
-                self.target_bin_placements[target_bin_ids, :2] - object_xy_locs, axis=1
+            object_xy_locs = object_locs[:, :2]
+            target_xy_locs = self.target_bin_placements[active_ids, :2]
+            objects_above_bins = np.all(
+                np.abs(object_xy_locs - target_xy_locs) < self.target_bin_size / 2., axis=1
             )
+            dists = np.linalg.norm(target_xy_locs - object_xy_locs, axis=1)
             # objects to the left get r_lift added to hover reward,
             # those on the right get max(r_lift) added (to encourage dropping)
-            r_hover_all = np.zeros(len(active_objs))
-            r_hover_all[objects_above_bins] = lift_mult + (
-                    1 - np.tanh(10.0 * dists[objects_above_bins])
-            ) * (hover_mult - lift_mult)
-            r_hover_all[objects_not_above_bins] = r_lift + (
-                    1 - np.tanh(10.0 * dists[objects_not_above_bins])
+            r_hover_all = np.where(objects_above_bins, lift_mult, r_lift) + (
+                    1 - np.tanh(10.0 * dists)
             ) * (hover_mult - lift_mult)
             r_hover = np.max(r_hover_all)
 
         return r_reach, r_grasp, r_lift, r_hover
 
     def not_in_bin(self, obj_pos, bin_id):
+        """
+        Returns True if an object is not in a target bin.
 
-        bin_x_low = self.bin2_pos[0]
-        bin_y_low = self.bin2_pos[1]
-        if bin_id == 0 or bin_id == 2:
-            bin_x_low -= self.bin_size[0] / 2
-        if bin_id < 2:
-            bin_y_low -= self.bin_size[1] / 2
-
-        bin_x_high = bin_x_low + self.bin_size[0] / 2
-        bin_y_high = bin_y_low + self.bin_size[1] / 2
-
-        res = True
-        if (
-            bin_x_low < obj_pos[0] < bin_x_high
-            and bin_y_low < obj_pos[1] < bin_y_high
-            and self.bin2_pos[2] < obj_pos[2] < self.bin2_pos[2] + 0.1
-        ):
-            res = False
-        return res
+        Args:
+            obj_pos (np.array): position of the object
+            bin_id (int): index of the target bin, the one of the object
+        """
+        return not self.in_target_bins(np.asarray(obj_pos)[None], [bin_id])[0]
+
+    def in_target_bins(self, obj_pos, bin_ids):
+        """
+        Checks which objects are in their target bins, all at once.
+
+        Args:
+            obj_pos (np.array): (n, 3) positions of the objects
+            bin_ids (np.array): (n,) indices of the target bins of the objects
+
+        Returns:
+            np.array: (n,) boolean mask, True for the objects inside their target bin
+        """
+        xy = obj_pos[:, :2]
+        z = obj_pos[:, 2]
+        inside_xy = np.all((self.target_bin_lows[bin_ids] < xy) & (xy < self.target_bin_highs[bin_ids]), axis=1)
+        return inside_xy & (self.bin2_pos[2] < z) & (z < self.bin2_pos[2] + 0.1)
 
     def _get_placement_initializer(self):
         """
@@ -407,8 +497,19 @@ class BinPicking(SingleArmEnv):
         bin_y_half = self.model.mujoco_arena.table_full_size[1] / 2 - 0.05
 
         # each object should just be sampled in the bounds of the bin (with some tolerance)
-        self.placement_initializer.append_sampler(
-            sampler=UniformRandomSampler(
+        if self.object_placement == "grid":
+            sampler = GridPlacementSampler(
+                name="CollisionObjectSampler",
+                mujoco_objects=self.objects,
+                x_range=[-bin_x_half, bin_x_half],
+                y_range=[-bin_y_half, bin_y_half],
+                rotation=None,
+                rotation_axis='z',
+                reference_pos=self.bin1_pos,
+                z_offset=0.,
+            )
+        else:
+            sampler = UniformRandomSampler(
                 name="CollisionObjectSampler",
                 mujoco_objects=self.objects,
                 x_range=[-bin_x_half, bin_x_half],
@@ -420,25 +521,10 @@ class BinPicking(SingleArmEnv):
                 reference_pos=self.bin1_pos,
                 z_offset=0.,
             )
-        )
+        self.placement_initializer.append_sampler(sampler=sampler)
 
         # each visual object should just be at the center of each target bin
-        index = 0
-        for vis_obj in self.visual_objects:
-
-            # get center of target bin
-            bin_x_low = self.bin2_pos[0]
-            bin_y_low = self.bin2_pos[1]
-            if index == 0 or index == 2:
-                bin_x_low -= self.bin_size[0] / 2
-            if index < 2:
-                bin_y_low -= self.bin_size[1] / 2
-            bin_x_high = bin_x_low + self.bin_size[0] / 2
-            bin_y_high = bin_y_low + self.bin_size[1] / 2
-            bin_center = np.array([
-                (bin_x_low + bin_x_high) / 2., 
-                (bin_y_low + bin_y_high) / 2., 
-            ])
+        for vis_obj, bin_center in zip(self.visual_objects, self.target_bin_placements[:, :2]):
 
             # placement is relative to object bin, so compute difference and send to placement initializer
             rel_center = bin_center - self.bin1_pos[:2]
@@ -457,12 +543,42 @@ class BinPicking(SingleArmEnv):
                     z_offset=self.bin2_pos[2] - self.bin1_pos[2],
                 )
             )
-            index += 1
+
+    def _setup_target_bins(self):
+        """
+        Divides the goal bin into a grid with one cell per object, the target bin of object i being cell i
+        (row-major, columns along x). Four objects get the four quadrants of the bin.
+        """
+        num_objects = len(self.obj_names)
+        cols = int(np.ceil(np.sqrt(num_objects)))
+        rows = int(np.ceil(num_objects / cols))
+        bin_ids = np.arange(num_objects)
+        bin_size = np.array(self.bin_size[:2], dtype=float)
+        self.target_bin_size = bin_size / [cols, rows]
+
+        self.target_bin_lows = np.array(self.bin2_pos[:2], dtype=float) - bin_size / 2. \
+            + np.stack([bin_ids % cols, bin_ids // cols], axis=1) * self.target_bin_size
+        self.target_bin_highs = self.target_bin_lows + self.target_bin_size
+
+        # target locations in bin for each object type
+        self.target_bin_placements = np.zeros((num_objects, 3))
+        self.target_bin_placements[:, :2] = self.target_bin_lows + self.target_bin_size / 2.
+        self.target_bin_placements[:, 2] = self.bin2_pos[2]
 
     def _load_model(self):
         """
         Loads an xml model, puts it in self.model
         """
+        if self.model_cache is not None:
+            key = self._get_model_cache_key()
+            self._cached_model = self.model_cache.get(key)
+            self._model_cache_key = None if self._cached_model is not None else key
+            if self._cached_model is not None:
+                # the models of the entry are copied, the environments using it must not share them
+                self._cached_model = copy.deepcopy(self._cached_model)
+                self._restore_model(self._cached_model)
+                return
+
         super()._load_model()
 
         # Adjust base pose accordingly
@@ -481,11 +597,19 @@ class BinPicking(SingleArmEnv):
 
         # store some arena attributes
         self.bin_size = mujoco_arena.table_full_size # why bin set to table
+        self._setup_target_bins()
 
         self.objects = []
         self.visual_objects = []
+        if self.object_ids is None:
+            visual_classes = (MilkVisualObject, BreadVisualObject, CerealVisualObject, CanVisualObject)
+            object_classes = (MilkObject, BreadObject, CerealObject, CanObject)
+        else:
+            visual_classes = [object_registry.object_class(id, visual=True) for id in self.object_ids]
+            object_classes = [object_registry.object_class(id) for id in self.object_ids]
+
         for vis_obj_cls, obj_name in zip(
-                (MilkVisualObject, BreadVisualObject, CerealVisualObject, CanVisualObject),
+                visual_classes,
                 self.obj_names,
         ):
             vis_name = "Visual" + obj_name
@@ -493,7 +617,7 @@ class BinPicking(SingleArmEnv):
             self.visual_objects.append(vis_obj)
 
         for obj_cls, obj_name in zip(
-                (MilkObject, BreadObject, CerealObject, CanObject),
+                object_classes,
                 self.obj_names,
         ):
             obj = obj_cls(name=obj_name)
@@ -509,6 +633,58 @@ class BinPicking(SingleArmEnv):
         # Generate placement initializer
         self._get_placement_initializer()
 
+    def _get_model_cache_key(self):
+        """
+        Returns the key of the composition of the environment in the model cache: objects,
+        arena parameters and robots.
+        """
+        robots = tuple(
+            (robot.name, str(getattr(robot, "gripper_type", None)), str(getattr(robot, "mount_type", None)))
+            for robot in self.robots
+        )
+        arena = (tuple(self.table_full_size), tuple(self.table_friction),
+                 tuple(self.bin1_pos.tolist()), tuple(self.bin2_pos.tolist()))
+        return tuple(self.obj_names), arena, robots
+
+    def _restore_model(self, compiled):
+        """
+        Uses the task model, objects and robot models of a copy of a cached compiled model.
+        """
+        for robot, (robot_model, gripper) in zip(self.robots, compiled.robot_parts):
+            robot.robot_model = robot_model
+            robot.gripper = gripper
+        self.model = compiled.model
+        self.objects = compiled.objects
+        self.visual_objects = compiled.visual_objects
+        self.bin_size = compiled.bin_size
+        self._setup_target_bins()
+        self._get_placement_initializer()
+
+    def _initialize_sim(self, xml_string=None):
+        """
+        Creates the simulation from the cached compiled model if there is one, else compiles the
+        model and adds it to the cache.
+        """
+        if xml_string is None and self._cached_model is not None:
+            self.mjpy_model = load_model_from_mjb(self._cached_model.mjb)
+            self.sim = MjSim(self.mjpy_model)
+            self.sim.forward()
+            self.initialize_time(self.control_freq)
+            return
+
+        super()._initialize_sim(xml_string)
+        if xml_string is None and self._model_cache_key is not None:
+            # the entry gets its own copy of the models, which this environment keeps using
+            self.model_cache.put(self._model_cache_key, copy.deepcopy(CompiledModel(
+                model=self.model,
+                objects=self.objects,
+                visual_objects=self.visual_objects,
+                robot_parts=[(robot.robot_model, getattr(robot, "gripper", None)) for robot in self.robots],
+                bin_size=self.bin_size,
+                mjb=self.mjpy_model.get_mjb(),
+            )))
+            self._model_cache_key = None
+
     def _setup_references(self):
         """
         Sets up references to important components. A reference is typically an
@@ -526,23 +702,18 @@ class BinPicking(SingleArmEnv):
             self.obj_body_id[obj.name] = self.sim.model.body_name2id(obj.root_body)
             self.obj_geom_id[obj.name] = [self.sim.model.geom_name2id(g) for g in obj.contact_geoms]
 
+        # body ids of the objects, to read all their positions in sim.data.body_xpos at once
+        self.obj_body_ids = np.array([self.obj_body_id[obj.name] for obj in self.objects], dtype=int)
+
+        # qpos and qvel addresses of the free joints of the objects, for settling them
+        qpos_addrs = [self.sim.model.get_joint_qpos_addr(obj.joints[0]) for obj in self.objects]
+        qvel_addrs = [self.sim.model.get_joint_qvel_addr(obj.joints[0]) for obj in self.objects]
+        self.obj_qpos_ids = np.concatenate([np.arange(*addr) for addr in qpos_addrs])
+        self.obj_qvel_ids = np.concatenate([np.arange(*addr) for addr in qvel_addrs])
+
         # keep track of which objects are in their corresponding bins
         self.objects_in_bins = np.zeros(len(self.objects))
 
-        # target locations in bin for each object type
-        self.target_bin_placements = np.zeros((len(self.objects), 3))
-        for i, obj in enumerate(self.objects):
-            bin_id = i
-            bin_x_low = self.bin2_pos[0]
-            bin_y_low = self.bin2_pos[1]
-            if bin_id == 0 or bin_id == 2:
-                bin_x_low -= self.bin_size[0] / 2.
-            if bin_id < 2:
-                bin_y_low -= self.bin_size[1] / 2.
-            bin_x_low += self.bin_size[0] / 4.
-            bin_y_low += self.bin_size[1] / 4.
-            self.target_bin_placements[i, :] = [bin_x_low, bin_y_low, self.bin2_pos[2]]
-
     def _setup_observables(self):
         """
         Sets up observables to be used for this environment. Creates object-based observables if enabled
@@ -676,14 +847,15 @@ class BinPicking(SingleArmEnv):
         self.sim.model.body_pos[self.sim.model.body_name2id("bin1")] = self.bin1_pos
         self.sim.model.body_pos[self.sim.model.body_name2id("bin2")] = self.bin2_pos
 
+        # Let the objects drop and settle
+        if self.settle_steps > 0 and not self.deterministic_reset:
+            self._settle_objects()
+
         # Move objects out of the scene depending on the mode
         obj_names = {obj.name for obj in self.objects}
         if self.single_object_mode == 1:
             self.obj_to_use = random.choice(list(obj_names))
-            for obj_type, i in self.object_to_id.items():
-                if obj_type.lower() in self.obj_to_use.lower():
-                    self.object_id = i
-                    break
+            self.object_id = self.object_to_id[self.obj_to_use.lower()]
         elif self.single_object_mode == 2:
             self.obj_to_use = self.objects[self.object_id].name
         if self.single_object_mode in {1, 2}:
@@ -698,6 +870,35 @@ class BinPicking(SingleArmEnv):
                     self._observables[name].set_enabled(i == self.object_id)
                     self._observables[name].set_active(i == self.object_id)
 
+    def _settle_objects(self, max_velocity=0.01, min_time=0.1):
+        """
+        Steps the physics for at most @self.settle_steps steps, until the objects stop moving. The
+        robot is held in its reset configuration meanwhile, so it neither sags nor pushes the objects.
+
+        Args:
+            max_velocity (float): velocity of the objects (m/s or rad/s) under which they are settled
+
+            min_time (float): simulated time (s) before the velocity is checked, so that objects placed at
+                rest have started falling whatever the timestep
+        """
+        qpos = self.sim.data.qpos.copy()
+        held_qpos_ids = np.setdiff1d(np.arange(len(qpos)), self.obj_qpos_ids)
+        held_qvel_ids = np.setdiff1d(np.arange(len(self.sim.data.qvel)), self.obj_qvel_ids)
+        min_steps = int(np.ceil(min_time / self.sim.model.opt.timestep))
+        for step in range(self.settle_steps):
+            # everything but the objects is kept still
+            self.sim.data.qpos[held_qpos_ids] = qpos[held_qpos_ids]
+            self.sim.data.qvel[held_qvel_ids] = 0.
+            self.sim.step()
+            if step + 1 >= min_steps and np.abs(self.sim.data.qvel[self.obj_qvel_ids]).max() < max_velocity:
+                break
+
+        # keep the settled objects, restore everything else
+        qpos[self.obj_qpos_ids] = self.sim.data.qpos[self.obj_qpos_ids]
+        self.sim.data.qpos[:] = qpos
+        self.sim.data.qvel[:] = 0.
+        self.sim.forward()
+
     def _check_success(self):
         """
         Check if all objects have been successfully placed in their corresponding bins.
@@ -707,12 +908,11 @@ class BinPicking(SingleArmEnv):
         """
         # remember objects that are in the correct bins
         gripper_site_pos = self.sim.data.site_xpos[self.robots[0].eef_site_id]
-        for i, obj in enumerate(self.objects):
-            obj_str = obj.name
-            obj_pos = self.sim.data.body_xpos[self.obj_body_id[obj_str]]
-            dist = np.linalg.norm(gripper_site_pos - obj_pos)
-            r_reach = 1 - np.tanh(10.0 * dist)
-            self.objects_in_bins[i] = int((not self.not_in_bin(obj_pos, i)) and r_reach < 0.6)
+        obj_pos = self.sim.data.body_xpos[self.obj_body_ids]
+        dists = np.linalg.norm(gripper_site_pos - obj_pos, axis=1)
+        r_reach = 1 - np.tanh(10.0 * dists)
+        bin_ids = np.arange(len(self.objects))
+        self.objects_in_bins[:] = self.in_target_bins(obj_pos, bin_ids) & (r_reach < 0.6)
 
         # returns True if a single object is in the correct bin
         if self.single_object_mode in {1, 2}:
@@ -1,94 +1,71 @@
-import struct
 import os
 import sys
-
-if __name__ == "__main__":
-    obj_f_name = sys.argv[1]
+import numpy as np
+
+# obj2stl is not installed, it is imported from its folder in KIT_models_tool
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "obj2stl"))
+from obj2stl.model.formats.obj import OBJParser
+
+"""
+Converts an OBJ mesh to the binary .msh format of MuJoCo:
+4 int32 (nv, nvn, nvt, nf), then nv*3 float32 positions, nvn*3 float32 normals,
+nvt*2 float32 texture coordinates and nf*3 int32 vertex indices.
+MuJoCo vertices carry their own normal and texture coordinate, so each distinct
+(v, vt, vn) corner of the OBJ becomes one vertex.
+"""
+
+def write_msh(msh_f_name, vertices, faces, normals=None, tex_coords=None):
+    """Writes a .msh file. normals and tex_coords are per vertex, or None."""
+    vertices = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    faces = np.asarray(faces, dtype=np.int32).reshape(-1, 3)
+    normals = np.empty((0, 3), np.float32) if normals is None else np.asarray(normals, dtype=np.float32)
+    tex_coords = np.empty((0, 2), np.float32) if tex_coords is None else np.asarray(tex_coords, dtype=np.float32)
+
+    header = np.array([len(vertices), len(normals), len(tex_coords), len(faces)], dtype=np.int32)
+    with open(msh_f_name, 'wb') as out:
+        for array in (header, vertices, normals, tex_coords, faces):
+            np.ascontiguousarray(array).tofile(out)
+
+def convert_obj_to_msh(obj_f_name, msh_f_name=None, model=None):
+    """Converts an OBJ file to a .msh file next to it (or to msh_f_name) and returns its path.
+
+    Identical (v, vt, vn) corners are merged into a single vertex. Normals or
+    texture coordinates are only written if every corner has one.
+    model is the already parsed OBJ file, if any, so that it is not parsed again.
+    """
     assert obj_f_name[-4:] == ".obj"
-    msh_f_name = obj_f_name[:-4] + ".msh"
-
-    v = []
-    vt = []
-    vn = []
-    f = []
-
-    obj = open(obj_f_name, 'r')
-    for line in obj:
-        arr = line.split()
-        if len(arr) == 0:
-            continue
-
-        if arr[0] == 'v':
-            assert len(arr)==4
-            v.append([float(arr[i]) for i in range(1, 4)])
-        elif arr[0] == 'vt':
-            assert len(arr) == 3
-            vt.append([float(arr[i]) for i in range(1, 3)])
-        elif arr[0] == 'vn':
-            assert len(arr) == 4
-            vn.append([float(arr[i]) for i in range(1, 4)])
-        elif arr[0] == 'f':
-                tmp = [arr[i].split("/") for i in range(1,len(arr))]
-                for i in range(1, len(tmp)-1):
-                    f.append([tmp[0], tmp[i], tmp[i+1]])
-        #else:
-            #print(arr)
-
-    output_v = []
-    output_vn = []
-    output_vt = []
-    output_f = []
-
-
-    for i in f:
-        assert len(i) == 3
-        for j in i:
-            v_idx = int(j[0])-1
-            vt_idx = int(j[1]) - 1
-            vn_idx = int(j[2]) - 1
-            output_v.append(v[v_idx])
-            output_vt.append(vt[vt_idx])
-            output_vn.append(vn[vn_idx])
-        output_f.append([len(output_v)-3, len(output_v)-2, len(output_v)-1])
-
-    #print("len(v)=", len(output_v))
-    #print("len(vn)=", len(output_vn))
-    #print("len(vt)=", len(output_vt))
-    #print("len(f)=", len(output_f))
-    out = open(msh_f_name, 'wb')
-
-    integer_packing = "=i"
-    float_packing = "=f"
-
-    def int_to_bytes(input):
-        assert type(input) == int
-        return struct.pack(integer_packing, input)
-
-    def float_to_bytes(input):
-        assert type(input) == float
-        return struct.pack(float_packing, input)
-
-
-    out.write(int_to_bytes(len(output_v)))
-    out.write(int_to_bytes(len(output_vn)))
-    out.write(int_to_bytes(len(output_vt)))
-    out.write(int_to_bytes(len(output_f)))
-
-    for i in output_v:
-        for j in range(3):
-            out.write(float_to_bytes(i[j]))
-    for i in output_vn:
-        for j in range(3):
-            out.write(float_to_bytes(i[j]))
-    for i in output_vt:
-        out.write(float_to_bytes(i[0]))
-        out.write(float_to_bytes(1-i[1]))
-    for i in output_f:
-        for j in range(3):
-            out.write(int_to_bytes(i[j]))
-    out.close()
-    #print("actual file size=", os.path.getsize(msh_f_name))
-
-    expected_file_size = 16 + 12*(len(output_v) + len(output_vn) + len(output_f)) + 8*len(output_vt)
-    #print("expected_file_size=", expected_file_size)
+    if msh_f_name is None:
+        msh_f_name = obj_f_name[:-4] + ".msh"
+
+    if model is None:
+        model = OBJParser()
+        model.parse_file(obj_f_name)
+
+    corners = [model.face_array.reshape(-1)]
+    tex_coord_indices = model.face_tex_coord_array.reshape(-1)
+    normal_indices = model.face_normal_array.reshape(-1)
+    has_tex_coords = len(model.tex_coord_array) > 0 and (tex_coord_indices >= 0).all()
+    has_normals = len(model.normal_array) > 0 and (normal_indices >= 0).all()
+    if has_tex_coords:
+        corners.append(tex_coord_indices)
+    if has_normals:
+        corners.append(normal_indices)
+
+    # each distinct corner becomes an output vertex
+    unique_corners, inverse = np.unique(np.stack(corners, axis=1), axis=0, return_inverse=True)
+
+    normals = None
+    tex_coords = None
+    if has_tex_coords:
+        tex_coords = model.tex_coord_array[unique_corners[:, 1]]
+        # MuJoCo has its texture origin at the top left corner
+        tex_coords[:, 1] = 1 - tex_coords[:, 1]
+    if has_normals:
+        normals = model.normal_array[unique_corners[:, -1]]
+
+    write_msh(msh_f_name, model.vertex_array[unique_corners[:, 0]], inverse.reshape(-1, 3),
+              normals, tex_coords)
+    return msh_f_name
 
+if __name__ == "__main__":
+    convert_obj_to_msh(sys.argv[1])
@@ -1,10 +1,27 @@
 import os
-import trimesh
+import sys
 import argparse
-import pandas as pd
 import shutil
 import random
 
+# the build manifest is shared with the KIT scripts of the parent folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from build_manifest import BuildManifest, default_manifest_path, code_files
+from object_metadata import ObjectMetadata, default_excel_path
+from convert_obj_to_mujoco_msh import convert_obj_to_msh
+# obj2stl is on the path once convert_obj_to_mujoco_msh is imported
+import obj2stl.model
+import collision_hulls
+import convert_obj_to_mujoco_msh
+import xml_template
+import obj2stl.model.tools as mt
+from obj2stl.model.simplify import decimate
+from obj2stl.model.inertia import mass_properties
+from obj2stl.model.bounds import horizontal_radius
+from collision_hulls import (create_collision_hulls, create_collision_mesh, collision_model, collision_xml,
+                             default_max_hulls, default_hull_resolution, default_collision_faces)
+from xml_template import XMLTemplate
+
 """
 Creates Mujoco compatible XML files from downloaded YCB data.
 This looks through all the YCB objects you have downloaded in a particular 
@@ -18,7 +35,9 @@ types to download in the `download_ycb_dataset.py` script.
 # Define folders & paths
 default_ycb_folder = os.path.join("models", "ycb")
 default_template_folder = os.path.join("templates", "ycb")
-excel_path = "object_categories_db.xlsx"
+excel_path = default_excel_path
+# the YCB meshes are in meters
+default_mesh_unit = 1.0
 
 if __name__ == "__main__":
 
@@ -26,14 +45,33 @@ if __name__ == "__main__":
 
     # Parse arguments
     parser = argparse.ArgumentParser(description="YCB Model Importer")
-    parser.add_argument("--downsaargparsemple-ratio", type=float, default=1,
-                        help="Mesh vertex downsample ratio (set to 1 to leave meshes as they are)")
+    parser.add_argument("--downsample-ratio", type=float, default=1,
+                        help="Mesh face downsample ratio (set to 1 to leave meshes as they are)")
+    parser.add_argument("--collision-faces", type=int, default=default_collision_faces,
+                        help="Triangle budget of the collision geometry, the mesh is simplified to it before "
+                             "its decomposition (0 for no limit)")
+    parser.add_argument("--max-hulls", type=int, default=default_max_hulls,
+                        help="Maximum number of convex hulls used for collisions (0 to collide with the mesh itself)")
+    parser.add_argument("--hull-resolution", type=int, default=default_hull_resolution,
+                        help="Number of voxels along the longest side of a mesh for its convex decomposition")
     parser.add_argument("--template-folder", type=str, default=default_template_folder,
                         help="Location of YCB models (defaults to ./templates/ycb)")
     parser.add_argument("--ycb-folder", type=str, default=default_ycb_folder,
                         help="Location of YCB models (defaults to ./models/ycb)")
+    parser.add_argument("--mesh-unit", type=float, default=default_mesh_unit,
+                        help="Length of a mesh unit in meters (defaults to 1, YCB meshes are in meters)")
+    parser.add_argument("--manifest", type=str, default=default_manifest_path,
+                        help="Build manifest used to skip up to date objects (defaults to ./build_manifest.json)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every object, even the up to date ones")
 
     args = parser.parse_args()
+    manifest = BuildManifest(args.manifest)
+    metadata = ObjectMetadata(excel_path)
+    params = {"downsample_ratio": args.downsample_ratio, "collision_faces": args.collision_faces,
+              "max_hulls": args.max_hulls, "hull_resolution": args.hull_resolution, "mesh_unit": args.mesh_unit}
+    # the objects are rebuilt when the code generating them changes
+    code_inputs = code_files(obj2stl.model, collision_hulls, convert_obj_to_mujoco_msh, xml_template)
 
     # Get the list of all downloaded mesh folders
     folder_names = os.listdir(args.ycb_folder)
@@ -41,10 +79,9 @@ if __name__ == "__main__":
     # Get the template files to copy over
     model_template_file = os.path.join(args.template_folder, "template.xml")
     visual_template_file = os.path.join(args.template_folder, "visual.xml")
-    with open(model_template_file, "r") as f:
-        model_template_text = f.read()
-    with open(visual_template_file, "r") as f:
-        visual_template_text = f.read()
+    # The templates are compiled once, and rendered for each object
+    model_template = XMLTemplate.from_file(model_template_file)
+    visual_template = XMLTemplate.from_file(visual_template_file)
 
     #mass_list = {}
     #longitude_list = {}
@@ -77,7 +114,28 @@ if __name__ == "__main__":
                     mesh_file = os.path.join(model_folder, "tsdf", "textured.obj")
                     texture_file = "textured.png"
 
-                mesh = trimesh.load(mesh_file)
+                # Skip the object if it was already generated from the same files
+                build_inputs = [mesh_file, os.path.join(os.path.dirname(mesh_file), texture_file),
+                                model_template_file, visual_template_file, excel_path, os.path.abspath(__file__)] + code_inputs
+                build_outputs = [os.path.join(model_folder, model_short + ".xml"),
+                                 os.path.join(model_folder, model_short + "v" + ".xml"),
+                                 os.path.join("./objects", "o" + id + ".xml"),
+                                 os.path.join("./objects", "o" + id + "v" + ".xml"),
+                                 './objects/meshes/' + model_short + '.msh',
+                                 './objects/meshes/' + 'untextured_' + model_short + '.stl',
+                                 './textures/' + model_short + '.png']
+                hull_folder = './objects/meshes/' + model_short + '_hulls'
+                collision_file = './objects/meshes/' + model_short + '_collision.msh'
+                if args.max_hulls:
+                    build_outputs.append(hull_folder)
+                elif args.collision_faces:
+                    build_outputs.append(collision_file)
+                if not args.force and manifest.is_fresh("ycb_xml", "o" + id, build_inputs, build_outputs, params):
+                    print("Skipping {}, Mujoco XML files are up to date".format(folder))
+                    continue
+
+                # the mesh is only parsed here, every step below uses this model
+                model = mt.load_model(mesh_file)
 
                 # keep objects  0.1 kg <= mass <= 1 kg, 4 cm <= longitude = 7 cm
                 mass_max = 1.0
@@ -86,13 +144,10 @@ if __name__ == "__main__":
                 longitude_min = 0.04
 
                 # given object id , get mass (kg) from excel
-                print(excel_path)
-                df = pd.read_excel("./" + excel_path, sheet_name="database_real", engine="openpyxl")
-                # print("testing testing")
-                
-                excel_id = int(id_strip)-1
-                excel_mass_text = df.mass[excel_id]
-                mass = float(excel_mass_text[:-2]) / 1000
+                info = metadata[id]
+                mass = info.mass
+                if not mass > 0:
+                    raise ValueError("No mass for object {} in {}".format(id, excel_path))
 
                 if mass > mass_max:
                     mass = random.uniform(mass_min, mass_max)
@@ -100,17 +155,12 @@ if __name__ == "__main__":
                 mass_text = str(mass)
                 # mass_list[id]=mass
 
-                # given object id , get dimensions (m) from excel
-                if df.longitude3[excel_id] != 0:
-                    height = df.longitude3[excel_id]/1000.0
-                    radius_x = df.longitude1[excel_id]/2000.0
-                    radius_y = df.longitude2[excel_id]/2000.0
-                elif df.longitude3[excel_id] == 0 and df.longitude2[excel_id] != 0:
-                    height = df.longitude2[excel_id]/1000.0
-                    radius_x = radius_y = df.longitude1[excel_id]/2000.0
-                else:
-                    height = df.longitude1[excel_id]/1000.0
-                    radius_x = radius_y = df.longitude1[excel_id]/2000.0
+                # dimensions (m) of the object, from the bounding box of its mesh
+                bounds = model.bounding_box
+                size = bounds.get_size()
+                height = size.z * args.mesh_unit
+                radius_x = size.x * args.mesh_unit / 2
+                radius_y = size.y * args.mesh_unit / 2
 
                 if height > longitude_max:
                     height_rand = random.uniform(longitude_min, longitude_max)
@@ -128,32 +178,38 @@ if __name__ == "__main__":
                 # given x, y, z, if(min(x,y,z))>=7cm, x'/y'/z'=rand() ,scale=R[x/y/z]= (x'/y'/z')/(x/y/z)
                 min_longitude = min(radius_x, radius_y, height)
                 longitude = {radius_x: radius_x_rand, radius_y: radius_y_rand, height: height_rand}
-                ratio = longitude[min_longitude] / min_longitude
-
-                # convert dimensions to strings for renaming templates
-                bottom_text = str(-height_rand/2)
-                upper_text = str(height_rand/2)
-                radius_text = str(max(radius_x_rand, radius_y_rand))
-                vertical_radius_text = str(height_rand)
+                # scale of the mesh, from mesh units to the sampled size in meters
+                ratio = longitude[min_longitude] / min_longitude * args.mesh_unit
+
+                # convert dimensions to strings for renaming templates, the
+                # sites are placed on the scaled mesh
+                bottom_text = str(bounds.min_z * ratio)
+                upper_text = str(bounds.max_z * ratio)
+                radius_text = str(horizontal_radius(model.vertex_array) * ratio)
+                vertical_radius_text = str(size.z * ratio)
                 ratio_text = str(ratio)
                 # longitude_list[id] = (height_rand, min(radius_x_rand, radius_y_rand)*2)
 
-                # moments of inertia
-                tf = mesh.principal_inertia_transform
-                inertia = trimesh.inertia.transform_inertia(tf, mesh.moment_inertia)
+                # moments of inertia of the mesh scaled by ratio, for the sampled mass,
+                # about the center of mass and in the axes of the mesh (fullinertia)
+                properties = mass_properties(model, mass, ratio)
+                inertia = properties.inertia
                 # Center of mass
-                com_vec = mesh.center_mass.tolist()
+                com_vec = properties.center_of_mass.tolist()
                 com_text = ' '.join(map(str, com_vec))
                 com_text = str(com_text)
 
-                # Create a downsampled mesh file with a subset of vertices and faces
+                # Create a downsampled mesh file by simplifying the mesh, its
+                # texture coordinates are kept so that it stays textured
+                target_faces = model.face_count
                 if args.downsample_ratio < 1:
-                    mesh_pts = mesh.vertices.shape[0]
-                    num_pts = int(mesh_pts * args.downsample_ratio)
-                    (_, face_idx) = mesh.sample(num_pts, True)
-                    downsampled_mesh = mesh.submesh((face_idx,), append=True)
-                    with open(os.path.join(model_folder, "downsampled.obj"), "w") as f:
-                        downsampled_mesh.export(f, "obj")
+                    target_faces = max(4, int(target_faces * args.downsample_ratio))
+                mesh_model = model
+                if target_faces < model.face_count:
+                    downsampled_model = decimate(model, target_faces)
+                    downsampled_path = os.path.join(model_folder, "downsampled.obj")
+                    mt.export_model(downsampled_model, downsampled_path).export_to_path(downsampled_path)
+                    mesh_model = downsampled_model
                     collision_mesh_text = model_long + "/downsampled.obj"
                 else:
                     collision_mesh_text = model_long + "/" + mesh_type + "/textured.obj"
@@ -161,15 +217,28 @@ if __name__ == "__main__":
                 # Convert_obj_2_mujoco_msh
                 mujoco_mesh_text = os.path.join(args.ycb_folder, collision_mesh_text)
                 print(mujoco_mesh_text)
-                command = 'python3 convert_obj_to_mujoco_msh.py' + ' ' + "./" + mujoco_mesh_text
-                os.system(command)
+                mesh_file = convert_obj_to_msh("./" + mujoco_mesh_text, model=mesh_model)
+
+                # Convex decomposition of the mesh simplified to the collision
+                # budget, each hull is a collision geom
+                collision_mesh = collision_model(model, args.collision_faces)
+                hull_files = []
+                if args.max_hulls:
+                    hull_names = create_collision_hulls(collision_mesh, hull_folder,
+                                                        args.max_hulls, args.hull_resolution)
+                    hull_files = ['meshes/' + model_short + '_hulls/' + name for name in hull_names]
+                    collision_meshes_text, collision_geoms_text = collision_xml(hull_files, model_short, ratio_text)
+                elif collision_mesh is not model:
+                    create_collision_mesh(collision_mesh, collision_file)
+                    collision_meshes_text, collision_geoms_text = collision_xml(
+                        ['meshes/' + model_short + '_collision.msh'], model_short, ratio_text, name="collision")
+                else:
+                    collision_meshes_text, collision_geoms_text = collision_xml([], model_short, ratio_text)
 
                 if mesh_type == "google_16k":
-                    mesh_file = os.path.join(model_folder, "google_16k", "textured.msh")
                     texture_path = os.path.join(model_folder, "google_16k", "texture_map.png")
                     untextured_path = os.path.join(model_folder, "google_16k", "nontextured.stl")
                 elif mesh_type == "tsdf":
-                    mesh_file = os.path.join(model_folder, "tsdf", "textured.msh")
                     texture_path = os.path.join(model_folder, "tsdf", "textured.png")
                     untextured_path = os.path.join(model_folder, "tsdf", "nontextured.stl")
 
@@ -178,65 +247,50 @@ if __name__ == "__main__":
                 texture_model_short_file = model_short + '.png'
                 untex_mesh_model_short_file = 'untextured_' + model_short + '.stl'
 
-                model_text = model_template_text.replace("$ID", id)
-                model_text = model_text.replace("$MODEL_SHORT", model_short)
-                model_text = model_text.replace("$MODEL_LONG", model_long)
-                model_text = model_text.replace("$YCB_FOLDER", args.ycb_folder)
-                model_text = model_text.replace("$MESH_TYPE", mesh_type)
-                model_text = model_text.replace("$MASS", mass_text)
-                model_text = model_text.replace("$BOTTOM", bottom_text)
-                model_text = model_text.replace("$UPPER", upper_text)
-                model_text = model_text.replace("$RADIUS", radius_text)
-                model_text = model_text.replace("$VERTICAL_RADIUS", vertical_radius_text)
-                model_text = model_text.replace("$RATIO", ratio_text)
-                model_text = model_text.replace("$COM", com_text)
-                model_text = model_text.replace("$IXX", str(inertia[0][0]))
-                model_text = model_text.replace("$IYY", str(inertia[1][1]))
-                model_text = model_text.replace("$IZZ", str(inertia[2][2]))
-                model_text = model_text.replace("$IXY", str(inertia[0][1]))
-                model_text = model_text.replace("$IXZ", str(inertia[0][2]))
-                model_text = model_text.replace("$IYZ", str(inertia[1][2]))
-                model_text = model_text.replace("$MESH_MODEL_SHORT_FILE", mesh_model_short_file)
-                model_text = model_text.replace("$TEXTURE_MODEL_SHORT_FILE", texture_model_short_file)
-
-                # creating model_name.xml inside each model_folder
-                model_text_name = model_text
-                model_text_name = model_text_name.replace("$ADDRESS", ".")
-                with open(os.path.join(model_folder, model_short + ".xml"), "w") as f:
-                    f.write(model_text_name)
-                    
-                # creating oXXXX.xml objects and put them inside the "objects" folder
+                # values of the template slots, shared by the model and visual files
+                values = {
+                    "ID": id,
+                    "MODEL_SHORT": model_short,
+                    "MODEL_LONG": model_long,
+                    "YCB_FOLDER": args.ycb_folder,
+                    "MESH_TYPE": mesh_type,
+                    "MASS": mass_text,
+                    "BOTTOM": bottom_text,
+                    "UPPER": upper_text,
+                    "RADIUS": radius_text,
+                    "VERTICAL_RADIUS": vertical_radius_text,
+                    "RATIO": ratio_text,
+                    "COM": com_text,
+                    "IXX": inertia[0][0],
+                    "IYY": inertia[1][1],
+                    "IZZ": inertia[2][2],
+                    "IXY": inertia[0][1],
+                    "IXZ": inertia[0][2],
+                    "IYZ": inertia[1][2],
+                    "MESH_MODEL_SHORT_FILE": mesh_model_short_file,
+                    "TEXTURE_MODEL_SHORT_FILE": texture_model_short_file,
+                    "UNTEX_MESH_MODEL_SHORT_FILE": untex_mesh_model_short_file,
+                    "COLLISION_MESHES": collision_meshes_text,
+                    "COLLISION_GEOMS": collision_geoms_text,
+                }
                 # ycb format is 001-072 but our encoding is 0001-1296
-                model_text_oXXXX = model_text
                 model_path = os.path.join( args.ycb_folder, model_long )
-                model_text_oXXXX = model_text_oXXXX.replace("$ADDRESS", "../" + model_path)
-                with open( os.path.join("./objects", "o" + id + ".xml"), "w") as f:
-                    f.write(model_text_oXXXX)
-                    
-                # Copy and modify the visual file template
-                visual_text = visual_template_text.replace("$ID", id)
-                visual_text = visual_text.replace("$MODEL_SHORT", model_short)
-                visual_text = visual_text.replace("$MODEL_LONG", model_long)
-                visual_text = visual_text.replace("$MESH_TYPE", mesh_type)
-                visual_text = visual_text.replace("$MASS", mass_text)
-                visual_text = visual_text.replace("$UPPER", upper_text)
-                visual_text = visual_text.replace("$BOTTOM", bottom_text)
-                visual_text = visual_text.replace("$RADIUS", radius_text)
-                visual_text = visual_text.replace("$VERTICAL_RADIUS", vertical_radius_text)
-                visual_text = visual_text.replace("$RATIO", ratio_text)
-                visual_text = visual_text.replace("$UNTEX_MESH_MODEL_SHORT_FILE", untex_mesh_model_short_file)
 
+                # creating model_name.xml inside each model_folder
+                values["ADDRESS"] = "."
+                with open(os.path.join(model_folder, model_short + ".xml"), "w") as f:
+                    f.write(model_template.render(values))
                 # creating model_name_visual.xml inside each model_folder
-                visual_text_name = visual_text
-                visual_text_name = visual_text_name.replace("$ADDRESS", ".")
                 with open(os.path.join(model_folder, model_short + "v" + ".xml"), "w") as f:
-                    f.write(visual_text)
-                    
+                    f.write(visual_template.render(values))
+
+                # creating oXXXX.xml objects and put them inside the "objects" folder
+                values["ADDRESS"] = "../" + model_path
+                with open( os.path.join("./objects", "o" + id + ".xml"), "w") as f:
+                    f.write(model_template.render(values))
                 # creating oXXXX_visual.xml objects and put them inside the "objects" folder
-                visual_text_oXXXX = visual_text
-                visual_text_oXXXX = visual_text_oXXXX.replace("$ADDRESS", "../" + model_path)
                 with open( os.path.join("./objects", "o" + id + "v" + ".xml"), "w") as f:
-                    f.write(visual_text_oXXXX)
+                    f.write(visual_template.render(values))
 
                 # copy files
                 original_mesh = mesh_file
@@ -251,10 +305,12 @@ if __name__ == "__main__":
                 target_texture = './textures/' + texture_model_short_file
                 shutil.copyfile(original_texture, target_texture)
 
+                manifest.record("ycb_xml", "o" + id, build_inputs, build_outputs, params)
 
             except:
                 print("Error processing {}. Textured mesh likely does not exist for this object.".format(folder))
-  
+
+    manifest.save()
     print("Generation Completed.")
     #res1 = {key: val for key, val in sorted(mass_list.items(), key=lambda ele: ele[0])}
     #res2 = {key: val for key, val in sorted(longitude_list.items(), key=lambda ele: ele[0])}
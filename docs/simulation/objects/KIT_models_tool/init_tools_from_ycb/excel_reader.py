@@ -1,14 +1,16 @@
-import pandas as pd
+import os
+import sys
+
+# the metadata module is shared with the KIT scripts of the parent folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from object_metadata import ObjectMetadata
+
 path = "object_categories_db.xlsx"
 
-df = pd.read_excel(path, sheet_name="database_real", engine="openpyxl")
-print(df.head())
+metadata = ObjectMetadata(path)
+print(len(metadata.ids), "objects")
 
 id=66
-# given object id, get the mass from excel
-mass = int(df.mass[id][:3])/1000
+# given object id, get the mass (kg) from excel
+mass = metadata[id].mass
 print(mass)
-
-
-
-
@@ -0,0 +1,125 @@
+import re
+import json
+from robosuite.models.objects import MujocoXMLObject
+from robosuite.utils.mjcf_utils import xml_path_completion
+
+"""
+Registry of the BinPicking objects (oXXXX and their visuals oXXXXv).
+The XML files of the objects are listed in objects/objects_manifest.json
+(written by registry_script.py), which is only read the first time an object
+is requested, and the MujocoXMLObject subclass of an object is created the
+first time it is used. Importing robosuite.models.objects therefore costs the
+same whatever the size of the catalog.
+"""
+
+default_manifest_path = "objects/objects_manifest.json"
+
+# oXXXX or oXXXXv
+object_name_pattern = re.compile(r"^(o\d{4})(v?)$")
+
+
+class ObjectRegistry:
+    """
+    Maps object ids (e.g. "o0013") to MujocoXMLObject subclasses, created on demand.
+
+    Args:
+        manifest_path (str): path of the manifest, relative to the robosuite assets folder or absolute
+    """
+
+    def __init__(self, manifest_path=default_manifest_path):
+        self.manifest_path = manifest_path
+        self._entries = None
+        self._classes = {}
+
+    @property
+    def entries(self):
+        """
+        Returns:
+            dict: the manifest entries of the objects, {id: {"xml": path, "visual_xml": path}}
+        """
+        if self._entries is None:
+            with open(xml_path_completion(self.manifest_path), "r") as f:
+                self._entries = json.load(f)["objects"]
+        return self._entries
+
+    def ids(self):
+        """
+        Returns:
+            list of str: the sorted ids of the registered objects
+        """
+        return sorted(self.entries)
+
+    def __contains__(self, id):
+        return id in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def object_class(self, id, visual=False):
+        """
+        Returns the class of an object, or of its visual.
+
+        Args:
+            id (str): id of the object, e.g. "o0013"
+            visual (bool): True for the visual object (oXXXXv)
+
+        Returns:
+            MujocoXMLObject subclass: the class, named like the object
+
+        Raises:
+            KeyError: [Unknown object id]
+        """
+        class_name = id + "v" if visual else id
+        cls = self._classes.get(class_name)
+        if cls is None:
+            if id not in self.entries:
+                raise KeyError("unknown object {}, not in {}".format(id, self.manifest_path))
+            entry = self.entries[id]
+            cls = self._classes[class_name] = _make_class(
+                class_name, entry["visual_xml"] if visual else entry["xml"], visual)
+        return cls
+
+    def create(self, id, name, visual=False):
+        """
+        Returns an instance of an object, or of its visual.
+
+        Args:
+            id (str): id of the object, e.g. "o0013"
+            name (str): name of the instance
+            visual (bool): True for the visual object (oXXXXv)
+        """
+        return self.object_class(id, visual)(name=name)
+
+    def class_by_name(self, name):
+        """
+        Returns the class of a name like "o0013" or "o0013v", or None if the
+        name is not the one of a registered object.
+        """
+        match = object_name_pattern.match(name)
+        if match is None or match.group(1) not in self:
+            return None
+        return self.object_class(match.group(1), visual=match.group(2) == "v")
+
+
+def _make_class(class_name, xml_path, visual):
+    """Creates the MujocoXMLObject subclass of an object, same as the classes of xml_objects.py."""
+    if visual:
+        kwargs = dict(joints=None, obj_type="visual", duplicate_collision_geoms=True)
+    else:
+        kwargs = dict(joints=[dict(type="free", damping="0.0005")], obj_type="all", duplicate_collision_geoms=True)
+
+    def __init__(self, name):
+        MujocoXMLObject.__init__(self, xml_path_completion(xml_path), name=name, **kwargs)
+
+    # the classes are found again through the module __getattr__, so they can be pickled
+    return type(class_name, (MujocoXMLObject,), {"__init__": __init__, "__doc__": class_name, "__module__": __name__})
+
+
+registry = ObjectRegistry()
+
+
+def __getattr__(name):
+    cls = registry.class_by_name(name)
+    if cls is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    return cls
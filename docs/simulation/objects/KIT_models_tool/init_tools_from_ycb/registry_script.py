@@ -0,0 +1,82 @@
+import os
+import re
+import json
+import argparse
+
+"""
+Generates objects/objects_manifest.json, the list of the oXXXX.xml and
+oXXXXv.xml files read by object_registry.py, which creates the MujocoXMLObject
+classes of the objects on demand.
+The objects folder is scanned once, and the manifest is written to a temporary
+file renamed over the previous one, so an interrupted run never leaves a
+half-written manifest behind.
+"""
+
+# Define folders
+default_object_folder = "./objects"
+manifest_name = "objects_manifest.json"
+# the XML paths of the manifest are relative to the robosuite assets folder
+asset_object_folder = "objects"
+
+# oXXXX.xml, the visual files oXXXXv.xml are found from them
+object_file_pattern = re.compile(r"^(o\d{4})\.xml$")
+
+def scan_objects(object_folder):
+    """Returns the sorted ids (oXXXX) of the objects of a folder."""
+    ids = []
+    for name in os.listdir(object_folder):
+        match = object_file_pattern.match(name)
+        if match:
+            ids.append(match.group(1))
+    ids.sort()
+    return ids
+
+def read_manifest(manifest_path):
+    """Returns the entries of a previously generated manifest, if any."""
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r") as f:
+        return json.load(f)["objects"]
+
+def manifest_entries(ids):
+    """Returns the manifest entries of objects, {id: {"xml": path, "visual_xml": path}}."""
+    return {id: {"xml": asset_object_folder + "/" + id + ".xml",
+                 "visual_xml": asset_object_folder + "/" + id + "v.xml"}
+            for id in ids}
+
+def write_atomic(path, text):
+    """Writes a file through a temporary file renamed over it."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+if __name__ == "__main__":
+
+    print("Generating the object manifest...")
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="YCB Model Importer")
+    parser.add_argument("--object-folder", type=str, default=default_object_folder,
+                        help="Location of the oXXXX.xml files, where the manifest is written (defaults to ./objects)")
+
+    args = parser.parse_args()
+
+    ids = scan_objects(args.object_folder)
+    for id in ids:
+        if not os.path.exists(os.path.join(args.object_folder, id + "v.xml")):
+            print("Warning: {} has no visual file {}v.xml".format(id, id))
+
+    manifest_path = os.path.join(args.object_folder, manifest_name)
+    previous_ids = set(read_manifest(manifest_path))
+    write_atomic(manifest_path, json.dumps({"objects": manifest_entries(ids)}, indent=1, sort_keys=True) + "\n")
+
+    added = sorted(set(ids) - previous_ids)
+    removed = sorted(previous_ids - set(ids))
+    print("{} objects: {} added, {} removed".format(len(ids), len(added), len(removed)))
+    if added:
+        print("  added:", " ".join(added))
+    if removed:
+        print("  removed:", " ".join(removed))
+
+    print("Generation Completed.")
@@ -0,0 +1,60 @@
+import time
+import argparse
+import numpy as np
+
+"""
+Measures the reset latency of the BinPicking environment (bin_picking.py,
+installed in robosuite/environments/manipulation) for:
+- soft resets (hard_reset=False), which only reset the simulation,
+- cached hard resets, which reuse the compiled model of the model cache,
+- cold hard resets, which rebuild and recompile the model (cache cleared).
+"""
+
+def time_resets(env, resets, before_reset=None):
+    """Returns the durations (s) of resets of an environment."""
+    durations = []
+    for _ in range(resets):
+        if before_reset is not None:
+            before_reset()
+        start = time.perf_counter()
+        env.reset()
+        durations.append(time.perf_counter() - start)
+    return np.array(durations)
+
+if __name__ == "__main__":
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="BinPicking reset benchmark")
+    parser.add_argument("--robot", type=str, default="Panda",
+                        help="Robot of the environment (defaults to Panda)")
+    parser.add_argument("--num-objects", type=int, default=None,
+                        help="Number of catalog objects sampled for the environment (defaults to milk, bread, cereal and can)")
+    parser.add_argument("--resets", type=int, default=20,
+                        help="Number of resets timed per mode")
+
+    args = parser.parse_args()
+
+    import robosuite as suite
+    from robosuite.environments.manipulation import bin_picking
+
+    env = suite.make(
+        "BinPicking",
+        robots=args.robot,
+        num_objects=args.num_objects,
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        hard_reset=True,
+    )
+
+    env.hard_reset = False
+    soft = time_resets(env, args.resets)
+    env.hard_reset = True
+    cached = time_resets(env, args.resets)
+    cold = time_resets(env, args.resets, before_reset=bin_picking.model_cache.clear)
+    env.close()
+
+    print("{} objects, {} resets per mode".format(len(env.objects), args.resets))
+    for (name, durations) in (("soft reset", soft), ("cached hard reset", cached), ("cold hard reset", cold)):
+        print("{:<18} mean {:8.1f} ms  median {:8.1f} ms  max {:8.1f} ms".format(
+            name, 1000 * durations.mean(), 1000 * np.median(durations), 1000 * durations.max()))
@@ -2,6 +2,7 @@
 
 import argparse
 import os
+import sys
 
 import obj2stl.model.tools as mt
 import functools as fc
@@ -27,13 +28,11 @@ def main(args):
 
     output = args.output if args.output is not None else '.' + args.type
 
-    result = mt.convert(args.input, output, up_conversion)
-
+    fileobj = None
     if args.output is None:
-        print(result)
-    else:
-        with open(args.output, 'w') as f:
-            f.write(result)
+        fileobj = sys.stdout.buffer if args.binary else sys.stdout
+
+    mt.convert(args.input, output, up_conversion, args.binary, fileobj)
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -50,7 +49,8 @@ if __name__ == '__main__':
                         help="Initial up vector")
     parser.add_argument('-tu', '--to-up', metavar='fup', default=None,
                         help="Output up vector")
+    parser.add_argument('-b', '--binary', action='store_true',
+                        help="Export binary instead of ASCII (only for .stl)")
     args = parser.parse_args()
-    print(args)
     args.func(args)
 
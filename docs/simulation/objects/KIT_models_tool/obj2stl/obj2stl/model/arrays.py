@@ -0,0 +1,180 @@
+import numpy as np
+
+from ..geometry import Vector
+
+class GrowableArray:
+    """Contiguous 2D numpy array that rows can be appended to
+
+    The storage is over-allocated and doubled when full, so appending rows is
+    amortized constant time, and the valid rows are always available as a
+    single contiguous array through the data property. Rows appended one by one
+    are kept in a small python list and copied into the storage by batches.
+    """
+
+    BATCH_SIZE = 4096
+    """Number of rows appended one by one that are buffered before a copy
+    """
+    def __init__(self, width, dtype = np.float32, capacity = 1024):
+        """Creates an empty array
+
+        :param width: number of columns of each row
+        :param dtype: numpy type of the elements
+        :param capacity: number of rows initially allocated
+        """
+        self.width = width
+        self.dtype = np.dtype(dtype)
+        self._data = np.empty((capacity, width), dtype=self.dtype)
+        self._size = 0
+        self._pending = []
+
+    def __len__(self):
+        """Returns the number of valid rows
+        """
+        return self._size + len(self._pending)
+
+    @property
+    def data(self):
+        """Returns the valid rows as a (n, width) array, without copying
+        """
+        self._flush()
+        return self._data[:self._size]
+
+    def _flush(self):
+        """Copies the rows appended one by one into the storage
+        """
+        if len(self._pending) > 0:
+            pending = self._pending
+            self._pending = []
+            self.extend(pending)
+
+    def _reserve(self, size):
+        """Makes sure that size rows fit in the storage
+
+        :param size: the number of rows that should fit
+        """
+        if size <= self._data.shape[0] and self._data.flags.writeable:
+            return
+
+        capacity = max(size, 2 * self._data.shape[0], 1024)
+        data = np.empty((capacity, self.width), dtype=self.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def append(self, row):
+        """Appends one row at the end of the array
+
+        :param row: sequence of width numbers
+        """
+        self._pending.append(row)
+        if len(self._pending) >= self.BATCH_SIZE:
+            self._flush()
+
+    def extend(self, rows):
+        """Appends several rows at the end of the array
+
+        :param rows: array-like of shape (n, width)
+        """
+        self._flush()
+        rows = np.asarray(rows, dtype=self.dtype).reshape(-1, self.width)
+        self._reserve(self._size + len(rows))
+        self._data[self._size:self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def set(self, rows):
+        """Replaces the content of the array
+
+        The array is adopted without copy when it already has the correct type
+        and layout, which allows to use read-only or memory-mapped arrays.
+
+        :param rows: array-like of shape (n, width)
+        """
+        self._pending = []
+        rows = np.asarray(rows, dtype=self.dtype)
+        if rows.size == 0:
+            rows = rows.reshape(0, self.width)
+        self._data = np.ascontiguousarray(rows.reshape(-1, self.width))
+        self._size = self._data.shape[0]
+
+    def clear(self):
+        """Removes every row of the array
+        """
+        self._pending = []
+        self._size = 0
+
+
+class VectorArrayView:
+    """Read-only sequence that wraps the rows of an array into Vector objects
+
+    It exists so that code written for the old list of Vector models, like
+    model.vertices[i].x, keeps working. Vectors are created on the fly, so
+    modifying them does not modify the model.
+    """
+    def __init__(self, source):
+        """Creates a view
+
+        :param source: the GrowableArray to wrap
+        """
+        self.source = source
+
+    def __len__(self):
+        return len(self.source)
+
+    def __getitem__(self, index):
+        data = self.source.data
+        if isinstance(index, slice):
+            return [Vector(*row) for row in data[index].tolist()]
+        return Vector(*data[index].tolist())
+
+    def __iter__(self):
+        for row in self.source.data.tolist():
+            yield Vector(*row)
+
+
+def normalize_rows(array, epsilon = 0.0):
+    """Divides each row of an array by its norm, in place
+
+    Rows whose norm is not larger than epsilon are left untouched. The default
+    only skips zero rows: an absolute threshold would leave the normals of the
+    small triangles of a small mesh unnormalized, and make the results depend
+    on the scale of the mesh.
+
+    :param array: (n, 3) float array to normalize
+    :param epsilon: the norm up to which a row is not normalized
+    """
+    norms = np.sqrt(np.einsum('ij,ij->i', array, array))
+    valid = norms > epsilon
+    array[valid] /= norms[valid, np.newaxis]
+    return array
+
+def format_rows(array, fmt):
+    """Formats each row of an array with a printf-style format
+
+    :param array: 2D array to format
+    :param fmt: format with one conversion per column
+    """
+    return [fmt % tuple(row) for row in array.tolist()]
+
+def fan_triangulate(corner_counts):
+    """Splits polygons into triangles (0, i, i + 1)
+
+    The corners of all the polygons are expected to be stored one after the
+    other, polygon by polygon.
+
+    :param corner_counts: number of corners of each polygon
+    :return: (n, 3) array of corner indices, and for each triangle the index of
+    the polygon it comes from
+    """
+    corner_counts = np.asarray(corner_counts, dtype=np.int64)
+    if (corner_counts == 3).all():
+        return np.arange(3 * len(corner_counts)).reshape(-1, 3), np.arange(len(corner_counts))
+
+    first_corners = np.cumsum(corner_counts) - corner_counts
+    triangle_counts = np.maximum(corner_counts - 2, 0)
+
+    polygons = np.repeat(np.arange(len(corner_counts)), triangle_counts)
+    first_triangles = np.cumsum(triangle_counts) - triangle_counts
+    local = np.arange(len(polygons)) - first_triangles[polygons]
+
+    first = first_corners[polygons]
+    triangles = np.stack((first, first + local + 1, first + local + 2), axis=1)
+    return triangles, polygons
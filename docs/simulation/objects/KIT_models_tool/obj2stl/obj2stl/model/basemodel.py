@@ -1,6 +1,9 @@
 from math import sqrt
+import numpy as np
 from ..geometry import Vector
+from .arrays import GrowableArray, VectorArrayView, normalize_rows, format_rows
 from .mesh import Material, MeshPart
+from .normals import vertex_normals, split_normals, triangle_cross
 
 Vertex = Vector
 TexCoord = Vertex
@@ -85,6 +88,18 @@ class Face:
 
 class ModelParser:
     """Represents a 3D model
+
+    The geometry is stored in contiguous numpy arrays: float32 vertices,
+    normals, texture coordinates and colors, and three int32 (n, 3) arrays
+    holding, for each triangle, the indices of its vertices, texture
+    coordinates and normals (-1 when not available). Each MeshPart is a range
+    of triangles bound to a single material.
+    """
+
+    PARSER_VERSION = 1
+    """Version of the parsing code, stored in the caches of the parsed models.
+    Must be bumped by every change of the output of a parser, so the caches
+    written by the previous code are not used anymore
     """
     def __init__(self, up_conversion = None):
         """Initializes the model
@@ -92,15 +107,134 @@ class ModelParser:
         :param up_conversion: couple of characters, can be y z or z y
         """
         self.up_conversion = up_conversion
-        self.vertices = []
-        self.colors = []
-        self.normals = []
-        self.tex_coords = []
+        self._vertices = GrowableArray(3)
+        self._colors = GrowableArray(3)
+        self._normals = GrowableArray(3)
+        self._tex_coords = GrowableArray(2)
+        self._face_vertices = GrowableArray(3, np.int32)
+        self._face_tex_coords = GrowableArray(3, np.int32)
+        self._face_normals = GrowableArray(3, np.int32)
+        self._bounding_box = None
         self.parts = []
         self.materials = []
         self.current_part = None
         self.path = None
 
+    @property
+    def vertex_array(self):
+        """(n, 3) float32 array of the vertices of the model
+        """
+        return self._vertices.data
+
+    @vertex_array.setter
+    def vertex_array(self, array):
+        self._vertices.set(array)
+        self._bounding_box = None
+        for part in self.parts:
+            part.reset_bounding_box()
+
+    @property
+    def normal_array(self):
+        """(n, 3) float32 array of the normals of the model
+        """
+        return self._normals.data
+
+    @normal_array.setter
+    def normal_array(self, array):
+        self._normals.set(array)
+
+    @property
+    def tex_coord_array(self):
+        """(n, 2) float32 array of the texture coordinates of the model
+        """
+        return self._tex_coords.data
+
+    @tex_coord_array.setter
+    def tex_coord_array(self, array):
+        self._tex_coords.set(array)
+
+    @property
+    def color_array(self):
+        """(n, 3) float32 array of the colors of the vertices of the model
+        """
+        return self._colors.data
+
+    @color_array.setter
+    def color_array(self, array):
+        self._colors.set(array)
+
+    @property
+    def face_array(self):
+        """(n, 3) int32 array of the vertex indices of each triangle
+        """
+        return self._face_vertices.data
+
+    @face_array.setter
+    def face_array(self, array):
+        self._face_vertices.set(array)
+        for part in self.parts:
+            part.reset_bounding_box()
+
+    @property
+    def face_tex_coord_array(self):
+        """(n, 3) int32 array of the texture coordinate indices of each triangle
+        """
+        return self._face_tex_coords.data
+
+    @face_tex_coord_array.setter
+    def face_tex_coord_array(self, array):
+        self._face_tex_coords.set(array)
+
+    @property
+    def face_normal_array(self):
+        """(n, 3) int32 array of the normal indices of each triangle
+        """
+        return self._face_normals.data
+
+    @face_normal_array.setter
+    def face_normal_array(self, array):
+        self._face_normals.set(array)
+
+    @property
+    def vertices(self):
+        """Sequence of the vertices of the model as Vector objects
+        """
+        return VectorArrayView(self._vertices)
+
+    @property
+    def normals(self):
+        """Sequence of the normals of the model as Vector objects
+        """
+        return VectorArrayView(self._normals)
+
+    @property
+    def tex_coords(self):
+        """Sequence of the texture coordinates of the model as Vector objects
+        """
+        return VectorArrayView(self._tex_coords)
+
+    @property
+    def colors(self):
+        """Sequence of the colors of the model as Vector objects
+        """
+        return VectorArrayView(self._colors)
+
+    @property
+    def face_count(self):
+        """Returns the number of triangles of the model
+        """
+        return len(self._face_vertices)
+
+    @property
+    def bounding_box(self):
+        """Axis aligned BoundingBox of the vertices of the model
+
+        Computed on first access, and again after vertices are added or set.
+        """
+        if self._bounding_box is None:
+            self._bounding_box = BoundingBox.from_array(self.vertex_array)
+        return self._bounding_box
+
     def init_textures(self):
         """Initializes the textures of the parts of the model
 
@@ -109,6 +243,18 @@ class ModelParser:
         for part in self.parts:
             part.init_texture()
 
+    def convert_up(self, array):
+        """Applies up_conversion to an array of vertices
+
+        :param array: (n, 3) array of vertices
+        """
+        if self.up_conversion is not None:
+            if self.up_conversion[0] == 'y' and self.up_conversion[1] == 'z':
+                return array[:, [1, 2, 0]]
+            elif self.up_conversion[0] == 'z' and self.up_conversion[1] == 'y':
+                return array[:, [2, 0, 1]]
+        return array
+
     def add_vertex(self, vertex):
         """Adds a vertex to the current model
 
@@ -125,28 +271,73 @@ class ModelParser:
             elif self.up_conversion[0] == 'z' and self.up_conversion[1] == 'y':
                 new_vertex = Vector(vertex.z, vertex.x, vertex.y)
 
-        self.vertices.append(new_vertex)
+        self._vertices.append((new_vertex.x, new_vertex.y, new_vertex.z))
+        self._bounding_box = None
+
+    def add_vertices(self, array):
+        """Adds several vertices to the current model
+
+        :param array: (n, 3) array of vertices to add to the model
+        """
+        self._vertices.extend(self.convert_up(np.asarray(array).reshape(-1, 3)))
+        self._bounding_box = None
 
     def add_tex_coord(self, tex_coord):
         """Adds a texture coordinate element to the current model
 
         :param tex_coord: tex_coord to add to the model
         """
-        self.tex_coords.append(tex_coord)
+        self._tex_coords.append((tex_coord.x, tex_coord.y))
+
+    def add_tex_coords(self, array):
+        """Adds several texture coordinates to the current model
+
+        :param array: (n, 2) array of texture coordinates
+        """
+        self._tex_coords.extend(array)
 
     def add_normal(self, normal):
         """Adds a normal element to the current model
 
         :param normal: normal to add to the model
         """
-        self.normals.append(normal)
+        self._normals.append((normal.x, normal.y, normal.z))
+
+    def add_normals(self, array):
+        """Adds several normals to the current model
+
+        :param array: (n, 3) array of normals
+        """
+        self._normals.extend(array)
 
     def add_color(self, color):
         """Adds a color element to the current model
 
         :param color: color to add to the model
         """
-        self.colors.append(color)
+        self._colors.append((color.x, color.y, color.z))
+
+    def add_colors(self, array):
+        """Adds several colors to the current model
+
+        :param array: (n, 3) array of colors
+        """
+        self._colors.extend(array)
+
+    def _part_for(self, material):
+        """Returns the part the faces of a material should be added to
+
+        If the material is different from the material of the current part,
+        it will create a new mesh part and update the current material.
+
+        :param material: the material of the faces to add
+        """
+        if self.current_part is None or (material != self.current_part.material and material is not None):
+            self.current_part = MeshPart(self)
+            self.current_part.material = material if material is not None else Material.DEFAULT_MATERIAL
+            self.parts.append(self.current_part)
+
+        return self.current_part
 
     def add_face(self, face):
         """Adds a face to the current model
@@ -156,12 +347,17 @@ class ModelParser:
 
         :param face: face to add to the model
         """
-        if self.current_part is None or (face.material != self.current_part.material and face.material is not None):
-            self.current_part = MeshPart(self)
-            self.current_part.material = face.material if face.material is not None else Material.DEFAULT_MATERIAL
-            self.parts.append(self.current_part)
+        self._part_for(face.material).add_face(face)
 
-        self.current_part.add_face(face)
+    def add_faces(self, vertices, tex_coords = None, normals = None, material = None):
+        """Adds several triangles sharing the same material to the model
+
+        :param vertices: (n, 3) array of vertex indices
+        :param tex_coords: (n, 3) array of texture coordinate indices, or None
+        :param normals: (n, 3) array of normal indices, or None
+        :param material: the material of the triangles
+        """
+        self._part_for(material).add_faces(vertices, tex_coords, normals)
 
     def parse_file(self, path, chunk_size = 512):
         """Sets the path of the model and parse bytes by chunk
@@ -188,59 +384,55 @@ class ModelParser:
         for part in self.parts:
             part.draw()
 
-    def generate_vbos(self):
+    def generate_vbos(self, indexed = False):
         """Generates the VBOs of each part of the model
+
+        :param indexed: if True, draw the parts with element buffers, see
+        MeshPart.vertex_buffers
         """
         for part in self.parts:
-            part.generate_vbos()
+            part.generate_vbos(indexed)
 
-    def generate_vertex_normals(self):
+    def generate_vertex_normals(self, weighting = 'area', smoothing_angle = None):
         """Generate the normals for each vertex of the model
 
-        A normal will be the average normal of the adjacent faces of a vertex.
+        A normal will be the weighted average normal of the adjacent faces of a
+        vertex.
+
+        :param weighting: 'area' to weight each face by its area, 'angle' by
+        its angle at the vertex
+        :param smoothing_angle: if not None, faces making a larger angle (in
+        degrees) are not averaged together, so that sharp edges stay sharp, and
+        vertices at the same position (texture seams) are averaged together
         """
-        self.normals = [Normal() for i in self.vertices]
+        vertices = self.vertex_array
+        faces = self.face_array
 
-        for part in self.parts:
-            for face in part.faces:
-                v1 = Vertex.from_points(self.vertices[face.a.vertex], self.vertices[face.b.vertex])
-                v2 = Vertex.from_points(self.vertices[face.a.vertex], self.vertices[face.c.vertex])
-                v1.normalize()
-                v2.normalize()
-                cross = Vertex.cross_product(v1, v2)
-                self.normals[face.a.vertex] += cross
-                self.normals[face.b.vertex] += cross
-                self.normals[face.c.vertex] += cross
-
-        for normal in self.normals:
-            normal.normalize()
+        if smoothing_angle is None:
+            self.normal_array = vertex_normals(vertices, faces, weighting)
+            self.face_normal_array = faces.copy()
+        else:
+            self.normal_array, self.face_normal_array = split_normals(vertices, faces, smoothing_angle, weighting)
 
-        for part in self.parts:
-            for face in part.faces:
-                face.a.normal = face.a.vertex
-                face.b.normal = face.b.vertex
-                face.c.normal = face.c.vertex
+    def compute_face_normals(self, start = 0, end = None):
+        """Returns the unit normals of a range of triangles of the model
+
+        Unlike generate_face_normals, the model is not modified.
+
+        :param start: index of the first triangle
+        :param end: index after the last triangle, None for the last one
+        """
+        return normalize_rows(triangle_cross(self.vertex_array, self.face_array[start:end]).astype(np.float32))
 
     def generate_face_normals(self):
         """Generate the normals for each face of the model
 
         A normal will be the normal of the face
         """
-        # Build array of faces
-        faces = sum(map(lambda x: x.faces, self.parts), [])
-        self.normals = [Normal()] * len(faces)
-
-        for (index, face) in enumerate(faces):
+        faces = self.face_array
 
-            v1 = Vertex.from_points(self.vertices[face.a.vertex], self.vertices[face.b.vertex])
-            v2 = Vertex.from_points(self.vertices[face.a.vertex], self.vertices[face.c.vertex])
-            cross = Vertex.cross_product(v1, v2)
-            cross.normalize()
-            self.normals[index] = cross
-
-            face.a.normal = index
-            face.b.normal = index
-            face.c.normal = index
+        self.normal_array = self.compute_face_normals()
+        self.face_normal_array = np.repeat(np.arange(len(faces), dtype=np.int32)[:, np.newaxis], 3, axis=1)
 
     def get_material_index(self, material):
         """Finds the index of the given material
@@ -257,7 +449,7 @@ class TextModelParser(ModelParser):
         """
         self.path = path
         with open(path) as f:
-            for line in f.readlines():
+            for line in f:
                 line = line.rstrip()
                 if line != '':
                     self.parse_line(line)
@@ -277,6 +469,16 @@ class BoundingBox:
         self.max_y = -float('inf')
         self.max_z = -float('inf')
 
+    @classmethod
+    def from_array(cls, array):
+        """Creates the bounding box of an array of points
+
+        :param array: (n, 3) array of points
+        """
+        bounding_box = cls()
+        bounding_box.add_array(array)
+        return bounding_box
+
     def add(self, vector):
         """Adds a vector to a bounding box
 
@@ -293,6 +495,19 @@ class BoundingBox:
         self.max_y = max(self.max_y, vector.y)
         self.max_z = max(self.max_z, vector.z)
 
+    def add_array(self, array):
+        """Adds all the rows of an array to a bounding box
+
+        :param array: (n, 3) array of points that will enlarge the bounding box
+        """
+        if len(array) == 0:
+            return
+
+        low = array.min(axis=0)
+        high = array.max(axis=0)
+        self.add(Vertex(*low.tolist()))
+        self.add(Vertex(*high.tolist()))
+
     def __str__(self):
         """Returns a string that represents the bounding box
         """
@@ -312,6 +527,14 @@ class BoundingBox:
             (self.min_y + self.max_y) / 2,
             (self.min_z + self.max_z) / 2)
 
+    def get_size(self):
+        """Returns the lengths of the edges of the bounding box
+        """
+        return Vertex(
+            self.max_x - self.min_x,
+            self.max_y - self.min_y,
+            self.max_z - self.min_z)
+
     def get_scale(self):
         """Returns the maximum edge of the bounding box
         """
@@ -323,7 +546,15 @@ class BoundingBox:
 
 class Exporter:
     """Represents an object that can export a model into a certain format
+
+    Subclasses implement chunks, so that the exported model can be streamed
+    to a file without being held in memory as a whole.
+    """
+
+    CHUNK_SIZE = 1 << 16
+    """Maximum number of rows (vertices, faces...) formatted at once
     """
+
     def __init__(self, model):
         """Creates a exporter for the model
 
@@ -331,4 +562,39 @@ class Exporter:
         """
         self.model = model
 
+    def chunks(self):
+        """Yields the exported model as a sequence of strings
+        """
+        raise NotImplementedError()
+
+    def format_chunks(self, array, fmt):
+        """Yields the rows of an array formatted CHUNK_SIZE rows at a time
+
+        :param array: 2D array to format
+        :param fmt: format with one conversion per column
+        """
+        for start in range(0, len(array), self.CHUNK_SIZE):
+            yield ''.join(format_rows(array[start:start + self.CHUNK_SIZE], fmt))
+
+    def write(self, f):
+        """Writes the exported model in a file object, chunk by chunk
+
+        :param f: the file object to write to
+        """
+        for chunk in self.chunks():
+            f.write(chunk)
+
+    def export_to_path(self, path):
+        """Writes the exported model in a file
+
+        :param path: path to the file to write
+        """
+        with open(path, 'w') as f:
+            self.write(f)
+
+    def __str__(self):
+        """Exports the model
+        """
+        return ''.join(self.chunks())
+
 
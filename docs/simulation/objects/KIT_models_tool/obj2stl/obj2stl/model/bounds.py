@@ -0,0 +1,51 @@
+import collections
+import numpy as np
+
+OrientedBoundingBox = collections.namedtuple('OrientedBoundingBox', ['center', 'axes', 'extents'])
+"""Box of a given center, whose edges are parallel to the rows of axes (a
+rotation matrix) and have the lengths of extents, from the longest to the
+shortest
+"""
+
+def oriented_bounding_box(vertices):
+    """Returns an oriented bounding box of a set of points
+
+    The axes of the box are the principal axes of the points, so the box is
+    tight for elongated shapes, but not always the smallest one.
+
+    :param vertices: (n, 3) array of points
+    :return: an OrientedBoundingBox
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    mean = vertices.mean(axis=0)
+    centered = vertices - mean
+
+    # eigenvectors of the covariance, from the largest variance to the smallest
+    _, eigenvectors = np.linalg.eigh(centered.T @ centered)
+    axes = eigenvectors[:, ::-1].T
+    axes[2] = np.cross(axes[0], axes[1])
+
+    projected = centered @ axes.T
+    low = projected.min(axis=0)
+    high = projected.max(axis=0)
+    extents = high - low
+
+    # the variance order does not always match the extent order
+    order = np.argsort(-extents, kind='stable')
+    axes, low, high, extents = axes[order], low[order], high[order], extents[order]
+    if np.linalg.det(axes) < 0:
+        axes[2] = -axes[2]
+        low[2], high[2] = -high[2], -low[2]
+
+    center = mean + ((low + high) / 2) @ axes
+    return OrientedBoundingBox(center, axes, extents)
+
+def horizontal_radius(vertices, center = (0, 0)):
+    """Returns the largest horizontal distance between a center and a set of
+    points, the radius of the vertical cylinder containing them
+
+    :param vertices: (n, 3) array of points
+    :param center: (x, y) of the axis of the cylinder
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    return float(np.sqrt(((vertices[:, :2] - center) ** 2).sum(axis=1).max()))
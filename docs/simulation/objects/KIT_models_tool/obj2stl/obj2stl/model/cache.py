@@ -0,0 +1,210 @@
+import os
+import json
+import struct
+
+import numpy as np
+
+from ..geometry import Vector
+from .mesh import Material, MeshPart
+
+CACHE_SUFFIX = '.o2scache'
+"""Suffix added to the path of a model to get the path of its cache
+"""
+
+MAGIC = b'O2SCACHE'
+VERSION = 1
+"""Version of the layout of a cache file, the version of the parser of a model
+is checked separately (ModelParser.PARSER_VERSION)
+"""
+ALIGNMENT = 64
+"""Offset alignment of the arrays in a cache file, in bytes
+"""
+
+ARRAY_NAMES = (
+    'vertex_array', 'normal_array', 'tex_coord_array', 'color_array',
+    'face_array', 'face_tex_coord_array', 'face_normal_array',
+)
+"""Properties of a ModelParser stored in a cache
+"""
+
+# A cache file is the magic, the version and the length of a JSON header,
+# the header, and the raw arrays, each starting at a multiple of ALIGNMENT.
+# The header gives the offset (from the end of the header, aligned), dtype
+# and shape of each array, the parts and materials of the model, the class,
+# version and options of its parser, and the size and mtime of its source files.
+_prefix = struct.Struct('<8sIQ')
+
+def cache_path(path):
+    """Returns the path of the cache of a model
+
+    :param path: path of the model
+    """
+    return path + CACHE_SUFFIX
+
+def source_files(model):
+    """Returns the paths of the files a model was parsed from, the model itself
+    and its .mtl file if any
+
+    :param model: the parsed model
+    """
+    paths = [model.path]
+    mtl = getattr(model, 'mtl', None)
+    if mtl is not None and getattr(mtl, 'path', None) is not None:
+        paths.append(mtl.path)
+    return paths
+
+def _stat(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def _encode_color(value):
+    if isinstance(value, Vector):
+        return [value.x, value.y, value.z]
+    return value
+
+def _decode_color(value):
+    if isinstance(value, list):
+        return Vector(*value)
+    return value
+
+def _encode_materials(model):
+    """Returns the materials of the model and of its parts, and the index of
+    the material of each part (-1 for the default material, None for none)
+    """
+    materials = list(model.materials)
+    indices = []
+    for part in model.parts:
+        if part.material is None:
+            indices.append(None)
+        elif part.material is Material.DEFAULT_MATERIAL:
+            indices.append(-1)
+        else:
+            if not any(material is part.material for material in materials):
+                materials.append(part.material)
+            indices.append(next(i for (i, material) in enumerate(materials) if material is part.material))
+
+    table = [{
+        'name': material.name,
+        'Ka': _encode_color(material.Ka),
+        'Kd': _encode_color(material.Kd),
+        'Ks': _encode_color(material.Ks),
+        'relative_path_to_texture': material.relative_path_to_texture,
+        'absolute_path_to_texture': material.absolute_path_to_texture,
+    } for material in materials]
+    return table, indices
+
+def write_cache(model, path = None, options = None):
+    """Writes the cache of a parsed model
+
+    The cache is written to a temporary file renamed over the previous one,
+    so processes reading the previous cache are not disturbed.
+
+    :param model: the parsed model, whose path is set
+    :param path: path of the cache, defaults to cache_path(model.path)
+    :param options: the options the parser was created with, like weld
+    """
+    if path is None:
+        path = cache_path(model.path)
+
+    materials, part_materials = _encode_materials(model)
+    header = {
+        'sources': [[os.path.abspath(source)] + _stat(source) for source in source_files(model)],
+        'up_conversion': None if model.up_conversion is None else list(model.up_conversion),
+        'parser': [type(model).__name__, model.PARSER_VERSION],
+        'options': options or {},
+        'materials': materials,
+        'model_materials': len(model.materials),
+        'parts': [[part.start, part.end, material] for (part, material) in zip(model.parts, part_materials)],
+        'arrays': {},
+    }
+
+    arrays = [np.ascontiguousarray(getattr(model, name)) for name in ARRAY_NAMES]
+    offset = 0
+    for (name, array) in zip(ARRAY_NAMES, arrays):
+        header['arrays'][name] = [offset, array.dtype.newbyteorder('<').str, list(array.shape)]
+        offset = _align(offset + array.nbytes)
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = _align(_prefix.size + len(header_bytes))
+
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_prefix.pack(MAGIC, VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            for (name, array) in zip(ARRAY_NAMES, arrays):
+                f.seek(data_start + header['arrays'][name][0])
+                f.write(array.astype(array.dtype.newbyteorder('<'), copy=False).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def read_cache(model, path, options = None):
+    """Fills a model from its cache if the cache is fresh
+
+    The arrays of the model are memory-mapped read-only, so opening a cache
+    costs nearly nothing and the pages are shared by all the processes that
+    open it.
+
+    :param model: an empty model, of the type of the source file
+    :param path: path of the source file of the model
+    :param options: the options the parser was created with, like weld
+    :return: True if the model was read from the cache, False if the cache is
+    missing or stale
+    """
+    try:
+        with open(cache_path(path), 'rb') as f:
+            magic, version, header_size = _prefix.unpack(f.read(_prefix.size))
+            if magic != MAGIC or version != VERSION:
+                return False
+            header = json.loads(f.read(header_size).decode('utf-8'))
+    except (OSError, ValueError, struct.error):
+        return False
+
+    up_conversion = None if model.up_conversion is None else list(model.up_conversion)
+    if header['up_conversion'] != up_conversion or header['options'] != (options or {}):
+        return False
+    if header.get('parser') != [type(model).__name__, model.PARSER_VERSION]:
+        return False
+    try:
+        if any(_stat(source) != [size, mtime] for (source, size, mtime) in header['sources']):
+            return False
+    except OSError:
+        return False
+
+    model.path = path
+    data_start = _align(_prefix.size + header_size)
+    for (name, (offset, dtype, shape)) in header['arrays'].items():
+        if np.prod(shape) == 0:
+            array = np.empty(shape, dtype=dtype)
+        else:
+            array = np.memmap(cache_path(path), dtype=dtype, mode='r', offset=data_start + offset, shape=tuple(shape))
+        setattr(model, name, array)
+
+    materials = []
+    for entry in header['materials']:
+        material = Material(entry['name'])
+        material.Ka = _decode_color(entry['Ka'])
+        material.Kd = _decode_color(entry['Kd'])
+        material.Ks = _decode_color(entry['Ks'])
+        material.relative_path_to_texture = entry['relative_path_to_texture']
+        material.absolute_path_to_texture = entry['absolute_path_to_texture']
+        materials.append(material)
+    # the materials of the parts that are not materials of the model come last
+    model.materials = materials[:header['model_materials']]
+
+    for (start, end, material) in header['parts']:
+        part = MeshPart(model)
+        part.start, part.end = start, end
+        if material == -1:
+            part.material = Material.DEFAULT_MATERIAL
+        elif material is not None:
+            part.material = materials[material]
+        model.parts.append(part)
+    model.current_part = model.parts[-1] if len(model.parts) > 0 else None
+    return True
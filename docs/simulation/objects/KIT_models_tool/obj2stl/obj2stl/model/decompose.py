@@ -0,0 +1,389 @@
+import numpy as np
+
+from .basemodel import ModelParser
+
+def convex_hull(points, max_vertices = None, tolerance = 1e-9):
+    """Returns the convex hull of points, computed with quickhull
+
+    The farthest point is added first, so stopping at max_vertices gives the
+    hull of the most significant points, inside the real hull.
+
+    :param points: (n, 3) array of points
+    :param max_vertices: maximum number of vertices of the hull, or None
+    :param tolerance: distance under which points are considered on the hull,
+    relative to the size of the points
+    :return: the vertices of the hull, and its triangles, counterclockwise
+    seen from the outside
+    :raises ValueError: when the points are all on a plane
+    """
+    # Repeated points are never farther than eps from the hull, so they are ignored
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) < 4:
+        raise ValueError('a convex hull needs at least 4 points')
+    eps = tolerance * max(np.ptp(points, axis=0).max(), 1e-300)
+
+    # Initial tetrahedron: the farthest points along an axis, then from the
+    # line between them, then from the plane of the three
+    axis = np.argmax(np.ptp(points, axis=0))
+    i0, i1 = np.argmin(points[:, axis]), np.argmax(points[:, axis])
+    line = _unit(points[i1] - points[i0])
+    offsets = points - points[i0]
+    i2 = np.argmax(np.linalg.norm(offsets - np.outer(offsets @ line, line), axis=1))
+    normal = _unit(np.cross(points[i1] - points[i0], points[i2] - points[i0]))
+    heights = offsets @ normal
+    i3 = np.argmax(np.abs(heights))
+    if abs(heights[i3]) <= eps:
+        raise ValueError('points are on a plane')
+
+    faces = np.array([[i0, i1, i2], [i0, i3, i1], [i1, i3, i2], [i2, i3, i0]])
+    if heights[i3] > 0:
+        faces = faces[:, ::-1]
+    normals, distances = _planes(points, faces)
+
+    outside = np.ones(len(points), dtype=bool)
+    outside[faces] = False
+    outside = np.flatnonzero(outside)
+    vertex_count = 4
+    while len(outside) > 0 and (max_vertices is None or vertex_count < max_vertices):
+        farthest = (points[outside] @ normals.T - distances).max(axis=1)
+        above = farthest > eps
+        outside, farthest = outside[above], farthest[above]
+        if len(outside) == 0:
+            break
+        best = np.argmax(farthest)
+        apex = outside[best]
+
+        # The horizon is made of the edges of visible triangles whose other
+        # triangle is not visible, the new triangles join it to the apex
+        visible = points[apex] @ normals.T - distances > eps
+        edges = faces[visible][:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+        shared = ((edges[:, np.newaxis, 0] == edges[np.newaxis, :, 1])
+                  & (edges[:, np.newaxis, 1] == edges[np.newaxis, :, 0])).any(axis=1)
+        horizon = edges[~shared]
+
+        new_faces = np.empty((len(horizon), 3), dtype=faces.dtype)
+        new_faces[:, :2] = horizon
+        new_faces[:, 2] = apex
+        new_normals, new_distances = _planes(points, new_faces)
+        faces = np.concatenate((faces[~visible], new_faces))
+        normals = np.concatenate((normals[~visible], new_normals))
+        distances = np.concatenate((distances[~visible], new_distances))
+
+        outside[best] = outside[-1]
+        outside = outside[:-1]
+        vertex_count += 1
+
+    used, faces = np.unique(faces, return_inverse=True)
+    return points[used], faces.reshape(-1, 3)
+
+def hull_volume(vertices, faces):
+    """Returns the volume enclosed by a closed triangle mesh
+
+    :param vertices: (n, 3) array of vertices
+    :param faces: (m, 3) array of triangles, counterclockwise seen from the outside
+    """
+    p0, p1, p2 = vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+    return np.einsum('ij,ij->i', p0, np.cross(p1, p2)).sum() / 6
+
+def _unit(vectors):
+    """Returns vectors divided by their norm, zero vectors staying zero
+    """
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1)
+
+def _planes(points, faces):
+    """Returns the unit normals and the distances to the origin of the planes
+    of triangles
+    """
+    p0 = points[faces[:, 0]]
+    e1, e2 = points[faces[:, 1]] - p0, points[faces[:, 2]] - p0
+    normals = e1[:, [1, 2, 0]] * e2[:, [2, 0, 1]] - e1[:, [2, 0, 1]] * e2[:, [1, 2, 0]]
+    norms = np.sqrt((normals * normals).sum(axis=1))
+    normals /= np.where(norms > 0, norms, 1)[:, np.newaxis]
+    return normals, (normals * p0).sum(axis=1)
+
+class ConvexDecomposer:
+    """Decomposes a mesh into convex hulls, in the manner of V-HACD
+
+    The inside of the mesh is voxelized, then the voxels are split
+    recursively by axis aligned planes. The part whose convex hull is the
+    most concave (largest volume of its hull outside of its voxels) is split
+    first, by the plane that makes the two halves the least concave, until
+    every part is convex enough or the number of hulls is reached.
+
+    The hull of each part is built from points sampled on the surface of the
+    mesh and from the corners of the voxels fully inside the mesh, so that it
+    does not grow out of the mesh.
+    """
+
+    PLANES = 8
+    """Number of split planes tried along each axis, before refining the best one
+    """
+
+    BALANCE_WEIGHT = 0.05
+    """Weight of the difference of volume of the two parts of a split, relative
+    to the volume of the mesh
+    """
+
+    AXIS_MARGIN = 0.05
+    """Relative decrease of cost needed to split along a shorter axis
+    """
+
+    MIN_VOLUME = 0.01
+    """Smallest part that can be split off, relative to the volume of the mesh
+    """
+
+    def __init__(self, model, resolution = 32, max_hulls = 16, concavity = 0.02, max_vertices = 64):
+        """Prepares the decomposition of a model
+
+        :param model: the ModelParser to decompose, it is not modified
+        :param resolution: number of voxels along the longest side of the model
+        :param max_hulls: maximum number of convex hulls
+        :param concavity: concavity (volume of the hull outside of the mesh,
+        relative to the volume of the mesh) under which a part is not split
+        :param max_vertices: maximum number of vertices of each hull
+        """
+        self.model = model
+        self.resolution = resolution
+        self.max_hulls = max_hulls
+        self.concavity = concavity
+        self.max_vertices = max_vertices
+        self.voxelize()
+
+    def voxelize(self):
+        """Finds the voxels touched by the surface of the mesh, and the voxels
+        inside of it
+
+        The voxels that cannot be reached from the border of the grid without
+        going through the surface are inside. A hole smaller than a voxel does
+        not let the outside in.
+        """
+        vertices = self.model.vertex_array.astype(np.float64)
+        faces = self.model.face_array
+        if len(faces) == 0:
+            raise ValueError('the model has no triangles')
+
+        low = vertices.min(axis=0)
+        extent = np.ptp(vertices, axis=0)
+        self.size = max(extent.max(), 1e-300) / self.resolution
+        # One empty layer of voxels around the mesh
+        self.origin = low - self.size
+        shape = np.floor(extent / self.size).astype(int) + 3
+
+        self.samples = self.surface_samples(vertices, faces, self.size / 2)
+        self.sample_cells = np.clip(np.floor((self.samples - self.origin) / self.size).astype(int), 0, shape - 1)
+        surface = np.zeros(shape, dtype=bool)
+        surface[tuple(self.sample_cells.T)] = True
+
+        outside = np.zeros(shape, dtype=bool)
+        outside[[0, -1], :, :] = outside[:, [0, -1], :] = outside[:, :, [0, -1]] = True
+        outside &= ~surface
+        while True:
+            grown = outside
+            for axis in range(3):
+                grown = self.propagate(grown, ~surface, axis)
+            if (grown == outside).all():
+                break
+            outside = grown
+
+        self.surface = surface
+        self.solid = ~outside
+
+    @staticmethod
+    def surface_samples(vertices, faces, spacing):
+        """Returns points on the triangles, less than spacing away from each other
+
+        :param vertices: (n, 3) array of vertices
+        :param faces: (m, 3) array of triangles
+        :param spacing: maximum distance between the samples of a triangle
+        """
+        p0, p1, p2 = vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+        lengths = np.stack([np.linalg.norm(p1 - p0, axis=1), np.linalg.norm(p2 - p1, axis=1),
+                            np.linalg.norm(p0 - p2, axis=1)], axis=1).max(axis=1)
+        divisions = np.maximum(np.ceil(lengths / spacing).astype(int), 1)
+
+        samples = []
+        for n in np.unique(divisions):
+            # Barycentric grid of the triangles divided n times
+            i, j = np.nonzero(np.add.outer(np.arange(n + 1), np.arange(n + 1)) <= n)
+            u, v = i / n, j / n
+            triangles = np.flatnonzero(divisions == n)
+            a, b, c = p0[triangles], p1[triangles], p2[triangles]
+            samples.append((a[:, np.newaxis] + u[:, np.newaxis] * (b - a)[:, np.newaxis]
+                            + v[:, np.newaxis] * (c - a)[:, np.newaxis]).reshape(-1, 3))
+        return np.concatenate(samples)
+
+    @staticmethod
+    def propagate(reached, free, axis):
+        """Extends reached voxels along an axis, through runs of free voxels
+
+        :param reached: boolean grid of the reached voxels
+        :param free: boolean grid of the voxels that can be crossed
+        :param axis: axis along which voxels are extended
+        """
+        reached = np.moveaxis(reached, axis, -1)
+        free = np.moveaxis(free, axis, -1)
+        rows, length = int(np.prod(free.shape[:-1])), free.shape[-1]
+
+        # Each run of free voxels of a row gets its own number
+        runs = np.cumsum(~free, axis=-1).reshape(rows, length) + (length + 1) * np.arange(rows)[:, np.newaxis]
+        runs = runs.reshape(free.shape)
+        reached_runs = np.bincount(runs[reached & free], minlength=rows * (length + 1)) > 0
+        return np.moveaxis(reached | (free & reached_runs[runs]), -1, axis)
+
+    @staticmethod
+    def column_extremes(points, width):
+        """Returns the lowest and highest points of each vertical column of
+        points, the only ones that can be on their convex hull (up to width)
+
+        :param points: (n, 3) array of points
+        :param width: width of the columns
+        """
+        if len(points) == 0:
+            return points
+        columns = np.floor(points[:, :2] / width).astype(np.int64)
+        columns -= columns.min(axis=0)
+        keys = columns[:, 0] * (columns[:, 1].max() + 1) + columns[:, 1]
+        order = np.lexsort((points[:, 2], keys))
+        starts = np.flatnonzero(np.diff(keys[order], prepend=-1))
+        ends = np.append(starts[1:], len(order)) - 1
+        return points[order[np.concatenate((starts, ends))]]
+
+    def voxel_hull(self, cells):
+        """Returns the convex hull of voxels, in voxel units
+
+        Only the top and bottom voxels of each column can be on the hull.
+
+        :param cells: (n, 3) array of voxel coordinates
+        """
+        width = cells[:, 1].max() + 1
+        keys, inverse = np.unique(cells[:, 0] * width + cells[:, 1], return_inverse=True)
+        columns = np.column_stack((keys // width, keys % width))
+        bottom = np.full(len(columns), cells[:, 2].max())
+        top = np.full(len(columns), cells[:, 2].min())
+        np.minimum.at(bottom, inverse, cells[:, 2])
+        np.maximum.at(top, inverse, cells[:, 2])
+
+        corners = [np.column_stack((columns + offset, heights))
+                   for offset in ((0, 0), (0, 1), (1, 0), (1, 1)) for heights in (bottom, top + 1)]
+        return convex_hull(np.concatenate(corners))
+
+    def part_concavity(self, cells):
+        """Returns the volume of the convex hull of voxels outside of them,
+        relative to the volume of the mesh
+        """
+        return (hull_volume(*self.voxel_hull(cells)) - len(cells)) / self.volume
+
+    def best_split(self, cells):
+        """Returns the two parts of the best split of voxels, and their concavities
+
+        The cost of a split is the concavity of its two parts, plus a balance
+        term favoring parts of similar volumes. The axes are tried from the
+        longest to the shortest one, and a shorter axis has to be clearly
+        better, so that long parts are cut across rather than sliced.
+
+        :param cells: (n, 3) array of voxel coordinates
+        :return: the parts and their concavities, or None if the voxels cannot
+        be split
+        """
+        best = None
+        minimum = max(1, int(self.MIN_VOLUME * self.volume))
+
+        def evaluate(axis, plane, margin):
+            nonlocal best
+            below = cells[:, axis] < plane
+            count = np.count_nonzero(below)
+            if min(count, len(cells) - count) < minimum:
+                return
+            parts = (cells[below], cells[~below])
+            concavities = [self.part_concavity(part) for part in parts]
+            cost = sum(concavities) + self.BALANCE_WEIGHT * abs(len(cells) - 2 * count) / self.volume
+            if best is None or cost < best[0] - margin:
+                best = (cost, axis, plane, parts, concavities)
+
+        low, high = cells.min(axis=0), cells.max(axis=0)
+        steps = np.maximum(1, np.ceil((high - low) / self.PLANES).astype(int))
+        for axis in np.argsort(low - high, kind='stable'):
+            margin = 0 if best is None else self.AXIS_MARGIN * best[0]
+            for plane in range(low[axis] + steps[axis], high[axis] + 1, steps[axis]):
+                evaluate(axis, plane, margin)
+
+        if best is None:
+            return None
+
+        # Refines the plane around the best one
+        axis, plane = best[1], best[2]
+        step = steps[axis]
+        for fine_plane in range(max(low[axis] + 1, plane - step + 1), min(high[axis] + 1, plane + step), max(1, step // 4)):
+            if fine_plane != plane:
+                evaluate(axis, fine_plane, 0)
+
+        return best[3], best[4]
+
+    def decompose(self):
+        """Returns the parts of the decomposition, as arrays of voxel coordinates
+        """
+        parts = [np.argwhere(self.solid)]
+        self.volume = len(parts[0])
+        concavities = [self.part_concavity(parts[0])]
+
+        while len(parts) < self.max_hulls:
+            worst = int(np.argmax(concavities))
+            if concavities[worst] <= self.concavity:
+                break
+            split = self.best_split(parts[worst])
+            if split is None:
+                concavities[worst] = 0
+                continue
+            parts[worst:worst + 1] = split[0]
+            concavities[worst:worst + 1] = split[1]
+
+        return parts
+
+    def hulls(self):
+        """Returns the convex hulls of the parts, as (vertices, faces) tuples
+        """
+        parts = self.decompose()
+        labels = np.full(self.solid.shape, -1)
+        for (label, cells) in enumerate(parts):
+            labels[tuple(cells.T)] = label
+        sample_labels = labels[tuple(self.sample_cells.T)]
+
+        hulls = []
+        for (label, cells) in enumerate(parts):
+            inside = cells[~self.surface[tuple(cells.T)]]
+            points = [self.column_extremes(self.samples[sample_labels == label], self.size / 4)]
+            if len(inside) > 0:
+                points.append(self.voxel_hull(inside)[0] * self.size + self.origin)
+            try:
+                hulls.append(convex_hull(np.concatenate(points), self.max_vertices))
+            except ValueError:
+                # Flat parts get the hull of their voxels
+                vertices, faces = self.voxel_hull(cells)
+                hulls.append((vertices * self.size + self.origin, faces))
+        return hulls
+
+    def build_models(self):
+        """Returns one new model per convex hull
+        """
+        models = []
+        for (vertices, faces) in self.hulls():
+            model = ModelParser()
+            model.path = self.model.path
+            model.vertex_array = vertices
+            model.add_faces(faces)
+            models.append(model)
+        return models
+
+def decompose(model, resolution = 32, max_hulls = 16, concavity = 0.02, max_vertices = 64):
+    """Returns the convex hulls of an approximate convex decomposition of a
+    model, as a list of models
+
+    :param model: the model to decompose
+    :param resolution: number of voxels along the longest side of the model
+    :param max_hulls: maximum number of convex hulls
+    :param concavity: concavity (volume of the hull outside of the mesh,
+    relative to the volume of the mesh) under which a part is not split
+    :param max_vertices: maximum number of vertices of each hull
+    """
+    return ConvexDecomposer(model, resolution, max_hulls, concavity, max_vertices).build_models()
@@ -1,8 +1,11 @@
 from ..basemodel import TextModelParser, Exporter, Vertex, TexCoord, Normal, FaceVertex, Face
 from ..mesh import Material, MeshPart
+from ..arrays import fan_triangulate
 from functools import reduce
 import os.path
 import sys
+import warnings
+import numpy as np
 
 
 def is_obj(filename):
@@ -13,8 +16,47 @@ def is_obj(filename):
     """
     return filename[-4:] == '.obj'
 
+def _parse_numbers(text, dtype):
+    """Converts whitespace separated numbers with a single numpy call
+
+    :param text: bytes of the text to convert
+    :param dtype: type of the numbers
+    :return: 1D array of the numbers, or None if the text is not only numbers
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=dtype, sep=' ')
+        except ValueError:
+            return None
+
+# Kinds of the lines of a .obj file, for the bulk parser
+_OTHER, _VERTEX, _TEX_COORD, _NORMAL, _FACE, _SKIP = range(6)
+_SPACE, _TAB, _NEWLINE, _HASH, _SLASH = b' \t\n#/'
+# Presence of the vertex, texture coordinate and normal indices of a face
+# corner, by twice its number of slashes plus its number of double slashes
+_FACE_LAYOUTS = {
+    0: (True, False, False),
+    2: (True, True, False),
+    4: (True, True, True),
+    5: (True, False, True),
+}
+
 class OBJParser(TextModelParser):
     """Parser that parses a .obj file
+
+    parse_file reads the file by large blocks and converts the v, vt, vn and f
+    records of each block with numpy. The other records (usemtl, mtllib...)
+    and the records the bulk parser does not understand go through parse_line.
+    """
+
+    PARSER_VERSION = 2
+    """Version of the parsing code, 2 since the face runs mixing corner
+    layouts are split
+    """
+
+    BLOCK_SIZE = 1 << 24
+    """Number of bytes read at once by parse_file
     """
 
     def __init__(self, up_conversion = None):
@@ -23,6 +65,192 @@ class OBJParser(TextModelParser):
         self.mtl = None
         self.vertex_offset = 0
 
+    def parse_file(self, path):
+        """Sets the path of the model and parses the file block by block
+
+        :param path: path to the .obj file to parse
+        """
+        self.path = path
+        remainder = b''
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(self.BLOCK_SIZE)
+                if block == b'':
+                    break
+                block = remainder + block
+                end = block.rfind(b'\n') + 1
+                remainder = block[end:]
+                if end > 0:
+                    self.parse_block(block[:end])
+
+        if remainder.strip() != b'':
+            self.parse_block(remainder + b'\n')
+
+    def parse_block(self, block):
+        """Parses bytes made of complete lines of a .obj file
+
+        Consecutive lines with the same keyword are grouped into runs, and each
+        run is converted with a single numpy call.
+
+        :param block: bytes ending with a newline
+        """
+        buffer = np.frombuffer(block, dtype=np.uint8).copy()
+
+        ends = np.flatnonzero(buffer == _NEWLINE)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        last = len(buffer) - 1
+        c0 = buffer[starts]
+        c1 = buffer[np.minimum(starts + 1, last)]
+        c2 = buffer[np.minimum(starts + 2, last)]
+
+        def is_space(c):
+            return (c == _SPACE) | (c == _TAB)
+
+        kinds = np.full(len(starts), _OTHER, dtype=np.int8)
+        kinds[(c0 == ord('v')) & is_space(c1)] = _VERTEX
+        kinds[(c0 == ord('v')) & (c1 == ord('t')) & is_space(c2)] = _TEX_COORD
+        kinds[(c0 == ord('v')) & (c1 == ord('n')) & is_space(c2)] = _NORMAL
+        kinds[(c0 == ord('f')) & is_space(c1)] = _FACE
+        kinds[(c0 == _NEWLINE) | (c0 == _HASH)] = _SKIP
+
+        # Blank comments so that they can sit in the middle of a run
+        for (comment_start, comment_end) in zip(starts[c0 == _HASH], ends[c0 == _HASH]):
+            buffer[comment_start:comment_end] = _SPACE
+
+        # Remove the keywords: 1 byte for v and f, 2 bytes for vt and vn
+        buffer[starts[(kinds == _VERTEX) | (kinds == _FACE)]] = _SPACE
+        buffer[starts[(kinds == _TEX_COORD) | (kinds == _NORMAL)]] = _SPACE
+        buffer[starts[(kinds == _TEX_COORD) | (kinds == _NORMAL)] + 1] = _SPACE
+
+        # Count the corners or the coordinates of each line: a token starts
+        # at each printable byte that follows a separator (space or control
+        # character)
+        separator = buffer <= _SPACE
+        token_starts = np.flatnonzero(separator[:-1] > separator[1:]) + 1
+        if not separator[0]:
+            token_starts = np.concatenate(([0], token_starts))
+        counts = np.diff(np.searchsorted(token_starts, np.append(starts, len(buffer))))
+
+        # Skipped lines join the run of the previous line
+        previous = np.where(kinds != _SKIP, np.arange(len(kinds)), 0)
+        kinds = kinds[np.maximum.accumulate(previous)]
+
+        changes = np.flatnonzero(kinds[1:] != kinds[:-1]) + 1
+        for (first, last) in zip(np.concatenate(([0], changes)), np.concatenate((changes, [len(kinds)]))):
+            kind = kinds[first]
+            run = slice(starts[first], ends[last - 1] + 1)
+            run_counts = counts[first:last]
+            run_counts = run_counts[run_counts > 0]
+
+            if kind == _SKIP or len(run_counts) == 0:
+                continue
+
+            run_tokens = token_starts[np.searchsorted(token_starts, run.start):np.searchsorted(token_starts, run.stop)]
+            if kind == _OTHER or not self.parse_run(kind, buffer[run], run_counts, run_tokens - run.start):
+                for line in bytes(block[run]).decode('utf-8', 'replace').split('\n'):
+                    line = line.rstrip()
+                    if line != '':
+                        self.parse_line(line)
+
+    def parse_run(self, kind, buffer, counts, token_starts):
+        """Converts consecutive v, vt, vn or f lines with numpy
+
+        :param kind: the kind of all the lines of the run
+        :param buffer: the bytes of the lines, keywords replaced by spaces
+        :param counts: the number of tokens of each non empty line
+        :param token_starts: the offset of each token in buffer
+        :return: False if the lines could not be converted, in which case
+        nothing has been added to the model
+        """
+        if kind == _FACE:
+            return self.parse_face_run(buffer, counts, token_starts)
+
+        width = counts[0]
+        values = _parse_numbers(buffer.tobytes(), np.float32)
+        if values is None or (counts != width).any() or len(values) != width * len(counts):
+            return False
+        values = values.reshape(-1, width)
+
+        if kind == _VERTEX and width >= 3:
+            self.add_vertices(values[:, :3])
+        elif kind == _TEX_COORD and width >= 2:
+            self.add_tex_coords(values[:, :2])
+        elif kind == _NORMAL and width >= 3:
+            self.add_normals(values[:, :3])
+        else:
+            return False
+        return True
+
+    def parse_face_run(self, buffer, counts, token_starts):
+        """Converts consecutive f lines into triangles
+
+        Polygons are split in fans of triangles, and negative indices are
+        resolved with the number of elements defined before the run.
+
+        :param buffer: the bytes of the lines, the f replaced by spaces
+        :param counts: the number of corners of each non empty line
+        :param token_starts: the offset of each corner in buffer
+        :return: False if the lines could not be converted
+        """
+        # Find out the layout of each corner from its slashes: v has none,
+        # v/vt one, v/vt/vn two and v//vn two in a row
+        if len(token_starts) != counts.sum() or (buffer[token_starts] == _SLASH).any():
+            return False
+        slashes = np.flatnonzero(buffer == _SLASH)
+        doubles = slashes[:-1][np.diff(slashes) == 1]
+        slash_counts = np.bincount(np.searchsorted(token_starts, slashes, side='right') - 1,
+                                   minlength=len(token_starts))
+        double_counts = np.bincount(np.searchsorted(token_starts, doubles, side='right') - 1,
+                                    minlength=len(token_starts))
+        if (slash_counts > 2).any():
+            return False
+        corner_layouts = 2 * slash_counts + double_counts
+
+        # All the corners of a polygon have the same layout, and the run is
+        # split where the layout changes from a polygon to the next
+        polygons = np.repeat(np.arange(len(counts)), counts)
+        layouts = corner_layouts[np.cumsum(counts) - counts]
+        if (corner_layouts != layouts[polygons]).any():
+            return False
+
+        values = _parse_numbers(buffer.tobytes().replace(b'/', b' '), np.int32)
+        widths = np.array([1, 0, 2, 0, 3, 2])[corner_layouts]
+        if values is None or len(values) != widths.sum():
+            return False
+        value_starts = np.cumsum(widths) - widths
+        corner_starts = np.cumsum(counts) - counts
+
+        changes = np.flatnonzero(layouts[1:] != layouts[:-1]) + 1
+        for (first, last) in zip(np.concatenate(([0], changes)), np.concatenate((changes, [len(counts)]))):
+            layout = _FACE_LAYOUTS[layouts[first]]
+            first_value = value_starts[corner_starts[first]]
+            run_counts = counts[first:last]
+            run_values = values[first_value:first_value + sum(layout) * run_counts.sum()].reshape(-1, sum(layout))
+            self.add_face_run(layout, run_values, run_counts)
+        return True
+
+    def add_face_run(self, layout, values, counts):
+        """Adds consecutive polygons whose corners have the same layout
+
+        :param layout: presence of the vertex, texture coordinate and normal
+        indices in each corner
+        :param values: (n, k) array of the indices of each corner
+        :param counts: the number of corners of each polygon
+        """
+        indices = []
+        column = 0
+        for (present, array) in zip(layout, (self._vertices, self._tex_coords, self._normals)):
+            if not present:
+                indices.append(None)
+                continue
+            index = values[:, column]
+            indices.append(np.where(index > 0, index - 1, index + len(array)))
+            column += 1
+
+        triangles, _ = fan_triangulate(counts)
+        self.add_faces(*[None if index is None else index[triangles] for index in indices],
+                       material = self.current_material)
+
     def parse_line(self, string):
         """Parses a line of .obj file
 
@@ -52,15 +280,16 @@ class OBJParser(TextModelParser):
             self.add_tex_coord(TexCoord().from_array(split))
         elif first == 'f':
             splits = list(map(lambda x: x.split('/'), split))
+            counts = (len(self.vertices), len(self.tex_coords), len(self.normals))
 
             for i in range(len(splits)):
                 for j in range(len(splits[i])):
-                    if splits[i][j] is not '':
+                    if splits[i][j] != '':
                         splits[i][j] = int(splits[i][j])
                         if splits[i][j] > 0:
                             splits[i][j] -= 1
                         else:
-                            splits[i][j] = len(self.vertices) + splits[i][j]
+                            splits[i][j] = counts[j] + splits[i][j]
 
             # if Face3
             if len(split) == 3:
@@ -68,22 +297,11 @@ class OBJParser(TextModelParser):
                 face.material = self.current_material
                 self.add_face(face)
 
-            #  Face4 are well supported with the next stuff
-            # elif len(split) == 4:
-            #     face = Face().from_array(splits[:3])
-            #     face.material = self.current_material
-            #     self.add_face(face)
-
-            #     face = Face().from_array([splits[0], splits[2], splits[3]])
-            #     face.material = self.current_material
-            #     self.add_face(face)
-
             else:
-                # Bweeee
                 # First, lets compute all the FaceVertex for each vertex
                 face_vertices = []
                 for face_vertex in splits[:]:
-                    face_vertices.append(FaceVertex(*face_vertex))
+                    face_vertices.append(FaceVertex().from_array(face_vertex))
 
                 # Then, we build the faces 0 i i+1 for each 1 <= i < len - 1
                 for i in range(1, len(face_vertices) - 1):
@@ -94,10 +312,6 @@ class OBJParser(TextModelParser):
                     self.add_face(face)
 
 
-
-
-
-
 class MTLParser:
     """Parser that parses a .mtl material file
     """
@@ -108,6 +322,7 @@ class MTLParser:
         """
         self.parent = parent
         self.current_mtl = None
+        self.path = None
 
     def parse_line(self, string):
         """Parses a line of .mtl file
@@ -137,6 +352,7 @@ class MTLParser:
 
 
     def parse_file(self, path):
+        self.path = path
         with open(path) as f:
             for line in f.readlines():
                 line = line.rstrip()
@@ -159,50 +375,56 @@ class OBJExporter(Exporter):
         """
         super().__init__(model)
 
-    def __str__(self):
-        """Exports the model
+    def chunks(self):
+        """Exports the model chunk by chunk
         """
         current_material = ''
-        string = ""
 
-        for vertex in self.model.vertices:
-            string += "v " + ' '.join([str(vertex.x), str(vertex.y), str(vertex.z)]) + "\n"
+        yield from self.format_chunks(self.model.vertex_array, "v %.7g %.7g %.7g\n")
+        yield "\n"
 
-        string += "\n"
+        if len(self.model.tex_coord_array) > 0:
+            yield from self.format_chunks(self.model.tex_coord_array, "vt %.7g %.7g\n")
+            yield "\n"
 
-        if len(self.model.tex_coords) > 0:
-            for tex_coord in self.model.tex_coords:
-                string += "vt " + ' '.join([str(tex_coord.x), str(tex_coord.y)]) + "\n"
+        if len(self.model.normal_array) > 0:
+            yield from self.format_chunks(self.model.normal_array, "vn %.7g %.7g %.7g\n")
+            yield "\n"
 
-            string += "\n"
+        for part in self.model.parts:
+            if part.material is not None and part.material.name != current_material:
+                current_material = part.material.name
+                yield "usemtl " + current_material + "\n"
 
-        if len(self.model.normals) > 0:
-            for normal in self.model.normals:
-                string += "vn " + ' '.join([str(normal.x), str(normal.y), str(normal.z)]) + "\n"
+            yield from self.format_chunks(*self.face_indices(part))
 
-            string += "\n"
+    def face_indices(self, part):
+        """Returns the indices of the f lines of the triangles of a part, and
+        the format of a line
 
-        faces = sum(map(lambda x: x.faces, self.model.parts), [])
-
-        for face in faces:
-            if face.material is not None and face.material.name != current_material:
-                current_material = face.material.name
-                string += "usemtl " + current_material + "\n"
-            string += "f "
-            arr = []
-            for v in [face.a, face.b, face.c]:
-                sub_arr = []
-                sub_arr.append(str(v.vertex + 1))
-                if v.normal is None:
-                    if v.tex_coord is not None:
-                        sub_arr.append('')
-                        sub_arr.append(str(v.tex_coord + 1))
-                elif v.tex_coord is not None:
-                    sub_arr.append(str(v.tex_coord + 1))
-                    if v.normal is not None:
-                        sub_arr.append(str(v.normal + 1))
-                arr.append('/'.join(sub_arr))
-
-            string += ' '.join(arr) + '\n'
-        return string
+        The vt and vn indices are only written when every triangle of the part
+        has them.
 
+        :param part: the MeshPart to format
+        """
+        columns = [part.face_array + 1]
+        corner = '%d'
+
+        tex_coords = part.face_tex_coord_array
+        normals = part.face_normal_array
+        has_tex_coords = len(self.model.tex_coord_array) > 0 and (tex_coords >= 0).all()
+        has_normals = len(self.model.normal_array) > 0 and (normals >= 0).all()
+
+        if has_tex_coords:
+            columns.append(tex_coords + 1)
+            corner += '/%d'
+        elif has_normals:
+            corner += '/'
+
+        if has_normals:
+            columns.append(normals + 1)
+            corner += '/%d'
+
+        # Interleave the columns so that each corner gets its indices in a row
+        indices = np.stack(columns, axis=2).reshape(len(part.face_array), -1)
+        return (indices, 'f ' + ' '.join([corner] * 3) + '\n')
@@ -49,17 +49,10 @@ class OFFExporter(Exporter):
         """
         super().__init__(model)
 
-    def __str__(self):
-        """Exports the model
+    def chunks(self):
+        """Exports the model chunk by chunk
         """
-        faces = sum(map(lambda x: x.faces, self.model.parts), [])
-        string = "OFF\n{} {} {}".format(len(self.model.vertices), len(faces), 0) + '\n'
-
-        for vertex in self.model.vertices:
-            string += ' '.join([str(vertex.x), str(vertex.y), str(vertex.z)]) + '\n'
-
-        for face in faces:
-            string += '3 ' + ' '.join([str(face.a.vertex), str(face.b.vertex), str(face.c.vertex)]) + '\n'
-
-        return string
+        yield "OFF\n{} {} {}".format(len(self.model.vertex_array), self.model.face_count, 0) + '\n'
 
+        yield from self.format_chunks(self.model.vertex_array, '%.7g %.7g %.7g\n')
+        yield from self.format_chunks(self.model.face_array, '3 %d %d %d\n')
@@ -1,6 +1,9 @@
 import os
 import sys
+import mmap
 import struct
+import numpy as np
+from ..arrays import fan_triangulate
 from ..basemodel import ModelParser, TextModelParser, Exporter, Vertex, Face, Color, FaceVertex, TexCoord, Material
 
 class UnkownTypeError(Exception):
@@ -15,24 +18,28 @@ def is_ply(filename):
     """
     return filename[-4:] == '.ply'
 
-# List won't work with this function
-def _ply_type_size(type):
-    """Returns the size of a ply property
-
-    :param type: a string that is in a ply element
+PLY_TYPES = {
+    'char': 'i1', 'int8': 'i1',
+    'uchar': 'u1', 'uint8': 'u1',
+    'short': 'i2', 'int16': 'i2',
+    'ushort': 'u2', 'uint16': 'u2',
+    'int': 'i4', 'int32': 'i4',
+    'uint': 'u4', 'uint32': 'u4',
+    'float': 'f4', 'float32': 'f4',
+    'double': 'f8', 'float64': 'f8',
+}
+"""numpy type codes of the scalar types of ply properties
+"""
+
+def ply_dtype(type, byteorder = '<'):
+    """Returns the numpy type of a scalar ply type
+
+    :param type: the name of the type, as written in a ply property
+    :param byteorder: '<' for little endian, '>' for big endian
     """
-    if type == 'char' or type == 'uchar':
-        return 1
-    elif type == 'short' or type == 'ushort':
-        return 2
-    elif type == 'int' or type == 'uint':
-        return 4
-    elif type == 'float':
-        return 4
-    elif type == 'double':
-        return 8
-    else:
+    if type not in PLY_TYPES:
         raise UnkownTypeError('Type ' + type + ' is unknown')
+    return np.dtype(byteorder + PLY_TYPES[type])
 
 def ply_type_size(type):
     """Returns the list containing the sizes of the elements
@@ -42,75 +49,64 @@ def ply_type_size(type):
     split = type.split()
 
     if len(split) == 1:
-        return [_ply_type_size(type)]
+        return [ply_dtype(type).itemsize]
     else:
         if split[0] != 'list':
             print('You have multiple types but it\'s not a list...', file=sys.stderr)
             sys.exit(-1)
         else:
-            return list(map(lambda a: _ply_type_size(a), split[1:]))
-
-
-def bytes_to_element(type, bytes, byteorder = 'little'):
-    """Returns a python object parsed from bytes
-
-    :param type: the type of the object to parse
-    :param bytes: the bytes to read
-    :param byteorder: little or big endian
-    """
-    if type == 'char':
-        return ord(struct.unpack('<b', bytes)[0])
-    if type == 'uchar':
-        return ord(struct.unpack('<c', bytes)[0])
-    elif type == 'short':
-        return struct.unpack('<h', bytes)[0]
-    elif type == 'ushort':
-        return struct.unpack('<H', bytes)[0]
-    elif type == 'int':
-        return struct.unpack('<i', bytes)[0]
-    elif type == 'uint':
-        return struct.unpack('<I', bytes)[0]
-    elif type == 'float':
-        return struct.unpack('<f', bytes)[0]
-    elif type == 'double':
-        return struct.unpack('<d', bytes)[0]
-    else:
-        raise UnkownTypeError('Type ' + type + ' is unknown')
+            return list(map(lambda a: ply_dtype(a).itemsize, split[1:]))
 
 class PLYParser(ModelParser):
     """Parser that parses a .ply file
     """
 
+    MMAP_THRESHOLD = 1 << 24
+    """Size in bytes above which binary files are memory-mapped instead of read
+    """
+
     def __init__(self, up_conversion = None):
         super().__init__(up_conversion)
         self.counter = 0
         self.elements = []
-        self.inner_parser = PLYHeaderParser(self)
-        self.beginning_of_line = ''
-        self.header_finished = False
+        self.header_parser = PLYHeaderParser(self)
+        self.inner_parser = self.header_parser
 
-    def parse_bytes(self, bytes, byte_counter):
-        """Parses bytes of a .ply file
-        """
-        if self.header_finished:
-            self.inner_parser.parse_bytes(self.beginning_of_line + bytes, byte_counter - len(self.beginning_of_line))
-            self.beginning_of_line = b''
-            return
+    def parse_file(self, path, chunk_size = 512):
+        """Parses the header of a .ply file, and then its content
 
-        # Build lines for header and use PLYHeaderParser
-        current_line = self.beginning_of_line
-        for (i, c) in enumerate(bytes):
-            char = chr(c)
-            if char == '\n':
-                self.inner_parser.parse_line(current_line)
-                if  current_line == 'end_header':
-                    self.header_finished = True
-                    self.beginning_of_line = bytes[i+1:]
-                    return
-                current_line = ''
+        Binary content is decoded in one go, from a memory map for large
+        files. ASCII content is read chunk by chunk.
+
+        :param path: path to the file to parse
+        :param chunk_size: size of the chunks of ASCII content
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            while self.inner_parser is self.header_parser:
+                line = f.readline()
+                if line == b'':
+                    raise Exception('Header of ' + path + ' is not terminated')
+                line = line.decode('ascii').strip()
+                if line != '':
+                    self.header_parser.parse_line(line)
+
+            offset = f.tell()
+
+            if isinstance(self.inner_parser, PLY_ASCII_ContentParser):
+                byte_counter = offset
+                while True:
+                    bytes = f.read(chunk_size)
+                    if bytes == b'':
+                        return
+                    self.inner_parser.parse_bytes(bytes, byte_counter)
+                    byte_counter += chunk_size
+
+            if os.path.getsize(path) >= self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    self.inner_parser.parse_buffer(buffer, offset)
             else:
-                current_line += chr(c)
-        self.beginning_of_line = current_line
+                self.inner_parser.parse_buffer(f.read(), 0)
 
 class PLYHeaderParser:
     """Parser that parses the header of a .ply file
@@ -166,6 +162,26 @@ class PLYElement:
     def add_property(self, name, type):
         self.properties.append((name, type))
 
+    def dtype(self, byteorder, list_lengths = None):
+        """Returns the structured numpy type of one instance of the element
+
+        A list property name is stored as two fields: name_count with the
+        length of the list, and name with its items.
+
+        :param byteorder: '<' for little endian, '>' for big endian
+        :param list_lengths: dict giving the length of each list property,
+        only needed if the element has lists
+        """
+        fields = []
+        for (name, type) in self.properties:
+            split = type.split()
+            if split[0] == 'list':
+                fields.append((name + '_count', ply_dtype(split[1], byteorder)))
+                fields.append((name, ply_dtype(split[2], byteorder), (list_lengths[name],)))
+            else:
+                fields.append((name, ply_dtype(split[0], byteorder)))
+        return np.dtype(fields)
+
 class PLY_ASCII_ContentParser:
     def __init__(self, parent):
         self.parent = parent
@@ -255,7 +271,9 @@ class PLY_ASCII_ContentParser:
                         faceVertexArray[i].tex_coord = len(self.parent.tex_coords) - 1
 
                 elif property[0] == 'texnumber':
-                    current_material = self.parent.materials[int(split[offset])]
+                    texnumber = int(split[offset])
+                    if texnumber < len(self.parent.materials):
+                        current_material = self.parent.materials[texnumber]
                     offset += 1
 
             face = Face(*faceVertexArray)
@@ -273,182 +291,187 @@ class PLY_ASCII_ContentParser:
             self.current_element = self.parent.elements[self.element_index]
 
 class PLYLittleEndianContentParser:
-    def __init__(self, parent):
-        self.parent = parent
-        self.previous_bytes = b''
-        self.element_index = 0
-        self.counter = 0
-        self.current_element = None
-        self.started = False
-
-        # Serves for debugging purposes
-        # self.current_byte = 0
-
-    def parse_bytes(self, bytes, byte_counter):
-
-        if not self.started:
-            # self.current_byte = byte_counter
-            self.started = True
-
-        if self.current_element is None:
-            self.current_element = self.parent.elements[0]
-
-        bytes = self.previous_bytes + bytes
-        current_byte_index = 0
-
-        while True:
-            property_values = []
-
-            beginning_byte_index = current_byte_index
-
-            for property in self.current_element.properties:
-
-                size = ply_type_size(property[1])
+    """Parser of the content of a binary little endian .ply file
 
-                if current_byte_index + size[0] > len(bytes):
-                    self.previous_bytes = bytes[beginning_byte_index:]
-                    # self.current_byte -= len(self.previous_bytes)
-                    return
-
-                if len(size) == 1:
-
-                    size = size[0]
-
-                    current_property_bytes = bytes[current_byte_index:current_byte_index+size]
-                    property_values.append(bytes_to_element(property[1], current_property_bytes))
-                    current_byte_index += size
-                    # self.current_byte += size
-
-                elif len(size) == 2:
-
-                    types = property[1].split()[1:]
-                    current_property_bytes = bytes[current_byte_index:current_byte_index+size[0]]
-                    number_of_elements = bytes_to_element(types[0], current_property_bytes)
-                    current_byte_index += size[0]
-                    # self.current_byte += size[0]
-
-                    property_values.append([])
+    Each element is decoded with a single np.frombuffer over a structured
+    type built from the header. Lists of the same length for every instance,
+    like the vertex_indices of triangles, are part of the structured type. The
+    elements having lists of varying lengths are read instance by instance.
+    """
 
-                    # Parse list
-                    for i in range(number_of_elements):
+    BYTEORDER = '<'
 
-                        if current_byte_index + size[1] > len(bytes):
+    def __init__(self, parent):
+        self.parent = parent
 
-                            self.previous_bytes = bytes[beginning_byte_index:]
-                            # self.current_byte -= len(self.previous_bytes)
-                            return
+    def parse_buffer(self, buffer, offset):
+        """Decodes every element of the content and adds them to the model
 
-                        current_property_bytes = bytes[current_byte_index:current_byte_index+size[1]]
-                        property_values[-1].append(bytes_to_element(types[1], current_property_bytes))
-                        current_byte_index += size[1]
-                        # self.current_byte += size[1]
+        :param buffer: object supporting the buffer protocol
+        :param offset: index of the first byte of the content in buffer
+        """
+        for element in self.parent.elements:
+            (data, offset) = self.decode_element(element, buffer, offset)
+
+            if element.name == 'vertex':
+                self.add_vertices(data)
+            elif element.name == 'face':
+                self.add_faces(data)
+
+    def decode_element(self, element, buffer, offset):
+        """Decodes every instance of an element
+
+        :param element: the PLYElement to decode
+        :param buffer: object supporting the buffer protocol
+        :param offset: index of the first byte of the element in buffer
+        :return: a dict giving an array for each scalar property, and a pair
+        (items, lengths) for each list property, and the offset of the next
+        element
+        """
+        if element.number == 0:
+            return ({}, offset)
+
+        # Guess the length of the lists from the first instance
+        list_lengths = {}
+        position = offset
+        for (name, type) in element.properties:
+            split = type.split()
+            if split[0] == 'list':
+                count_type = ply_dtype(split[1], self.BYTEORDER)
+                length = int(np.frombuffer(buffer, count_type, 1, position)[0])
+                list_lengths[name] = length
+                position += count_type.itemsize + length * ply_dtype(split[2]).itemsize
+            else:
+                position += ply_dtype(split[0]).itemsize
+
+        dtype = element.dtype(self.BYTEORDER, list_lengths)
+        end = offset + element.number * dtype.itemsize
+        if end <= len(buffer):
+            records = np.frombuffer(buffer, dtype, element.number, offset)
+            if all((records[name + '_count'] == length).all() for (name, length) in list_lengths.items()):
+                data = {}
+                for (name, type) in element.properties:
+                    if name in list_lengths:
+                        lengths = np.full(element.number, list_lengths[name], dtype=np.int64)
+                        data[name] = (records[name].reshape(-1), lengths)
+                    else:
+                        data[name] = records[name]
+                return (data, end)
+
+        return self.decode_varying_element(element, buffer, offset)
+
+    def decode_varying_element(self, element, buffer, offset):
+        """Decodes an element whose lists do not all have the same length
+
+        :param element: the PLYElement to decode
+        :param buffer: object supporting the buffer protocol
+        :param offset: index of the first byte of the element in buffer
+        :return: the same as decode_element
+        """
+        properties = []
+        for (name, type) in element.properties:
+            split = type.split()
+            if split[0] == 'list':
+                count_type = ply_dtype(split[1], self.BYTEORDER)
+                item_type = ply_dtype(split[2], self.BYTEORDER)
+                properties.append((name, struct.Struct(self.BYTEORDER + count_type.char), item_type))
+            else:
+                properties.append((name, struct.Struct(self.BYTEORDER + ply_dtype(split[0]).char), None))
 
+        values = {name: [] for (name, _, _) in properties}
+        lengths = {name: [] for (name, _, item_type) in properties if item_type is not None}
 
+        for _ in range(element.number):
+            for (name, scalar, item_type) in properties:
+                value = scalar.unpack_from(buffer, offset)[0]
+                offset += scalar.size
+                if item_type is None:
+                    values[name].append(value)
                 else:
-                    print('I have not idea what this means', file=sys.stderr)
-
-            # Add element
-            if self.current_element.name == 'vertex':
-
-                vertex = Vertex()
-                red = None
-                green = None
-                blue = None
-                alpha = None
-                offset = 0
-
-                for property in self.current_element.properties:
-
-                    if property[0] == 'x':
-                        vertex.x = property_values[offset]
-                    elif property[0] == 'y':
-                        vertex.y = property_values[offset]
-                    elif property[0] == 'z':
-                        vertex.z = property_values[offset]
-                    elif property[0] == 'red':
-                        red = property_values[offset] / 255
-                    elif property[0] == 'green':
-                        green = property_values[offset] / 255
-                    elif property[0] == 'blue':
-                        blue = property_values[offset] / 255
-                    elif property[0] == 'alpha':
-                        alpha = property_values[offset] / 255
-
-                    offset += 1
-
-                self.parent.add_vertex(vertex)
-
-                if red is not None:
-                    self.parent.add_color(Color(red, blue, green))
-
-            elif self.current_element.name == 'face':
-
-                vertex_indices = []
-                tex_coords = []
-                material = None
-
-                for (i, property) in enumerate(self.current_element.properties):
-
-                    if property[0] == 'vertex_indices':
-                        vertex_indices.append(property_values[i][0])
-                        vertex_indices.append(property_values[i][1])
-                        vertex_indices.append(property_values[i][2])
-
-                    elif property[0] == 'texcoord':
-                        # Create texture coords
-                        for j in range(0,6,2):
-                            tex_coord = TexCoord(*property_values[i][j:j+2])
-                            tex_coords.append(tex_coord)
-
-                    elif property[0] == 'texnumber':
-                        material = self.parent.materials[property_values[i]]
-
-                for tex_coord in tex_coords:
-                    self.parent.add_tex_coord(tex_coord)
+                    values[name].append(np.frombuffer(buffer, item_type, value, offset))
+                    lengths[name].append(value)
+                    offset += value * item_type.itemsize
+
+        data = {}
+        for (name, _, item_type) in properties:
+            if item_type is None:
+                data[name] = np.array(values[name])
+            else:
+                data[name] = (np.concatenate(values[name]), np.array(lengths[name], dtype=np.int64))
+        return (data, offset)
 
-                face = Face(*list(map(lambda x: FaceVertex(x), vertex_indices)))
+    def add_vertices(self, data):
+        """Adds the decoded vertex element to the model
 
-                counter = 3
-                if len(tex_coords) > 0:
-                    for face_vertex in [face.a, face.b, face.c]:
-                        face_vertex.tex_coord = len(self.parent.tex_coords) - counter
-                        counter -= 1
+        :param data: the decoded element, as returned by decode_element
+        """
+        if 'x' not in data:
+            return
 
-                if material is None and len(self.parent.materials) == 1:
-                    material = self.parent.materials[0]
+        self.parent.add_vertices(np.stack((data['x'], data['y'], data['z']), axis=1))
 
-                face.material = material
+        if 'red' in data:
+            colors = np.stack((data['red'], data['green'], data['blue']), axis=1).astype(np.float32)
+            if data['red'].dtype.kind in 'iu':
+                colors /= 255
+            self.parent.add_colors(colors)
 
-                self.parent.add_face(face)
+    def add_faces(self, data):
+        """Adds the decoded face element to the model
 
-            self.counter += 1
+        Polygons are split into triangles, and consecutive triangles sharing
+        the same texnumber are added with the same material.
 
-            if self.counter == self.current_element.number:
-                self.next_element()
+        :param data: the decoded element, as returned by decode_element
+        """
+        name = 'vertex_indices' if 'vertex_indices' in data else 'vertex_index'
+        if name not in data:
+            return
 
-    def next_element(self):
-        self.counter = 0
-        self.element_index += 1
-        if self.element_index < len(self.parent.elements):
-            self.current_element = self.parent.elements[self.element_index]
+        (indices, corner_counts) = data[name]
+        (corners, polygons) = fan_triangulate(corner_counts)
+        vertices = indices[corners]
+
+        tex_coords = None
+        if 'texcoord' in data:
+            (values, lengths) = data['texcoord']
+            if (lengths == 2 * corner_counts).all():
+                first = len(self.parent.tex_coord_array)
+                self.parent.add_tex_coords(values.reshape(-1, 2))
+                tex_coords = corners + first
+
+        materials = self.parent.materials
+        if 'texnumber' in data:
+            texnumbers = data['texnumber'][polygons]
+        else:
+            texnumbers = np.zeros(len(polygons), dtype=np.int64)
+            if len(materials) != 1:
+                texnumbers -= 1
 
+        boundaries = np.flatnonzero(np.diff(texnumbers)) + 1
+        starts = [0] + boundaries.tolist()
+        ends = boundaries.tolist() + [len(texnumbers)]
+        for (start, end) in zip(starts, ends):
+            texnumber = int(texnumbers[start])
+            material = materials[texnumber] if 0 <= texnumber < len(materials) else None
+            self.parent.add_faces(vertices[start:end],
+                                  tex_coords[start:end] if tex_coords is not None else None,
+                                  None, material)
 
 
 class PLYBigEndianContentParser(PLYLittleEndianContentParser):
-    def __init__(self, parent):
-        super().__init__(self, parent)
+    """Parser of the content of a binary big endian .ply file
+    """
 
-    def parse_bytes(self, bytes):
-        # Reverse bytes, and then
-        super().parse_bytes(self, bytes)
+    BYTEORDER = '>'
 
 class PLYExporter(Exporter):
     def __init__(self, model):
         super().__init__(model)
 
-    def __str__(self):
-
-        faces = sum([part.faces for part in self.model.parts], [])
+    def chunks(self):
+        """Exports the model as ASCII .ply chunk by chunk
+        """
 
         # Header
         string = "ply\nformat ascii 1.0\ncomment Automatically gnerated by model-converter\n"
@@ -457,38 +480,32 @@ class PLYExporter(Exporter):
             string += "comment TextureFile " + (material.relative_path_to_texture or 'None') + "\n"
 
         # Types : vertices
-        string += "element vertex " + str(len(self.model.vertices)) +"\n"
+        string += "element vertex " + str(len(self.model.vertex_array)) +"\n"
         string += "property float x\nproperty float y\nproperty float z\n"
 
         # Types : faces
-        string += "element face " + str(len(faces)) + "\n"
+        string += "element face " + str(self.model.face_count) + "\n"
         string += "property list uchar int vertex_indices\n"
 
-        if len(self.model.tex_coords) > 0:
+        if len(self.model.tex_coord_array) > 0:
             string += "property list uchar float texcoord\n"
             string += "property int texnumber\n"
 
         # End header
         string += "end_header\n"
+        yield string
 
         # Content of the model
-        for vertex in self.model.vertices:
-            string += str(vertex.x) + " " + str(vertex.y) + " " + str(vertex.z) + "\n"
-
-        for face in faces:
-            string += "3 " + str(face.a.vertex) + " " + str(face.b.vertex) + " " + str(face.c.vertex)
-
-            if len(self.model.tex_coords) > 0:
-                string += " 6 " \
-                       + str(self.model.tex_coords[face.a.tex_coord].x) + " " \
-                       + str(self.model.tex_coords[face.a.tex_coord].y) + " " \
-                       + str(self.model.tex_coords[face.b.tex_coord].x) + " " \
-                       + str(self.model.tex_coords[face.b.tex_coord].y) + " " \
-                       + str(self.model.tex_coords[face.c.tex_coord].x) + " " \
-                       + str(self.model.tex_coords[face.c.tex_coord].y) + " " \
-                       + str(self.model.get_material_index(face.material))
-
-            string += "\n"
-
-        return string
-
+        yield from self.format_chunks(self.model.vertex_array, "%.7g %.7g %.7g\n")
+
+        for part in self.model.parts:
+            if len(self.model.tex_coord_array) > 0:
+                texnumber = 0
+                if part.material in self.model.materials:
+                    texnumber = self.model.get_material_index(part.material)
+                tex_coords = self.model.tex_coord_array[part.face_tex_coord_array].reshape(-1, 6)
+                yield from self.format_chunks(
+                    np.hstack((part.face_array, tex_coords)),
+                    "3 %d %d %d 6 %.7g %.7g %.7g %.7g %.7g %.7g " + str(texnumber) + "\n")
+            else:
+                yield from self.format_chunks(part.face_array, "3 %d %d %d\n")
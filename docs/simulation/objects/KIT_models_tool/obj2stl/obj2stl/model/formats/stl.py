@@ -1,7 +1,21 @@
 from ..basemodel import TextModelParser, Exporter, Vertex, FaceVertex, Face
-from ..mesh import MeshPart
+from ..arrays import format_rows
 
 import os.path
+import mmap
+import numpy as np
+
+STL_HEADER_SIZE = 84
+"""Size of the header of a binary .stl file, facet count included
+"""
+
+STL_RECORD = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attribute', '<u2'),
+])
+"""Layout of a facet of a binary .stl file (50 bytes)
+"""
 
 def is_stl(filename):
     """Checks that the file is a .stl file
@@ -11,18 +25,113 @@ def is_stl(filename):
     """
     return filename[-4:] == '.stl'
 
+def is_binary_stl(path):
+    """Checks that a .stl file is binary
+
+    The header of a binary .stl can start with solid like an ASCII file, so the
+    check relies on the size of the file matching the facet count of the header.
+
+    :param path: path to the file
+    """
+    size = os.path.getsize(path)
+    if size < STL_HEADER_SIZE:
+        return False
+
+    with open(path, 'rb') as f:
+        header = f.read(STL_HEADER_SIZE)
+
+    count = int(np.frombuffer(header, dtype='<u4', count=1, offset=80)[0])
+    return size == STL_HEADER_SIZE + count * STL_RECORD.itemsize
+
 class STLParser(TextModelParser):
-    """Parser that parses a .stl file
+    """Parser that parses a .stl file, ASCII or binary
+    """
+
+    MMAP_THRESHOLD = 1 << 24
+    """Size in bytes above which binary files are memory-mapped instead of read
     """
 
-    def __init__(self, up_conversion = None):
+    def __init__(self, up_conversion = None, weld = True):
+        """Creates a parser
+
+        :param up_conversion: conversion of up vectors
+        :param weld: whether identical vertices should be merged, since .stl
+        stores the three vertices of each facet
+        """
         super().__init__(up_conversion)
+        self.weld = weld
         self.parsing_solid = False
         self.parsing_face = False
         self.parsing_loop = False
         self.current_face = None
         self.face_vertices = None
 
+    def parse_file(self, path):
+        """Parses a .stl file, ASCII or binary
+
+        :param path: path to the file to parse
+        """
+        if is_binary_stl(path):
+            self.parse_binary_file(path)
+        else:
+            super().parse_file(path)
+
+        if self.weld:
+            self.weld_vertices()
+
+    def parse_binary_file(self, path):
+        """Parses a binary .stl file
+
+        The facets are decoded in place with np.frombuffer, and large files are
+        memory-mapped, so that only the vertices are copied.
+
+        :param path: path to the file to parse
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            if os.path.getsize(path) >= self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    self.parse_binary_buffer(buffer)
+            else:
+                self.parse_binary_buffer(f.read())
+
+    def parse_binary_buffer(self, buffer):
+        """Adds the facets of a binary .stl held in a buffer to the model
+
+        :param buffer: object supporting the buffer protocol, with the header
+        and the facets
+        """
+        count = int(np.frombuffer(buffer, dtype='<u4', count=1, offset=80)[0])
+        records = np.frombuffer(buffer, dtype=STL_RECORD, count=count, offset=STL_HEADER_SIZE)
+
+        first = len(self.vertex_array)
+        self.add_vertices(records['vertices'].reshape(-1, 3))
+        self.add_faces(np.arange(first, first + 3 * count).reshape(-1, 3))
+
+        # The memory map can only be closed once no array uses it
+        del records
+
+    def weld_vertices(self):
+        """Merges the vertices having exactly the same coordinates
+
+        The vertices keep the order of their first occurrence.
+        """
+        vertices = self.vertex_array
+        if len(vertices) == 0:
+            return
+
+        # Adding 0 turns -0 into 0, so that comparing bytes compares values
+        vertices = np.ascontiguousarray(vertices + np.float32(0))
+        keys = vertices.view(np.dtype((np.void, vertices.dtype.itemsize * 3))).ravel()
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+        order = np.argsort(first)
+        remap = np.empty_like(order)
+        remap[order] = np.arange(len(order))
+
+        self.vertex_array = vertices[first[order]]
+        self.face_array = remap[inverse.ravel()][self.face_array]
+
     def parse_line(self, string):
         """Parses a line of .stl file
 
@@ -77,40 +186,98 @@ class STLParser(TextModelParser):
 
 class STLExporter(Exporter):
     """Exporter to .stl format
+
+    Exports ASCII .stl with str(exporter), binary .stl with bytes(exporter)
+    or write_binary, and either of them with write and export_to_path
+    depending on binary.
     """
-    def __init__(self, model):
+
+    def __init__(self, model, binary = False):
         """Creates an exporter from the model
 
         :param model: Model to export
+        :param binary: whether write and export_to_path export binary .stl
         """
         super().__init__(model)
-        super().__init__(model)
+        self.binary = binary
+
+    def binary_header(self):
+        """Returns the 80 bytes header and the facet count of a binary .stl
+
+        The header must not start with solid, otherwise some readers take the
+        file for an ASCII .stl.
+        """
+        name = os.path.basename(self.model.path[:-4]) if self.model.path is not None else ''
+        header = ('binary stl ' + name).encode('ascii', 'replace')[:80].ljust(80, b' ')
+        return header + np.uint32(self.model.face_count).astype('<u4').tobytes()
+
+    def binary_records(self, start, end):
+        """Packs a range of triangles of the model into binary .stl facets
+
+        :param start: index of the first triangle
+        :param end: index after the last triangle
+        """
+        records = np.zeros(end - start, dtype=STL_RECORD)
+        records['normal'] = self.model.compute_face_normals(start, end)
+        records['vertices'] = self.model.vertex_array[self.model.face_array[start:end]]
+        return records
+
+    def write_binary(self, f):
+        """Writes the model as binary .stl in a file opened in binary mode
+
+        Facets are packed CHUNK_SIZE at a time, so that the memory needed
+        does not depend on the size of the model.
 
-    def __str__(self):
-        """Exports the model
+        :param f: the file object to write to
         """
-        string = 'solid {}\n'.format(os.path.basename(self.model.path[:-4]))
+        f.write(self.binary_header())
+        for start in range(0, self.model.face_count, self.CHUNK_SIZE):
+            end = min(start + self.CHUNK_SIZE, self.model.face_count)
+            f.write(self.binary_records(start, end).tobytes())
 
-        self.model.generate_face_normals()
+    def __bytes__(self):
+        """Exports the model as binary .stl
+        """
+        return self.binary_header() + self.binary_records(0, self.model.face_count).tobytes()
+
+    def write(self, f):
+        """Writes the model in a file object, binary .stl if binary was set
+
+        :param f: the file object to write to, opened in binary mode for
+        binary .stl
+        """
+        if self.binary:
+            self.write_binary(f)
+        else:
+            super().write(f)
 
-        faces = sum(map(lambda x: x.faces, self.model.parts), [])
+    def export_to_path(self, path):
+        """Writes the model in a file, binary .stl if binary was set
 
-        for face in faces:
+        :param path: path to the file to write
+        """
+        with open(path, 'wb' if self.binary else 'w') as f:
+            self.write(f)
 
-            n  = self.model.normals[face.a.normal]
-            v1 = self.model.vertices[face.a.vertex]
-            v2 = self.model.vertices[face.b.vertex]
-            v3 = self.model.vertices[face.c.vertex]
+    def chunks(self):
+        """Exports the model as ASCII .stl chunk by chunk
+        """
+        name = os.path.basename(self.model.path[:-4])
 
-            string += "facet normal {} {} {}\n".format(n.x, n.y, n.z)
+        yield 'solid {}\n'.format(name)
 
-            string += "\touter loop\n"
-            string += "\t\tvertex {} {} {}\n".format(v1.x, v1.y, v1.z)
-            string += "\t\tvertex {} {} {}\n".format(v2.x, v2.y, v2.z)
-            string += "\t\tvertex {} {} {}\n".format(v3.x, v3.y, v3.z)
+        for start in range(0, self.model.face_count, self.CHUNK_SIZE):
+            end = min(start + self.CHUNK_SIZE, self.model.face_count)
+            normals = self.model.compute_face_normals(start, end)
+            triangles = self.model.vertex_array[self.model.face_array[start:end]].reshape(-1, 9)
 
-            string += "\tendloop\n"
-            string += "endfacet\n"
+            yield ''.join(format_rows(np.hstack((normals, triangles)),
+                "facet normal %.7g %.7g %.7g\n"
+                "\touter loop\n"
+                "\t\tvertex %.7g %.7g %.7g\n"
+                "\t\tvertex %.7g %.7g %.7g\n"
+                "\t\tvertex %.7g %.7g %.7g\n"
+                "\tendloop\n"
+                "endfacet\n"))
 
-        string += 'endsolid {}'.format(os.path.basename(self.model.path[:-4]))
-        return string
+        yield 'endsolid {}'.format(name)
@@ -0,0 +1,76 @@
+import collections
+import numpy as np
+
+MassProperties = collections.namedtuple('MassProperties', ['volume', 'mass', 'center_of_mass', 'inertia'])
+"""Volume, mass, center of mass and inertia tensor (about the center of mass,
+in the axes of the mesh) of a solid
+"""
+
+def volume_integrals(vertices, faces):
+    """Returns the integrals of 1, x, y, z, x^2, y^2, z^2, xy, yz and zx over
+    the volume enclosed by a triangle mesh
+
+    Each triangle contributes the signed tetrahedron it makes with the
+    origin, following Eberly's polyhedral mass properties.
+
+    :param vertices: (n, 3) array of vertices
+    :param faces: (m, 3) array of triangles, counterclockwise seen from the outside
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    p0, p1, p2 = vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+    normals = np.cross(p1 - p0, p2 - p0)
+
+    # Sums of products of the coordinates of the three vertices, per axis
+    sum1 = p0 + p1
+    f1 = sum1 + p2
+    square0 = p0 * p0
+    sum2 = square0 + p1 * sum1
+    f2 = sum2 + p2 * f1
+    f3 = p0 * square0 + p1 * sum2 + p2 * f2
+    g0 = f2 + p0 * (f1 + p0)
+    g1 = f2 + p1 * (f1 + p1)
+    g2 = f2 + p2 * (f1 + p2)
+
+    # The products xy, yz and zx use the next axis of each vertex
+    following = [1, 2, 0]
+    products = p0[:, following] * g0 + p1[:, following] * g1 + p2[:, following] * g2
+
+    integrals = np.empty(10)
+    integrals[0] = (normals[:, 0] * f1[:, 0]).sum() / 6
+    integrals[1:4] = (normals * f2).sum(axis=0) / 24
+    integrals[4:7] = (normals * f3).sum(axis=0) / 60
+    integrals[7:10] = (normals * products).sum(axis=0) / 120
+    return integrals
+
+def mass_properties(model, mass = None, scale = 1.0):
+    """Returns the mass properties of the solid enclosed by a model
+
+    The model should be closed, its triangles may all be oriented inwards.
+
+    :param model: the model
+    :param mass: mass of the solid, or None for a density of 1
+    :param scale: scale applied to the model, like the scale of a Mujoco mesh
+    :return: a MassProperties, in the units of the scaled model
+    """
+    integrals = volume_integrals(model.vertex_array, model.face_array)
+    # Triangles oriented inwards give the opposite of every integral
+    integrals *= np.sign(integrals[0]) if integrals[0] != 0 else 1
+    volume = integrals[0]
+    if volume == 0:
+        raise ValueError('the model does not enclose any volume')
+
+    center = integrals[1:4] / volume
+    xx, yy, zz = integrals[4:7] - volume * center * center
+    xy, yz, zx = integrals[7:10] - volume * center * center[[1, 2, 0]]
+    inertia = np.array([
+        [yy + zz, -xy, -zx],
+        [-xy, zz + xx, -yz],
+        [-zx, -yz, xx + yy],
+    ])
+
+    # Scaling the model by s multiplies the volume by s^3, and the inertia of
+    # a given mass by s^2
+    scaled_volume = volume * scale ** 3
+    if mass is None:
+        mass = scaled_volume
+    return MassProperties(float(scaled_volume), float(mass), center * scale, inertia * (mass / volume) * scale ** 2)
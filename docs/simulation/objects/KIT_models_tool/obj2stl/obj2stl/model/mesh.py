@@ -1,3 +1,5 @@
+import numpy as np
+
 class Material:
     """Represents a material
 
@@ -89,10 +91,15 @@ except ImportError:
 
 class MeshPart:
     """A part of a 3D model that is bound to a single material
+
+    The part does not own any geometry: it is the range [start, end) of the
+    triangles of its parent model.
     """
     def __init__(self, parent):
         """Creates a mesh part
 
+        The part starts empty, right after the last triangle of the parent.
+
         :param parent: the global model with all the information
         """
         self.parent = parent
@@ -101,7 +108,10 @@ class MeshPart:
         self.tex_coord_vbo = None
         self.normal_vbo = None
         self.color_vbo = None
-        self.faces = []
+        self.index_vbo = None
+        self._bounding_box = None
+        self.start = parent.face_count
+        self.end = self.start
 
     def init_texture(self):
         """Initializes the material of the current parent
@@ -109,62 +119,155 @@ class MeshPart:
         if self.material is not None:
             self.material.init_texture()
 
-    def add_face(self, face):
-        """Adds a face to this MeshPart
+    @property
+    def face_count(self):
+        """Returns the number of triangles of this MeshPart
+        """
+        return self.end - self.start
 
-        :param face: face to add
+    @property
+    def face_array(self):
+        """(n, 3) array of the vertex indices of the triangles of this MeshPart
         """
-        self.faces.append(face)
+        return self.parent.face_array[self.start:self.end]
 
-    def generate_vbos(self):
-        """Generates the vbo for this MeshPart
+    @property
+    def face_tex_coord_array(self):
+        """(n, 3) array of the texture coordinate indices of the triangles
+        """
+        return self.parent.face_tex_coord_array[self.start:self.end]
 
-        Creates the arrays that are necessary for smooth rendering
+    @property
+    def face_normal_array(self):
+        """(n, 3) array of the normal indices of the triangles
         """
+        return self.parent.face_normal_array[self.start:self.end]
 
-        from OpenGL.arrays import vbo
-        from numpy import array
+    @property
+    def bounding_box(self):
+        """Axis aligned BoundingBox of the vertices of the triangles of this
+        MeshPart
+
+        It is computed once, and computed again after faces are added or the
+        vertices of the parent are replaced.
+        """
+        if self._bounding_box is None:
+            from .basemodel import BoundingBox
+            self._bounding_box = BoundingBox.from_array(self.parent.vertex_array[self.face_array.reshape(-1)])
+        return self._bounding_box
+
+    def reset_bounding_box(self):
+        """Forgets the cached bounding box of this MeshPart
+        """
+        self._bounding_box = None
+
+    @property
+    def faces(self):
+        """Sequence of the triangles of this MeshPart as Face objects
+        """
+        return FaceArrayView(self)
+
+    def add_face(self, face):
+        """Adds a face to this MeshPart
 
-        # Build VBO
-        v = []
-        n = []
-        t = []
-        c = []
+        The part must be the last part of its parent.
 
-        for face in self.faces:
-            v1 = self.parent.vertices[face.a.vertex]
-            v2 = self.parent.vertices[face.b.vertex]
-            v3 = self.parent.vertices[face.c.vertex]
-            v += [[v1.x, v1.y, v1.z], [v2.x, v2.y, v2.z], [v3.x, v3.y, v3.z]]
+        :param face: face to add
+        """
+        assert self.end == self.parent.face_count, 'Only the last part of a model can grow'
+
+        def index(value):
+            return -1 if value is None else value
+
+        corners = (face.a, face.b, face.c)
+        self.parent._face_vertices.append([c.vertex for c in corners])
+        self.parent._face_tex_coords.append([index(c.tex_coord) for c in corners])
+        self.parent._face_normals.append([index(c.normal) for c in corners])
+        self.end += 1
+        self._bounding_box = None
+
+    def add_faces(self, vertices, tex_coords = None, normals = None):
+        """Adds several triangles to this MeshPart
 
-            if face.a.normal is not None:
-                n1 = self.parent.normals[face.a.normal]
-                n2 = self.parent.normals[face.b.normal]
-                n3 = self.parent.normals[face.c.normal]
-                n += [[n1.x, n1.y, n1.z], [n2.x, n2.y, n2.z], [n3.x, n3.y, n3.z]]
+        The part must be the last part of its parent.
 
-            if face.a.tex_coord is not None:
-                t1 = self.parent.tex_coords[face.a.tex_coord]
-                t2 = self.parent.tex_coords[face.b.tex_coord]
-                t3 = self.parent.tex_coords[face.c.tex_coord]
-                t += [[t1.x, t1.y], [t2.x, t2.y], [t3.x, t3.y]]
+        :param vertices: (n, 3) array of vertex indices
+        :param tex_coords: (n, 3) array of texture coordinate indices, or None
+        :param normals: (n, 3) array of normal indices, or None
+        """
+        assert self.end == self.parent.face_count, 'Only the last part of a model can grow'
+
+        vertices = np.asarray(vertices, dtype=np.int32).reshape(-1, 3)
+        missing = np.full(vertices.shape, -1, dtype=np.int32)
+
+        self.parent._face_vertices.extend(vertices)
+        self.parent._face_tex_coords.extend(missing if tex_coords is None else tex_coords)
+        self.parent._face_normals.extend(missing if normals is None else normals)
+        self.end += len(vertices)
+        self._bounding_box = None
+
+    def vertex_buffers(self, indexed = False):
+        """Gathers the arrays of the vertices to draw this MeshPart
+
+        :param indexed: if False, the arrays hold the three corners of each
+        triangle in turn; if True, the arrays hold each distinct combination of
+        vertex, normal and texture coordinate once, and an element array gives
+        the corners of the triangles
+        :return: a dict with the 'vertices' array, the 'normals',
+        'tex_coords' and 'colors' arrays if the model has them, and the
+        'indices' uint32 array if indexed
+        """
+        faces = self.face_array
+        normals = self.face_normal_array
+        tex_coords = self.face_tex_coord_array
+
+        # attributes used by the part, with their index per corner
+        attributes = [('vertices', self.parent.vertex_array, faces)]
+        if len(self.parent.normal_array) > 0 and (normals >= 0).all():
+            attributes.append(('normals', self.parent.normal_array, normals))
+        if len(self.parent.tex_coord_array) > 0 and (tex_coords >= 0).all():
+            attributes.append(('tex_coords', self.parent.tex_coord_array, tex_coords))
+        if len(self.parent.color_array) > 0:
+            attributes.append(('colors', self.parent.color_array, faces))
+
+        buffers = {}
+        if indexed:
+            # a corner is identified by its vertex, normal and texture
+            # coordinate indices, packed into a single integer
+            keys = np.ravel_multi_index(
+                [indices.reshape(-1).astype(np.int64) for (name, array, indices) in attributes if name != 'colors'],
+                [len(array) for (name, array, indices) in attributes if name != 'colors'])
+            keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            buffers['indices'] = inverse.reshape(-1).astype(np.uint32)
+            for (name, array, indices) in attributes:
+                buffers[name] = np.ascontiguousarray(array[indices.reshape(-1)[first]], dtype=np.float32)
+        else:
+            for (name, array, indices) in attributes:
+                buffers[name] = np.ascontiguousarray(array[indices.reshape(-1)], dtype=np.float32)
+        return buffers
 
-            if len(self.parent.colors) > 0: # face.a.color is not None:
-                c1 = self.parent.colors[face.a.vertex]
-                c2 = self.parent.colors[face.b.vertex]
-                c3 = self.parent.colors[face.c.vertex]
-                c += [[c1.x, c1.y, c1.z], [c2.x, c2.y, c2.z], [c3.x, c3.y, c3.z]]
+    def generate_vbos(self, indexed = False):
+        """Generates the vbo for this MeshPart
 
-        self.vertex_vbo  = vbo.VBO(array(v, 'f'))
+        Creates the arrays that are necessary for smooth rendering
 
-        if len(n) > 0:
-            self.normal_vbo  = vbo.VBO(array(n, 'f'))
+        :param indexed: if True, shared corners are stored once and the
+        triangles are drawn with an element buffer, see vertex_buffers
+        """
 
-        if len(t) > 0:
-            self.tex_coord_vbo = vbo.VBO(array(t, 'f'))
+        from OpenGL.arrays import vbo
+        import OpenGL.GL as gl
 
-        if len(c) > 0:
-            self.color_vbo = vbo.VBO(array(c, 'f'))
+        buffers = self.vertex_buffers(indexed)
+        self.vertex_vbo = vbo.VBO(buffers['vertices'])
+        if 'normals' in buffers:
+            self.normal_vbo = vbo.VBO(buffers['normals'])
+        if 'tex_coords' in buffers:
+            self.tex_coord_vbo = vbo.VBO(buffers['tex_coords'])
+        if 'colors' in buffers:
+            self.color_vbo = vbo.VBO(buffers['colors'])
+        if 'indices' in buffers:
+            self.index_vbo = vbo.VBO(buffers['indices'], target=gl.GL_ELEMENT_ARRAY_BUFFER)
 
     def draw(self):
         """Draws the current MeshPart
@@ -183,7 +286,7 @@ class MeshPart:
             self.material.unbind()
 
     def draw_from_vbos(self):
-        """Simply calls the OpenGL drawArrays function
+        """Simply calls the OpenGL drawArrays or drawElements function
 
         Sets the correct vertex arrays and draws the part
         """
@@ -217,7 +320,12 @@ class MeshPart:
             gl.glColorPointerf(self.color_vbo)
             self.color_vbo.unbind()
 
-        gl.glDrawArrays(gl.GL_TRIANGLES, 0, len(self.vertex_vbo.data) * 9)
+        if self.index_vbo is not None:
+            self.index_vbo.bind()
+            gl.glDrawElements(gl.GL_TRIANGLES, len(self.index_vbo.data), gl.GL_UNSIGNED_INT, None)
+            self.index_vbo.unbind()
+        else:
+            gl.glDrawArrays(gl.GL_TRIANGLES, 0, len(self.vertex_vbo.data))
 
         gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
         gl.glDisableClientState(gl.GL_NORMAL_ARRAY)
@@ -228,3 +336,50 @@ class MeshPart:
     def draw_from_arrays(self):
         pass
 
+
+class FaceArrayView:
+    """Read-only sequence that wraps the triangles of a MeshPart into Face
+    objects
+
+    It exists so that code written for the old list of Face parts keeps
+    working. Faces are created on the fly, so modifying them does not modify
+    the model.
+    """
+    def __init__(self, part):
+        """Creates a view
+
+        :param part: the MeshPart to wrap
+        """
+        self.part = part
+
+    def __len__(self):
+        return self.part.face_count
+
+    def _face(self, vertices, tex_coords, normals):
+        from .basemodel import Face, FaceVertex
+
+        def index(value):
+            return None if value < 0 else value
+
+        corners = [FaceVertex(vertices[i], index(tex_coords[i]), index(normals[i])) for i in range(3)]
+        return Face(*corners, material = self.part.material)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._face(*rows) for rows in zip(
+                self.part.face_array[index].tolist(),
+                self.part.face_tex_coord_array[index].tolist(),
+                self.part.face_normal_array[index].tolist())]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('face index out of range')
+        return self._face(
+            self.part.face_array[index].tolist(),
+            self.part.face_tex_coord_array[index].tolist(),
+            self.part.face_normal_array[index].tolist())
+
+    def __iter__(self):
+        return iter(self[:])
+
@@ -0,0 +1,132 @@
+import numpy as np
+
+from .arrays import normalize_rows
+
+def triangle_cross(vertices, faces):
+    """Returns the cross product of two edges of each triangle, normal to the
+    triangle with a norm of twice its area
+
+    :param vertices: (n, 3) array of vertices
+    :param faces: (m, 3) array of triangles
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    p0 = vertices[faces[:, 0]]
+    return np.cross(vertices[faces[:, 1]] - p0, vertices[faces[:, 2]] - p0)
+
+def corner_weights(vertices, faces, weighting = 'area'):
+    """Returns the contribution of each corner of each triangle to the normal
+    of its vertex
+
+    :param vertices: (n, 3) array of vertices
+    :param faces: (m, 3) array of triangles
+    :param weighting: 'area' to weight the normal of a triangle by its area,
+    'angle' to weight it by the angle of the triangle at the vertex
+    :return: (m, 3, 3) array, the weighted normal of each corner
+    """
+    cross = triangle_cross(vertices, faces)
+
+    if weighting == 'area':
+        # the norm of the cross product is twice the area of the triangle
+        return np.repeat(cross[:, np.newaxis, :], 3, axis=1)
+    elif weighting == 'angle':
+        unit = normalize_rows(cross)
+        corners = np.asarray(vertices, dtype=np.float64)[faces]
+        # angle at each corner, between the edges towards the two other corners
+        a = np.roll(corners, -1, axis=1) - corners
+        b = np.roll(corners, -2, axis=1) - corners
+        angles = np.arctan2(np.linalg.norm(np.cross(a, b), axis=2), np.einsum('ijk,ijk->ij', a, b))
+        return unit[:, np.newaxis, :] * angles[:, :, np.newaxis]
+    raise ValueError("unknown weighting '{}', expected 'area' or 'angle'".format(weighting))
+
+def scatter_rows(indices, rows, size):
+    """Sums rows into an array, row i being added to row indices[i]
+
+    np.bincount is used per column, which is much faster than np.add.at.
+
+    :param indices: (n,) array of destination rows
+    :param rows: (n, k) array of rows to sum
+    :param size: number of rows of the result
+    """
+    return np.stack([np.bincount(indices, weights=rows[:, column], minlength=size)
+                     for column in range(rows.shape[1])], axis=1)
+
+def vertex_normals(vertices, faces, weighting = 'area'):
+    """Returns the unit normal of each vertex, the weighted average of the
+    normals of the triangles around it
+
+    :param vertices: (n, 3) array of vertices
+    :param faces: (m, 3) array of triangles
+    :param weighting: 'area' or 'angle', see corner_weights
+    """
+    weights = corner_weights(vertices, faces, weighting).reshape(-1, 3)
+    return normalize_rows(scatter_rows(faces.reshape(-1), weights, len(vertices)))
+
+def split_normals(vertices, faces, smoothing_angle, weighting = 'area', chunk_size = 1 << 22):
+    """Returns normals smoothed only across edges flatter than an angle
+
+    The normal of a corner is the weighted average of the normals of the
+    triangles around its vertex that make an angle of at most smoothing_angle
+    with its triangle, so sharp edges keep a distinct normal on each side.
+    Vertices at the same position are smoothed together, so texture seams,
+    where vertices are duplicated, do not show.
+
+    :param vertices: (n, 3) array of vertices
+    :param faces: (m, 3) array of triangles
+    :param smoothing_angle: maximum angle between two triangles, in degrees
+    :param weighting: 'area' or 'angle', see corner_weights
+    :param chunk_size: maximum number of pairs of corners compared at once
+    :return: (k, 3) float32 array of unit normals and (m, 3) int32 array of
+    the normal of each corner of each triangle
+    """
+    faces = np.asarray(faces)
+    weights = corner_weights(vertices, faces, weighting).reshape(-1, 3)
+    face_normals = normalize_rows(triangle_cross(vertices, faces))
+    corner_faces = np.repeat(np.arange(len(faces)), 3)
+    min_cos = np.cos(np.radians(smoothing_angle))
+
+    # corners grouped by vertex position
+    _, positions = np.unique(np.asarray(vertices), axis=0, return_inverse=True)
+    keys = positions.reshape(-1)[faces.reshape(-1)]
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    group_ends = np.r_[group_starts[1:], len(order)]
+    group_pairs = np.cumsum((group_ends - group_starts) ** 2)
+    sorted_groups = np.repeat(np.arange(len(group_starts)), group_ends - group_starts)
+
+    # every pair of corners of a group is compared, by chunks of whole groups
+    normals = np.zeros((len(order), 3))
+    sharp_groups = np.zeros(len(group_starts), dtype=bool)
+    first_group = 0
+    while first_group < len(group_starts):
+        done = group_pairs[first_group - 1] if first_group > 0 else 0
+        last_group = max(np.searchsorted(group_pairs, done + chunk_size, side='right'), first_group + 1)
+        starts = group_starts[first_group:last_group]
+        sizes = group_ends[first_group:last_group] - starts
+        first = starts[0]
+
+        # i runs over the corners of each group, as many times as the group has corners
+        counts = np.repeat(sizes, sizes)
+        i = np.repeat(np.arange(first, first + counts.size), counts)
+        j = np.repeat(np.repeat(starts, sizes), counts) + np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+        corner_i, corner_j = order[i], order[j]
+        dots = np.einsum('ij,ij->i', face_normals[corner_faces[corner_i]], face_normals[corner_faces[corner_j]])
+        smooth = (dots >= min_cos) | (i == j)
+        normals[first:first + counts.size] = scatter_rows(i[smooth] - first, weights[corner_j[smooth]], counts.size)
+        sharp_groups[sorted_groups[i[~smooth]]] = True
+        first_group = last_group
+    normals = normalize_rows(normals).astype(np.float32)
+
+    # the corners of a group without sharp edge all have the same normal,
+    # the identical normals of the other groups are merged
+    sharp = sharp_groups[sorted_groups]
+    smooth_normals = normals[group_starts[~sharp_groups]]
+    rows = np.ascontiguousarray(normals[sharp]).view(np.dtype((np.void, 12))).ravel()
+    _, sharp_normals, sharp_inverse = np.unique(rows, return_index=True, return_inverse=True)
+
+    sorted_indices = np.empty(len(order), dtype=np.int32)
+    sorted_indices[~sharp] = (np.cumsum(~sharp_groups) - 1)[sorted_groups[~sharp]]
+    sorted_indices[sharp] = len(smooth_normals) + sharp_inverse.reshape(-1)
+    indices = np.empty(len(order), dtype=np.int32)
+    indices[order] = sorted_indices
+    return np.concatenate([smooth_normals, normals[sharp][sharp_normals]]), indices.reshape(-1, 3)
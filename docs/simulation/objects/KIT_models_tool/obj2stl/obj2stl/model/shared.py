@@ -0,0 +1,70 @@
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+ARRAY_NAMES = (
+    'vertex_array', 'normal_array', 'tex_coord_array', 'color_array',
+    'face_array', 'face_tex_coord_array', 'face_normal_array',
+)
+"""Properties of a ModelParser holding its geometry
+"""
+
+def share_model(model):
+    """Moves the arrays of a model into shared memory blocks
+
+    The model is left without geometry, so it can be pickled cheaply to
+    another process, which gets the arrays back with attach_model. The blocks
+    stay allocated until attach_model or release_shared unlinks them, the
+    process receiving the descriptors must call one of them.
+
+    :param model: the ModelParser to share
+    :return: the list of (property, block name, shape, dtype) of the arrays
+    """
+    descriptors = []
+    for name in ARRAY_NAMES:
+        array = getattr(model, name)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        descriptors.append((name, block.name, array.shape, array.dtype.str))
+        block.close()
+        # the block belongs to the process calling attach_model, the tracker
+        # of this process must not remove it when it exits
+        resource_tracker.unregister(block._name, 'shared_memory')
+        setattr(model, name, array[:0])
+    return descriptors
+
+def attach_model(model, descriptors):
+    """Gives back to a model the arrays shared by share_model
+
+    The arrays are used in place, without copy. The blocks are unlinked right
+    away, their memory is released with the model.
+
+    :param model: the ModelParser that was shared
+    :param descriptors: the value returned by share_model
+    :return: the model
+    """
+    model._shared_blocks = []
+    for (index, (name, block_name, shape, dtype)) in enumerate(descriptors):
+        try:
+            block = shared_memory.SharedMemory(name=block_name)
+        except BaseException:
+            release_shared(descriptors[index + 1:])
+            raise
+        block.unlink()
+        model._shared_blocks.append(block)
+        setattr(model, name, np.ndarray(shape, np.dtype(dtype), buffer=block.buf))
+    return model
+
+def release_shared(descriptors):
+    """Unlinks the blocks shared by share_model without attaching them, for
+    the models that are not used
+
+    :param descriptors: the value returned by share_model
+    """
+    for (name, block_name, shape, dtype) in descriptors:
+        try:
+            block = shared_memory.SharedMemory(name=block_name)
+        except FileNotFoundError:
+            continue
+        block.close()
+        block.unlink()
@@ -0,0 +1,504 @@
+import numpy as np
+
+from .basemodel import ModelParser
+
+BOUNDARY_WEIGHT = 100.0
+"""Weight of the planes that keep the open borders of a mesh in place
+"""
+
+FLIP_THRESHOLD = 0.2
+"""Minimum cosine between the normals of a triangle before and after a
+collapse, under which the collapse is rejected
+"""
+
+def plane_quadrics(planes):
+    """Returns the quadrics measuring the squared distance to planes
+
+    :param planes: (n, 4) array of planes (a, b, c, d), with (a, b, c) unit
+    """
+    return planes[:, :, np.newaxis] * planes[:, np.newaxis, :]
+
+def quadric_error(quadrics, points):
+    """Evaluates quadrics at points
+
+    :param quadrics: (n, 4, 4) array of quadrics
+    :param points: (n, 3) array of points
+    """
+    homogeneous = np.hstack((points, np.ones((len(points), 1))))
+    return (np.matmul(quadrics, homogeneous[:, :, np.newaxis])[:, :, 0] * homogeneous).sum(axis=1)
+
+def _unit(vectors):
+    """Returns vectors divided by their norm, zero vectors staying zero
+    """
+    norms = np.linalg.norm(vectors, axis=1)
+    return vectors / np.where(norms > 0, norms, 1)[:, np.newaxis]
+
+class QuadricDecimator:
+    """Simplifies a triangle mesh by collapsing edges, following the quadric
+    error metric of Garland and Heckbert
+
+    Each vertex accumulates the squared distances to the planes of its
+    original triangles. Instead of collapsing edges one by one, each pass
+    collapses a batch of independent edges that are the cheapest around both
+    of their vertices, which keeps all the work in numpy.
+
+    Vertices where texture coordinates or materials change (texture seams)
+    only collapse along the seam and without moving, and the texture
+    coordinates of the moved vertices are interpolated, so that textures stay
+    in place.
+    """
+
+    ROUNDS = 16
+    """Number of selections of independent edges in each pass
+    """
+
+    def __init__(self, model):
+        """Prepares the decimation of a model
+
+        :param model: the ModelParser to simplify, it is not modified
+        """
+        self.model = model
+        self.vertices = model.vertex_array.astype(np.float64)
+        self.faces = model.face_array.astype(np.int64)
+        self.labels = np.repeat(np.arange(len(model.parts)), [part.face_count for part in model.parts])
+
+        self.tex_coords = model.tex_coord_array.astype(np.float64)
+        self.face_tex_coords = model.face_tex_coord_array.astype(np.int64)
+        if len(self.tex_coords) == 0:
+            self.face_tex_coords = np.full_like(self.faces, -1)
+
+        # Triangles repeated with the same vertices (double-sided surfaces)
+        # would make all their edges non-manifold, only the first one is kept
+        _, first = np.unique(np.sort(self.faces, axis=1), axis=0, return_index=True)
+        if len(first) < len(self.faces):
+            first = np.sort(first)
+            self.faces = self.faces[first]
+            self.face_tex_coords = self.face_tex_coords[first]
+            self.labels = self.labels[first]
+
+        self.locked = np.zeros(len(self.vertices), dtype=bool)
+        self.quadrics = self.initial_quadrics()
+
+    def initial_quadrics(self):
+        """Returns the quadric of each vertex: the planes of its triangles,
+        and the planes orthogonal to its border edges
+        """
+        vertices = self.vertices
+        faces = self.faces
+        quadrics = np.zeros((len(vertices), 16))
+
+        p0, p1, p2 = vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+        normals = _unit(np.cross(p1 - p0, p2 - p0))
+        planes = np.hstack((normals, -np.einsum('ij,ij->i', normals, p0)[:, np.newaxis]))
+        face_quadrics = plane_quadrics(planes).reshape(-1, 16)
+
+        corners = faces.ravel()
+        corner_faces = np.repeat(np.arange(len(faces)), 3)
+        for j in range(16):
+            quadrics[:, j] = np.bincount(corners, face_quadrics[corner_faces, j], minlength=len(vertices))
+
+        # Border edges are used by only one triangle
+        edges = self.edges()
+        border = edges.counts == 1
+        he = edges.first[border]
+        a, b = edges.lo[border], edges.hi[border]
+        direction = vertices[b] - vertices[a]
+        border_normals = _unit(np.cross(direction, normals[he // 3]))
+        border_planes = np.hstack((border_normals, -np.einsum('ij,ij->i', border_normals, vertices[a])[:, np.newaxis]))
+        border_quadrics = BOUNDARY_WEIGHT * plane_quadrics(border_planes).reshape(-1, 16)
+        for j in range(16):
+            quadrics[:, j] += np.bincount(a, border_quadrics[:, j], minlength=len(vertices))
+            quadrics[:, j] += np.bincount(b, border_quadrics[:, j], minlength=len(vertices))
+
+        return quadrics.reshape(-1, 4, 4)
+
+    def edges(self):
+        """Returns the edge table of the current triangles
+
+        Half-edge h goes from corner h to the next corner of triangle h // 3.
+        Each edge (lo, hi) with lo < hi gets the number of triangles using it,
+        and its first and second half-edges (both the same on borders).
+        """
+        faces = self.faces
+        count = len(self.vertices)
+        start = faces.ravel()
+        end = faces[:, [1, 2, 0]].ravel()
+        keys = np.minimum(start, end) * count + np.maximum(start, end)
+
+        unique_keys, edge_of, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        order = np.argsort(edge_of, kind='stable')
+        offsets = np.cumsum(counts) - counts
+
+        edges = _EdgeTable()
+        edges.lo = unique_keys // count
+        edges.hi = unique_keys % count
+        edges.counts = counts
+        edges.first = order[offsets]
+        edges.second = order[np.minimum(offsets + 1, len(order) - 1)]
+        edges.second[counts == 1] = edges.first[counts == 1]
+        return edges
+
+    def corner_of(self, halfedges, vertices):
+        """Returns the corners of the triangles of half-edges at given vertices
+
+        :param halfedges: array of half-edge indices
+        :param vertices: for each half-edge, one of its two vertices
+        """
+        corners = self.faces.ravel()
+        following = 3 * (halfedges // 3) + (halfedges % 3 + 1) % 3
+        return np.where(corners[halfedges] == vertices, halfedges, following)
+
+    def simplify(self, target_faces = None, max_error = None):
+        """Collapses edges until there are at most target_faces triangles,
+        or until every collapse would cost more than max_error
+
+        :param target_faces: number of triangles to reach, or None
+        :param max_error: maximum quadric error of a collapse (sum of squared
+        distances to the original planes), or None
+        """
+        if target_faces is None and max_error is None:
+            raise ValueError('target_faces or max_error should be given')
+
+        while target_faces is None or len(self.faces) > target_faces:
+            budget = len(self.faces) if target_faces is None else max(1, (len(self.faces) - target_faces + 1) // 2)
+            if self.collapse_pass(budget, max_error) == 0:
+                break
+
+        return self.build_model()
+
+    def collapse_pass(self, budget, max_error = None):
+        """Collapses a batch of independent edges
+
+        :param budget: maximum number of edges to collapse
+        :param max_error: maximum quadric error of a collapse, or None
+        :return: the number of collapsed edges
+        """
+        vertices = self.vertices
+        faces = self.faces
+        count = len(vertices)
+        edges = self.edges()
+
+        # Edges shared by more than two triangles are not manifold, their
+        # vertices are kept as they are
+        non_manifold = edges.counts > 2
+        self.locked[edges.lo[non_manifold]] = True
+        self.locked[edges.hi[non_manifold]] = True
+
+        border = np.zeros(count, dtype=bool)
+        border[edges.lo[edges.counts == 1]] = True
+        border[edges.hi[edges.counts == 1]] = True
+
+        # Attributes of each corner: texture coordinate and material, and the
+        # number of different attributes around each vertex
+        labels = np.repeat(self.labels, 3)
+        attributes = (self.face_tex_coords.ravel() + 1) * (self.labels.max(initial=0) + 1) + labels
+        pairs = np.unique(faces.ravel() * (attributes.max(initial=0) + 1) + attributes)
+        classes = np.bincount(pairs // (attributes.max(initial=0) + 1), minlength=count)
+
+        lo, hi = edges.lo, edges.hi
+        corners = {}
+        for (name, side) in (('lo', lo), ('hi', hi)):
+            corners[name] = (self.corner_of(edges.first, side), self.corner_of(edges.second, side))
+
+        def allowed(keep, remove, remove_corners):
+            splits = attributes[remove_corners[0]] != attributes[remove_corners[1]]
+            return (~self.locked[remove] & (edges.counts <= 2)
+                & ((classes[remove] == 1) | ((classes[remove] == 2) & splits & (edges.counts == 2)))
+                & ~(border[keep] & border[remove] & (edges.counts != 1)))
+
+        quadrics = self.quadrics[lo] + self.quadrics[hi]
+        keep_lo = allowed(lo, hi, corners['hi'])
+        keep_hi = allowed(hi, lo, corners['lo'])
+
+        # Half-edge collapses, the kept vertex does not move
+        cost_lo = np.where(keep_lo, quadric_error(quadrics, vertices[lo]), np.inf)
+        cost_hi = np.where(keep_hi, quadric_error(quadrics, vertices[hi]), np.inf)
+        keep = np.where(cost_lo <= cost_hi, lo, hi)
+        remove = np.where(cost_lo <= cost_hi, hi, lo)
+        cost = np.minimum(cost_lo, cost_hi)
+        position = vertices[keep]
+
+        # Edges away from seams can move to the point minimizing the error
+        free = keep_lo & keep_hi & (classes[lo] == 1) & (classes[hi] == 1)
+        free_position, free_cost = self.optimal_positions(quadrics[free], vertices[lo[free]], vertices[hi[free]])
+        better = free_cost < cost[free]
+        moved = np.flatnonzero(free)[better]
+        position[moved] = free_position[better]
+        cost[moved] = free_cost[better]
+        moving = np.zeros(len(lo), dtype=bool)
+        moving[moved] = True
+
+        candidates = np.isfinite(cost)
+        if max_error is not None:
+            candidates &= cost <= max_error
+        candidates = np.flatnonzero(candidates)
+        candidates = candidates[np.argsort(cost[candidates], kind='stable')]
+
+        # Several rounds of selection, each one only with the edges away from
+        # the triangles changed by the previous rounds
+        selected = []
+        blocked = np.zeros(count, dtype=bool)
+        for _ in range(self.ROUNDS):
+            candidates = candidates[~blocked[keep[candidates]] & ~blocked[remove[candidates]]]
+            (round_selected, candidates) = self.select(candidates, keep, remove, position, edges, budget)
+            if len(round_selected) == 0:
+                break
+            selected.append(round_selected)
+            budget -= len(round_selected)
+            if budget <= 0:
+                break
+
+            involved = np.zeros(count, dtype=bool)
+            involved[keep[round_selected]] = True
+            involved[remove[round_selected]] = True
+            blocked[faces[involved[faces].any(axis=1)]] = True
+
+        if len(selected) == 0:
+            return 0
+
+        selected = np.concatenate(selected)
+        self.collapse(selected, keep, remove, position, moving, corners, edges)
+        return len(selected)
+
+    def select(self, candidates, keep, remove, position, edges, budget):
+        """Selects independent and valid edges among candidates
+
+        The edges that are the cheapest around both of their vertices are
+        selected. When none of them can be collapsed, the selection is done
+        again without them.
+
+        :param candidates: edges that can be collapsed, by increasing cost
+        :param budget: maximum number of edges to select
+        :return: the selected edges, and the candidates that were not rejected
+        """
+        count = len(self.vertices)
+        while len(candidates) > 0:
+            rank = np.arange(len(candidates))
+            best = np.full(count, len(candidates))
+            np.minimum.at(best, keep[candidates], rank)
+            np.minimum.at(best, remove[candidates], rank)
+            matched = candidates[(best[keep[candidates]] == rank) & (best[remove[candidates]] == rank)]
+            matched = matched[:budget]
+
+            independent = self.independent(matched, keep, remove)
+            selected = self.valid(independent, keep, remove, position, edges)
+            rejected = np.setdiff1d(independent, selected)
+            candidates = candidates[~np.isin(candidates, np.concatenate((rejected, selected)))]
+            if len(selected) > 0:
+                return (selected, candidates)
+
+        return (candidates, candidates)
+
+    def optimal_positions(self, quadrics, a, b):
+        """Returns the points minimizing quadrics, and their errors
+
+        When the quadric cannot be inverted, the best of the two vertices and
+        the middle of the edge is used.
+
+        :param quadrics: (n, 4, 4) quadrics of the edges
+        :param a: (n, 3) first vertices of the edges
+        :param b: (n, 3) second vertices of the edges
+        """
+        middle = (a + b) / 2
+        candidates = [a, b, middle]
+
+        # Solves A x = -b with Cramer's rule, A being symmetric
+        rows = quadrics[:, :3, :3]
+        cofactors = np.cross(rows[:, [1, 2, 0]], rows[:, [2, 0, 1]])
+        determinant = np.einsum('ij,ij->i', rows[:, 0], cofactors[:, 0])
+        scale = np.abs(rows).sum(axis=(1, 2)) + 1e-300
+        invertible = np.abs(determinant) > 1e-9 * scale ** 3
+        optimum = middle.copy()
+        optimum[invertible] = -np.matmul(cofactors[invertible], quadrics[invertible, :3, 3:])[:, :, 0] \
+            / determinant[invertible, np.newaxis]
+
+        # Far away optima come from nearly flat regions, and are not wanted
+        length = np.linalg.norm(b - a, axis=1)
+        far = np.linalg.norm(optimum - middle, axis=1) > length
+        optimum[far] = middle[far]
+        candidates.append(optimum)
+
+        errors = np.stack([quadric_error(quadrics, point) for point in candidates], axis=1)
+        best = np.argmin(errors, axis=1)
+        positions = np.stack(candidates, axis=1)[np.arange(len(best)), best]
+        return positions, errors[np.arange(len(best)), best]
+
+    def independent(self, selected, keep, remove):
+        """Removes collapses so that every triangle is changed by at most one
+        collapse, the most expensive ones being dropped first
+
+        :param selected: edges to collapse, by increasing cost
+        """
+        while len(selected) > 0:
+            collapse = np.full(len(self.vertices), -1)
+            collapse[keep[selected]] = np.arange(len(selected))
+            collapse[remove[selected]] = np.arange(len(selected))
+
+            ids = np.sort(collapse[self.faces], axis=1)
+            conflicts = ((ids[:, 0] >= 0) & (ids[:, 0] != ids[:, 1])) | ((ids[:, 1] >= 0) & (ids[:, 1] != ids[:, 2]))
+            if not conflicts.any():
+                break
+
+            dropped = np.zeros(len(selected), dtype=bool)
+            dropped[ids[conflicts, 2]] = True
+            selected = selected[~dropped]
+
+        return selected
+
+    def valid(self, selected, keep, remove, position, edges):
+        """Removes the collapses that would make the mesh non-manifold, or flip
+        triangles
+
+        :param selected: independent edges to collapse
+        """
+        if len(selected) == 0:
+            return selected
+
+        count = len(self.vertices)
+        collapse = np.full(count, -1)
+        collapse[keep[selected]] = np.arange(len(selected))
+        collapse[remove[selected]] = np.arange(len(selected))
+
+        # Link condition: the two vertices only share the neighbours of the
+        # triangles of their edge
+        u = np.concatenate((edges.lo, edges.hi))
+        v = np.concatenate((edges.hi, edges.lo))
+        mask = (collapse[u] >= 0) & (collapse[v] != collapse[u])
+        keys, counts = np.unique(collapse[u[mask]] * count + v[mask], return_counts=True)
+        common = np.bincount(keys[counts == 2] // count, minlength=len(selected))
+        valid = common == edges.counts[selected]
+
+        # Triangles that keep their three vertices must not flip
+        moved = self.vertices.copy()
+        moved[keep[selected]] = position[selected]
+        remap = np.arange(count)
+        remap[remove[selected]] = keep[selected]
+
+        faces = self.faces
+        ids = collapse[faces].max(axis=1)
+        changed = ids >= 0
+        before = faces[changed]
+        after = remap[before]
+        kept = (after[:, 0] != after[:, 1]) & (after[:, 1] != after[:, 2]) & (after[:, 2] != after[:, 0])
+
+        def normals(points, triangles):
+            p0, p1, p2 = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+            return _unit(np.cross(p1 - p0, p2 - p0))
+
+        old_normals = normals(self.vertices, before[kept])
+        cosines = np.einsum('ij,ij->i', old_normals, normals(moved, after[kept]))
+        # Degenerate triangles have no normal to compare to
+        flipped = ids[changed][kept][(cosines < FLIP_THRESHOLD) & old_normals.any(axis=1)]
+        valid[flipped] = False
+
+        return selected[valid]
+
+    def collapse(self, selected, keep, remove, position, moving, corners, edges):
+        """Collapses independent and valid edges
+
+        The removed vertex is merged into the kept vertex, and the texture
+        coordinates of the corners of the removed vertex are replaced by the
+        ones of the kept vertex, on the same side of the seams.
+        """
+        count = len(self.vertices)
+        kept, removed = keep[selected], remove[selected]
+        corner_vertices = self.faces.ravel()
+        tex_coords = self.face_tex_coords.ravel().copy()
+
+        if len(self.tex_coords) > 0:
+            # The corners of the edge, for the kept and removed vertices
+            keep_is_lo = kept == edges.lo[selected]
+            first_kept = np.where(keep_is_lo, corners['lo'][0][selected], corners['hi'][0][selected])
+            second_kept = np.where(keep_is_lo, corners['lo'][1][selected], corners['hi'][1][selected])
+            first_removed = np.where(keep_is_lo, corners['hi'][0][selected], corners['lo'][0][selected])
+            second_removed = np.where(keep_is_lo, corners['hi'][1][selected], corners['lo'][1][selected])
+
+            collapse = np.full(count, -1)
+            collapse[removed] = np.arange(len(selected))
+            at_removed = np.flatnonzero(collapse[corner_vertices] >= 0)
+            ids = collapse[corner_vertices[at_removed]]
+            old = tex_coords[at_removed]
+            tex_coords[at_removed] = np.where(old == tex_coords[first_removed[ids]],
+                                              tex_coords[first_kept[ids]], tex_coords[second_kept[ids]])
+
+            # Moved vertices get texture coordinates interpolated along the edge
+            move = moving[selected] & (tex_coords[first_kept] >= 0) & (self.face_tex_coords.ravel()[first_removed] >= 0)
+            if move.any():
+                a = self.vertices[kept[move]]
+                b = self.vertices[removed[move]]
+                direction = b - a
+                t = np.einsum('ij,ij->i', position[selected[move]] - a, direction)
+                t = np.clip(t / np.maximum(np.einsum('ij,ij->i', direction, direction), 1e-300), 0, 1)
+                uv_a = self.tex_coords[tex_coords[first_kept[move]]]
+                uv_b = self.tex_coords[self.face_tex_coords.ravel()[first_removed[move]]]
+
+                new_indices = np.full(count, -1)
+                new_indices[kept[move]] = len(self.tex_coords) + np.arange(move.sum())
+                self.tex_coords = np.vstack((self.tex_coords, uv_a + t[:, np.newaxis] * (uv_b - uv_a)))
+
+                # After the merge, the corners of the removed vertex are at the kept one
+                merged = corner_vertices.copy()
+                merged[at_removed] = kept[ids]
+                at_moved = new_indices[merged] >= 0
+                tex_coords[at_moved] = new_indices[merged[at_moved]]
+
+        self.vertices[kept] = position[selected]
+        self.quadrics[kept] += self.quadrics[removed]
+        self.locked[kept] |= self.locked[removed]
+
+        remap = np.arange(count)
+        remap[removed] = kept
+        faces = remap[self.faces]
+        alive = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])
+
+        self.faces = faces[alive]
+        self.face_tex_coords = tex_coords.reshape(-1, 3)[alive]
+        self.labels = self.labels[alive]
+
+    def build_model(self):
+        """Returns a new model with the simplified triangles, their materials
+        and only the vertices and texture coordinates they use
+        """
+        model = ModelParser()
+        model.path = self.model.path
+        model.materials = list(self.model.materials)
+
+        used, faces = np.unique(self.faces, return_inverse=True)
+        model.vertex_array = self.vertices[used]
+
+        tex_coords = None
+        if len(self.tex_coords) > 0:
+            used_tex, inverse = np.unique(self.face_tex_coords, return_inverse=True)
+            inverse = inverse.reshape(-1, 3)
+            if len(used_tex) > 0 and used_tex[0] < 0:
+                # -1 stays -1 for the corners without texture coordinates
+                used_tex = used_tex[1:]
+                inverse = inverse - 1
+            model.tex_coord_array = self.tex_coords[used_tex]
+            tex_coords = inverse
+
+        faces = faces.reshape(-1, 3)
+        boundaries = np.flatnonzero(np.diff(self.labels)) + 1
+        for (start, end) in zip([0] + boundaries.tolist(), boundaries.tolist() + [len(faces)]):
+            if start == end:
+                continue
+            material = self.model.parts[self.labels[start]].material
+            model.add_faces(faces[start:end], None if tex_coords is None else tex_coords[start:end],
+                            None, material)
+
+        return model
+
+class _EdgeTable:
+    """Edges of a triangle mesh, see QuadricDecimator.edges
+    """
+    pass
+
+def decimate(model, target_faces = None, max_error = None):
+    """Returns a simplified copy of a model
+
+    :param model: the model to simplify
+    :param target_faces: number of triangles to reach, or None
+    :param max_error: maximum quadric error of a collapse (sum of squared
+    distances to the original planes), or None
+    """
+    return QuadricDecimator(model).simplify(target_faces, max_error)
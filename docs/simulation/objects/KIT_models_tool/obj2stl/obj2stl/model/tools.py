@@ -4,6 +4,7 @@ from importlib import import_module
 from . import formats
 from .formats import *
 from .basemodel import ModelParser, Exporter
+from .cache import read_cache, write_cache
 
 from types import ModuleType
 
@@ -54,11 +55,17 @@ for name in formats.__dict__:
         type = ModelType(name, formats.__dict__[name])
         supported_formats.append(type)
 
-def load_model(path, up_conversion = None):
+def load_model(path, up_conversion = None, cache = True, **kwargs):
     """Loads a model from a path
 
+    The model is read from its binary cache (path + '.o2scache') when the
+    cache is newer than the file, and the cache is written after the file is
+    parsed, see the cache module.
+
     :param path: path to the file to load
     :param up_conversion: conversion of up vectors
+    :param cache: False to always parse the file, without cache
+    :param kwargs: options of the parser, like weld for .stl
     """
     parser = None
     type = find_type(path, supported_formats)
@@ -66,16 +73,27 @@ def load_model(path, up_conversion = None):
     if type is None:
         raise Exception("File format not supported \"" + str(type) + "\"")
 
-    parser = type.create_parser(up_conversion)
+    parser = type.create_parser(up_conversion, **kwargs)
+    if cache and read_cache(parser, path, kwargs):
+        return parser
+
     parser.parse_file(path)
 
+    if cache:
+        try:
+            write_cache(parser, options = kwargs)
+        except OSError:
+            # read-only folder, the model is parsed again next time
+            pass
+
     return parser
 
-def export_model(model, path):
+def export_model(model, path, **kwargs):
     """Exports a model to a path
 
     :param model: model to export
     :param path: path to save the model
+    :param kwargs: options of the exporter, like binary for .stl
     """
     exporter = None
     type = find_type(path, supported_formats)
@@ -83,17 +101,30 @@ def export_model(model, path):
     if type is None:
         raise Exception('File format is not supported')
 
-    exporter = type.create_exporter(model)
+    exporter = type.create_exporter(model, **kwargs)
     return exporter
 
-def convert(input, output, up_conversion = None):
-    """Converts a model
+def convert(input, output, up_conversion = None, binary = False, fileobj = None):
+    """Converts a model and writes it chunk by chunk
 
     :param input: path of the input model
     :param output: path to the output
     :param up_conversion: convert the up vector
+    :param binary: export to a binary format (only for .stl)
+    :param fileobj: file object to write to instead of output, whose extension
+    then only gives the format
+    :raises ValueError: if binary is set and the output is not a .stl file
     """
-    model = load_model(input, up_conversion)
-    exporter = export_model(model, output)
-    return str(exporter)
+    if binary and not formats.stl.is_stl(output):
+        raise ValueError('Binary export is only supported for .stl files, not ' + output)
 
+    model = load_model(input, up_conversion)
+    if binary:
+        exporter = export_model(model, output, binary=True)
+    else:
+        exporter = export_model(model, output)
+
+    if fileobj is None:
+        exporter.export_to_path(output)
+    else:
+        exporter.write(fileobj)
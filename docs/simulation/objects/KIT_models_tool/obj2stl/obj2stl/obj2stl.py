@@ -2,6 +2,7 @@
 
 import argparse
 import os
+import sys
 
 import obj2stl.model.tools as mt
 import functools as fc
@@ -28,13 +29,12 @@ def convert(**args):
 
     output1 = args['output'] if args['output'] is not None else '.' + args['type']
 
-    result = mt.convert(args['input'], output1, up_conversion)
-
+    binary = args.get('binary', False)
+    fileobj = None
     if args['output'] is None:
-        print(result)
-    else:
-        with open(args['output'], 'w') as f:
-            f.write(result)
+        fileobj = sys.stdout.buffer if binary else sys.stdout
+
+    mt.convert(args['input'], output1, up_conversion, binary, fileobj)
 
 # if __name__ == '__main__':
 #     parser = argparse.ArgumentParser()
@@ -51,6 +51,8 @@ def convert(**args):
 #                         help="Initial up vector")
 #     parser.add_argument('-tu', '--to-up', metavar='fup', default=None,
 #                         help="Output up vector")
+#     parser.add_argument('-b', '--binary', action='store_true',
+#                         help="Export binary instead of ASCII (only for .stl)")
 #     args = parser.parse_args()
 #     print(ar)
 #     args.func(args)
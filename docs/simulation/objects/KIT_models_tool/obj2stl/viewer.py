@@ -5,6 +5,7 @@ import ctypes
 import argparse
 import os
 import math
+from concurrent.futures import ProcessPoolExecutor, wait
 
 # Test dependencies
 missing_dependencies = []
@@ -42,6 +43,7 @@ from obj2stl.controls import TrackBallControls, OrbitControls
 from obj2stl.camera import Camera
 from obj2stl.shader import Shader
 from obj2stl.model.basemodel import BoundingBox
+from obj2stl.model.shared import share_model, attach_model, release_shared
 
 WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 1024
@@ -59,6 +61,31 @@ def resize(width, height):
     else:
         gl.glViewport(offset, 0, length, length)
 
+def prepare_model(path, up_conversion, normal_weighting, smoothing_angle):
+    """Loads a model and computes its normals if it has none
+
+    Runs in a worker process: the arrays of the model are returned through
+    shared memory, to be given back with attach_model.
+    """
+    model = load_model(path, up_conversion)
+
+    # Compute normals if not already computed
+    if len(model.normals) == 0:
+        model.generate_vertex_normals(normal_weighting, smoothing_angle)
+
+    return model, share_model(model)
+
+def release_models(futures):
+    """Stops the loading of the models that are not attached yet and releases
+    the shared memory of the ones that are loaded
+    """
+    for future in futures:
+        future.cancel()
+    wait(futures)
+    for future in futures:
+        if not future.cancelled() and future.exception() is None:
+            release_shared(future.result()[1])
+
 def main(args):
 
     if (args.from_up is None) != (args.to_up is None):
@@ -75,27 +102,17 @@ def main(args):
         def log(*args, **kwargs):
             pass
 
-    # Load and parse the model
-    sys.stderr.flush()
-    models = []
+    # Load, parse and compute the normals of the models in worker processes,
+    # the window opens right away and the models appear as they get ready
+    executor = ProcessPoolExecutor(max_workers=args.workers)
+    futures = {}
     for path in args.input:
-        log('Loading model ' + path + '...', file=sys.stderr, end='')
-        model = load_model(path, up_conversion)
-
-        # Compute normals if not already computed
-        if len(model.normals) == 0:
-            log(' done! (' + str(sum(map(lambda x: len(x.faces), model.parts))) + ' faces)\nComputing normals...', file=sys.stderr, end='')
-            sys.stderr.flush()
-            model.generate_vertex_normals()
-
-        # Generate vbos for smooth rendering
-        log(' done!\nGenerating vbos...', file=sys.stderr, end='')
-        sys.stderr.flush()
-        model.generate_vbos()
+        log('Loading model ' + path + '...', file=sys.stderr)
+        future = executor.submit(prepare_model, path, up_conversion, args.normal_weighting, args.smoothing_angle)
+        futures[future] = path
+    executor.shutdown(wait=False)
 
-        models.append(model)
-
-    log(' done!\nInitialiazing OpenGL Context', file=sys.stderr, end='')
+    log('Initialiazing OpenGL Context', file=sys.stderr, end='')
     sys.stderr.flush()
 
     camera = Camera(Vector(0,0,5), Vector(0,0,0))
@@ -121,46 +138,48 @@ def main(args):
 
     running = True
 
+    models = []
     bounding_box = BoundingBox()
 
-    if CENTER_AND_SCALE:
-        for model in models:
-            for vertex in model.vertices:
-                bounding_box.add(vertex)
-
-    log(' done!\nComputing bounding box...', file=sys.stderr, end='')
-
-
-    log(' done!\nInitializing OpenGL textures...', file=sys.stderr, end='')
-    sys.stderr.flush()
-
-    # Initializes OpenGL textures
-    for model in models:
-        model.init_textures()
-
     shader = Shader()
 
     log(' done!\nReady!', file=sys.stderr)
     sys.stderr.flush()
 
     while running:
+        # Upload the models that are ready, OpenGL stays on this thread
+        for future in [future for future in futures if future.done()]:
+            path = futures.pop(future)
+            try:
+                model = attach_model(*future.result())
+            except Exception as e:
+                print('Loading failed for ' + path + ': ' + type(e).__name__ + ': ' + str(e), file=sys.stderr)
+                continue
+
+            model.generate_vbos(args.indexed)
+            model.init_textures()
+            bounding_box.add_array(model.vertex_array)
+            models.append(model)
+            log('Loaded model ' + path + ' (' + str(model.face_count) + ' faces)', file=sys.stderr)
+
         for event in pg.event.get():
 
             controls.apply_event(event)
 
             if event.type == pg.QUIT:
-                pg.quit()
-                quit()
+                running = False
             elif event.type == pg.KEYUP:
                 if event.key == pg.K_ESCAPE:
-                    pg.quit()
-                    quit()
+                    running = False
             elif event.type == pg.MOUSEBUTTONDOWN:
                 if event.button == 1:
                     pg.mouse.get_rel()
             elif event.type == pg.VIDEORESIZE:
                 resize(event.size[0], event.size[1])
 
+        if not running:
+            break
+
         # Update physics
         controls.update()
 
@@ -187,7 +206,7 @@ def main(args):
 
         shader.bind()
 
-        if CENTER_AND_SCALE:
+        if CENTER_AND_SCALE and len(models) > 0:
             center = bounding_box.get_center()
             scale = bounding_box.get_scale() / 2
             gl.glPushMatrix()
@@ -198,7 +217,7 @@ def main(args):
         for model in models:
             model.draw()
 
-        if CENTER_AND_SCALE:
+        if CENTER_AND_SCALE and len(models) > 0:
             gl.glPopMatrix()
 
         shader.unbind()
@@ -210,6 +229,9 @@ def main(args):
         # Sleep
         pg.time.wait(10)
 
+    release_models(futures)
+    pg.quit()
+
 
 if __name__ == '__main__':
 
@@ -223,6 +245,14 @@ if __name__ == '__main__':
                         help="Output up vector")
     parser.add_argument('-V', '--verbose', default=False, action='store_true',
                         help="Verbose output")
+    parser.add_argument('--smoothing-angle', type=float, default=None,
+                        help="Keep sharp the edges between faces making a larger angle (degrees)")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Number of processes loading the models (defaults to the number of CPUs)")
+    parser.add_argument('--indexed', default=False, action='store_true',
+                        help="Store shared vertices once and draw with element buffers")
+    parser.add_argument('--normal-weighting', choices=['area', 'angle'], default='area',
+                        help="Weighting of the faces in the vertex normals")
 
     args = parser.parse_args()
     args.func(args)
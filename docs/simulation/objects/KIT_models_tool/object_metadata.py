@@ -0,0 +1,91 @@
+import os
+import collections
+import numpy as np
+
+
+"""
+Metadata of the objects, from the database_real sheet of object_categories_db.xlsx.
+The workbook is only parsed when it changed: the numeric columns are cached in
+a .npz file next to it, which is rebuilt when the size or the mtime of the
+workbook differ from the ones it was built from.
+Masses are converted to kg (the sheet gives them with their unit, e.g. "250 g"),
+longitudes stay in mm, and missing longitudes are 0.
+"""
+
+# Define folders & paths
+default_excel_path = "object_categories_db.xlsx"
+sheet_name = "database_real"
+
+ObjectInfo = collections.namedtuple("ObjectInfo", ["id", "mass", "longitude1", "longitude2", "longitude3"])
+
+def default_cache_path(excel_path):
+    """Returns the path of the cache of a workbook: object_categories_db_cache.npz next to it."""
+    return os.path.splitext(excel_path)[0] + "_cache.npz"
+
+def read_excel(excel_path=default_excel_path):
+    """Reads the database_real sheet of the workbook, and returns its ids,
+    masses (kg) and longitudes (mm) as numpy arrays.
+    """
+    # pandas and openpyxl are only needed when the cache is rebuilt
+    import pandas as pd
+
+    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine="openpyxl")
+    if "ID" in df.columns:
+        ids = pd.to_numeric(df["ID"], errors="coerce").fillna(-1).astype(np.int64).to_numpy()
+    else:
+        # rows are in the order of the ids, starting at 1
+        ids = np.arange(1, len(df) + 1)
+
+    # "250 g", "1.2kg", 250 ... to kg
+    mass_text = df["mass"].astype(str).str.strip().str.lower()
+    number_unit = mass_text.str.extract(r"^([-+]?[0-9]*\.?[0-9]+)\s*([a-z]*)")
+    mass = pd.to_numeric(number_unit[0], errors="coerce").to_numpy(dtype=np.float64)
+    mass = np.where(number_unit[1].to_numpy() == "kg", mass, mass / 1000)
+
+    longitudes = np.stack([pd.to_numeric(df[column], errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+                           for column in ("longitude1", "longitude2", "longitude3")], axis=1)
+    return ids, mass, longitudes
+
+class ObjectMetadata:
+    """Metadata of the objects, indexed by id (e.g. 13 or "0013").
+
+    The workbook is read at most once, and not at all when the cache is up to date.
+    """
+
+    def __init__(self, excel_path=default_excel_path, cache_path=None):
+        self.excel_path = excel_path
+        self.cache_path = cache_path or default_cache_path(excel_path)
+        self.ids, self.mass, self.longitudes = self.load()
+        self.rows = {int(id): row for (row, id) in enumerate(self.ids)}
+
+    def load(self):
+        """Returns the arrays of the cache if the workbook did not change,
+        otherwise reads the workbook and updates the cache.
+        """
+        stat = os.stat(self.excel_path)
+        if os.path.exists(self.cache_path):
+            with np.load(self.cache_path) as cache:
+                if int(cache["size"]) == stat.st_size and int(cache["mtime_ns"]) == stat.st_mtime_ns:
+                    return cache["ids"], cache["mass"], cache["longitudes"]
+
+        ids, mass, longitudes = read_excel(self.excel_path)
+
+        # written atomically, several generators can share the cache
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, ids=ids, mass=mass, longitudes=longitudes,
+                     size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        os.replace(tmp_path, self.cache_path)
+        return ids, mass, longitudes
+
+    def __contains__(self, id):
+        return int(id) in self.rows
+
+    def __getitem__(self, id):
+        """Returns the ObjectInfo of an object, mass in kg and longitudes in mm."""
+        row = self.rows[int(id)]
+        return ObjectInfo(int(self.ids[row]), float(self.mass[row]), *map(float, self.longitudes[row]))
+
+    def get(self, id, default=None):
+        """Returns the ObjectInfo of an object, or default if it is not in the workbook."""
+        return self[id] if id in self else default
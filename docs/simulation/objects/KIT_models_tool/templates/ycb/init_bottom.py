@@ -1,4 +0,0 @@
-)
-from .primitive import *
-from .composite import *
-from .composite_body import *
@@ -1,3 +0,0 @@
-from .objects import MujocoObject, MujocoXMLObject, MujocoGeneratedObject
-from .generated_objects import CompositeBodyObject, CompositeObject, PrimitiveObject
-
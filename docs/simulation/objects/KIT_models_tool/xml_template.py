@@ -0,0 +1,66 @@
+import re
+import xml.etree.ElementTree as ET
+
+
+"""
+Templates of the Mujoco XML files (templates/ycb/*.xml).
+A template is parsed once into a list of literal texts and slots, and each
+object is rendered in a single pass, so slots whose names start the same
+($COM, $COLLISION_MESHES ...) cannot replace each other.
+A slot is $ followed by upper case letters, digits and underscores, an
+underscore being part of the name only if an upper case letter or a digit
+follows it: $MODEL_SHORT_mesh is the slot MODEL_SHORT followed by "_mesh".
+"""
+
+slot_pattern = re.compile(r"\$([A-Z][A-Z0-9]*(?:_[A-Z0-9]+)*)")
+
+class XMLTemplate:
+    """Template compiled into literal texts and slot names."""
+
+    def __init__(self, text, name="<template>"):
+        self.name = name
+        parts = slot_pattern.split(text)
+        # literal texts at even positions, slot names at odd positions
+        self.literals = parts[0::2]
+        self.slots = parts[1::2]
+        self.slot_names = frozenset(self.slots)
+
+        for literal in self.literals:
+            if "$" in literal:
+                raise ValueError("{}: invalid slot near {!r}".format(name, literal[literal.index("$"):][:20]))
+        # The template has to be well-formed XML, whatever the values of the slots
+        try:
+            ET.fromstring("".join(self.literals))
+        except ET.ParseError as e:
+            raise ValueError("{}: {}".format(name, e))
+
+    @classmethod
+    def from_file(cls, path):
+        """Compiles the template of a file."""
+        with open(path, "r") as f:
+            return cls(f.read(), path)
+
+    def render(self, values):
+        """Returns the text of the template with the value of each slot.
+
+        values maps slot names (without $) to values, which are converted
+        with str. Values of slots missing from the template are ignored.
+        """
+        missing = self.slot_names.difference(values)
+        if missing:
+            raise KeyError("{}: no value for {}".format(self.name, ", ".join("$" + name for name in sorted(missing))))
+
+        texts = [str(values[name]) for name in self.slots]
+        for (name, text) in zip(self.slots, texts):
+            if "$" in text:
+                raise ValueError("{}: the value of ${} contains $: {!r}".format(self.name, name, text))
+
+        parts = [None] * (len(self.literals) + len(texts))
+        parts[0::2] = self.literals
+        parts[1::2] = texts
+        return "".join(parts)
+
+    def render_many(self, objects):
+        """Renders the template for each dictionary of values of objects, lazily."""
+        for values in objects:
+            yield self.render(values)